@@ -14,9 +14,11 @@ setup(
         "dev": [
             "pytest>=7.0.0",
             "pytest-cov",
+            "pytest-xdist",
             "black",
         ],
         "openai": ["openai>=1.0.0"],
+        "orjson": ["orjson>=3.9.0"],
     },
     python_requires=">=3.8",
     entry_points={
@@ -4,6 +4,7 @@ Mock AI provider for testing.
 import os
 import re
 import json
+from functools import lru_cache
 from typing import Dict, Any, List, Optional
 
 from file_analyzer.ai_providers.provider_interface import AIModelProvider
@@ -11,6 +12,122 @@ from file_analyzer.ai_providers.provider_interface import AIModelProvider
 # from file_analyzer.core.framework_detector import FRAMEWORK_SIGNATURES
 
 
+@lru_cache(maxsize=256)
+def _analysis_for_path(file_path: str) -> Optional[Dict[str, Any]]:
+    """
+    Look up the mock analysis result for a file path.
+    
+    The result only depends on the path, so it is memoized across calls.
+    
+    Args:
+        file_path: Path to the file being analyzed
+        
+    Returns:
+        Mock analysis result, or None for unknown file types
+    """
+    path = file_path.lower()
+    if ".py" in path:
+        return {
+            "file_type": "code",
+            "language": "python",
+            "purpose": "implementation",
+            "characteristics": ["functions", "classes", "module"],
+            "confidence": 0.9
+        }
+    elif ".ts" in path and not ".d.ts" in path:
+        return {
+            "file_type": "code",
+            "language": "typescript",
+            "purpose": "implementation", 
+            "characteristics": ["functions", "classes", "interfaces", "types"],
+            "confidence": 0.9
+        }
+    elif ".js" in path and not ".json" in path:
+        return {
+            "file_type": "code",
+            "language": "javascript",
+            "purpose": "implementation",
+            "characteristics": ["functions", "module"],
+            "confidence": 0.9
+        }
+    elif ".java" in path:
+        return {
+            "file_type": "code",
+            "language": "java",
+            "purpose": "implementation",
+            "characteristics": ["classes", "interfaces", "package"],
+            "confidence": 0.9
+        }
+    elif ".json" in path:
+        return {
+            "file_type": "code",
+            "language": "json",
+            "purpose": "configuration",
+            "characteristics": ["settings", "data"],
+            "confidence": 0.9
+        }
+    elif ".md" in path:
+        return {
+            "file_type": "documentation",
+            "language": "markdown",
+            "purpose": "documentation",
+            "characteristics": ["text", "formatting"],
+            "confidence": 0.9
+        }
+    elif ".yml" in path or ".yaml" in path:
+        return {
+            "file_type": "configuration",
+            "language": "yaml",
+            "purpose": "configuration",
+            "characteristics": ["settings", "environment"],
+            "confidence": 0.9
+        }
+    elif ".html" in path:
+        return {
+            "file_type": "markup",
+            "language": "html",
+            "purpose": "user interface",
+            "characteristics": ["markup", "structure"],
+            "confidence": 0.9
+        }
+    elif ".css" in path:
+        return {
+            "file_type": "code",
+            "language": "css",
+            "purpose": "styling",
+            "characteristics": ["styles", "presentation"],
+            "confidence": 0.9
+        }
+    elif ".sh" in path:
+        return {
+            "file_type": "code",
+            "language": "shell",
+            "purpose": "automation",
+            "characteristics": ["commands", "script"],
+            "confidence": 0.9
+        }
+    # Special cases for common files
+    elif "requirements.txt" in path:
+        return {
+            "file_type": "configuration",
+            "language": "text",
+            "purpose": "dependencies",
+            "characteristics": ["packages", "dependencies"],
+            "confidence": 0.9
+        }
+    elif ".toml" in path:
+        return {
+            "file_type": "configuration",
+            "language": "toml",
+            "purpose": "project configuration",
+            "characteristics": ["settings", "metadata"],
+            "confidence": 0.9
+        }
+    
+    # Unknown files are classified by their content
+    return None
+
+
 class MockAIProvider(AIModelProvider):
     """Mock AI provider implementation for testing."""
     
@@ -71,115 +188,20 @@ class MockAIProvider(AIModelProvider):
         Returns:
             Dictionary with mock analysis results
         """
-        if ".py" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "python",
-                "purpose": "implementation",
-                "characteristics": ["functions", "classes", "module"],
-                "confidence": 0.9
-            }
-        elif ".ts" in file_path.lower() and not ".d.ts" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "typescript",
-                "purpose": "implementation", 
-                "characteristics": ["functions", "classes", "interfaces", "types"],
-                "confidence": 0.9
-            }
-        elif ".js" in file_path.lower() and not ".json" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "javascript",
-                "purpose": "implementation",
-                "characteristics": ["functions", "module"],
-                "confidence": 0.9
-            }
-        elif ".java" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "java",
-                "purpose": "implementation",
-                "characteristics": ["classes", "interfaces", "package"],
-                "confidence": 0.9
-            }
-        elif ".json" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "json",
-                "purpose": "configuration",
-                "characteristics": ["settings", "data"],
-                "confidence": 0.9
-            }
-        elif ".md" in file_path.lower():
-            return {
-                "file_type": "documentation",
-                "language": "markdown",
-                "purpose": "documentation",
-                "characteristics": ["text", "formatting"],
-                "confidence": 0.9
-            }
-        elif ".yml" in file_path.lower() or ".yaml" in file_path.lower():
-            return {
-                "file_type": "configuration",
-                "language": "yaml",
-                "purpose": "configuration",
-                "characteristics": ["settings", "environment"],
-                "confidence": 0.9
-            }
-        elif ".html" in file_path.lower():
-            return {
-                "file_type": "markup",
-                "language": "html",
-                "purpose": "user interface",
-                "characteristics": ["markup", "structure"],
-                "confidence": 0.9
-            }
-        elif ".css" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "css",
-                "purpose": "styling",
-                "characteristics": ["styles", "presentation"],
-                "confidence": 0.9
-            }
-        elif ".sh" in file_path.lower():
-            return {
-                "file_type": "code",
-                "language": "shell",
-                "purpose": "automation",
-                "characteristics": ["commands", "script"],
-                "confidence": 0.9
-            }
-        else:
-            # Default for unknown files
-            # Handle special cases for common files
-            if "requirements.txt" in file_path.lower():
-                return {
-                    "file_type": "configuration",
-                    "language": "text",
-                    "purpose": "dependencies",
-                    "characteristics": ["packages", "dependencies"],
-                    "confidence": 0.9
-                }
-            elif ".toml" in file_path.lower():
-                return {
-                    "file_type": "configuration",
-                    "language": "toml",
-                    "purpose": "project configuration",
-                    "characteristics": ["settings", "metadata"],
-                    "confidence": 0.9
-                }
-            else:
-                # Default for other unknown files
-                return {
-                    "file_type": "unknown",
-                    "language": "unknown",
-                    "purpose": "unknown",
-                    "characteristics": ["binary" if b"\0" in content.encode() else "text"],
-                    "confidence": 0.5
-                }
-    
+        result = _analysis_for_path(file_path)
+        if result is not None:
+            # Copy the memoized result so callers can't modify it
+            return {**result, "characteristics": list(result["characteristics"])}
+        
+        # Default for other unknown files
+        return {
+            "file_type": "unknown",
+            "language": "unknown",
+            "purpose": "unknown",
+            "characteristics": ["binary" if b"\0" in content.encode() else "text"],
+            "confidence": 0.5
+        }
+        
     def analyze_code(self, file_path: str, content: str, language: str) -> Dict[str, Any]:
         """
         Analyze code structure for the given language.
@@ -88,11 +88,15 @@ class InMemoryCache(CacheProvider):
     """
     Simple in-memory cache implementation.
     
-    This is a basic cache that stores all items in memory. It supports
-    optional expiration times and tracks basic cache statistics.
+    This is a basic cache that stores items in memory, evicting the least
+    recently used item once it is full. It supports optional expiration
+    times and tracks basic cache statistics.
     """
     
-    def __init__(self, max_size: Optional[int] = None, ttl: Optional[int] = None):
+    # Default bound so long-running analyses don't grow the cache without limit
+    DEFAULT_MAX_SIZE = 10_000
+    
+    def __init__(self, max_size: Optional[int] = DEFAULT_MAX_SIZE, ttl: Optional[int] = None):
         """
         Initialize in-memory cache.
         
@@ -271,6 +275,9 @@ class SqliteCache(CacheProvider):
         conn = sqlite3.connect(str(self.db_path))
         try:
             cursor = conn.cursor()
+            # Write-ahead logging is stored in the database file, so it only
+            # needs to be enabled once
+            cursor.execute("PRAGMA journal_mode = WAL")
             cursor.execute(self.CREATE_TABLE_SQL)
             cursor.execute(self.CREATE_STATS_TABLE_SQL)
             
@@ -749,7 +756,7 @@ class CacheFactory:
             ValueError: If cache_type is not supported
         """
         if cache_type == "memory":
-            max_size = kwargs.get("max_size")
+            max_size = kwargs.get("max_size", InMemoryCache.DEFAULT_MAX_SIZE)
             ttl = kwargs.get("ttl")
             return InMemoryCache(max_size=max_size, ttl=ttl)
         
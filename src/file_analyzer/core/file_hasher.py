@@ -2,8 +2,32 @@
 File hasher component for generating file content hashes.
 """
 import hashlib
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Union
+from typing import BinaryIO, Iterable, List, Union
+
+
+# Read size for hashing files on Pythons without hashlib.file_digest
+HASH_CHUNK_SIZE = 1 << 16
+
+
+def _md5_file_digest(f: BinaryIO) -> str:
+    """
+    Compute the MD5 hex digest of an open binary file in fixed-size chunks.
+    
+    Args:
+        f: File opened in binary mode
+        
+    Returns:
+        MD5 hash of the file content
+    """
+    if hasattr(hashlib, "file_digest"):  # Python 3.11+
+        return hashlib.file_digest(f, "md5").hexdigest()
+    
+    digest = hashlib.md5()
+    for chunk in iter(lambda: f.read(HASH_CHUNK_SIZE), b""):
+        digest.update(chunk)
+    return digest.hexdigest()
 
 
 class FileHasher:
@@ -22,12 +46,34 @@ class FileHasher:
         path = Path(file_path) if isinstance(file_path, str) else file_path
         
         try:
-            content = path.read_bytes()
-            return hashlib.md5(content).hexdigest()
+            # Stream the file so memory use doesn't grow with file size
+            with path.open('rb') as f:
+                return _md5_file_digest(f)
         except Exception:
             # Fallback to path-based hash if file can't be read
             return hashlib.md5(str(path).encode()).hexdigest()
     
+    def hash_many(self, file_paths: Iterable[Union[str, Path]], max_workers: int = 8) -> List[str]:
+        """
+        Generate hashes for several files concurrently.
+        
+        hashlib releases the GIL while hashing large buffers, so files are
+        hashed in parallel threads.
+        
+        Args:
+            file_paths: Paths of the files to hash
+            max_workers: Maximum number of threads used for hashing
+            
+        Returns:
+            Hashes in the same order as file_paths, each as get_file_hash returns it
+        """
+        paths = list(file_paths)
+        if len(paths) <= 1:
+            return [self.get_file_hash(path) for path in paths]
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(paths))) as executor:
+            return list(executor.map(self.get_file_hash, paths))
+    
     def get_string_hash(self, content: str) -> str:
         """
         Generate a hash for a string.
@@ -10,6 +10,9 @@ from file_analyzer.utils.exceptions import FileReadError
 class FileReader:
     """Responsible for reading file content safely."""
     
+    # Read buffer size; larger than Python's 8 KiB default to cut down on read calls
+    CHUNK_SIZE = 1 << 16
+    
     def read_file(self, file_path: Union[str, Path], max_size: int = 4000) -> str:
         """
         Read file content with error handling and size limiting.
@@ -27,7 +30,8 @@ class FileReader:
         path = Path(file_path) if isinstance(file_path, str) else file_path
         
         try:
-            content = path.read_text(errors='replace')
-            return content[:max_size]  # Truncate to control costs
+            # Only read what is kept; large files are truncated to control costs
+            with path.open(errors='replace', buffering=self.CHUNK_SIZE) as f:
+                return f.read(max_size)
         except Exception as e:
             raise FileReadError(f"Failed to read file {path}: {str(e)}")
\ No newline at end of file
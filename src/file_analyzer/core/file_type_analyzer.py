@@ -6,8 +6,9 @@ which coordinates file reading, AI analysis, and caching to determine
 file metadata.
 """
 import logging
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
-from typing import Dict, Any, Optional, Union
+from typing import Callable, Dict, Any, Iterable, Optional, Tuple, Union
 
 from file_analyzer.ai_providers.provider_interface import AIModelProvider
 from file_analyzer.core.file_reader import FileReader
@@ -148,32 +149,119 @@ class FileTypeAnalyzer:
             Dictionary with file analysis results
         """
         path = Path(file_path) if isinstance(file_path, str) else file_path
-        cache_hit = False
+        file_hash, cached_result = self._lookup_cache(path)
+        if cached_result:
+            return cached_result
         
-        # Check cache if available
-        if self.cache_provider:
+        return self._analyze_uncached(
+            path, file_hash, lambda: self.file_reader.read_file(path)
+        )
+    
+    def analyze_files(
+        self,
+        file_paths: Iterable[Union[str, Path]],
+        max_workers: int = 8
+    ) -> Dict[str, Dict[str, Any]]:
+        """
+        Analyze several files in one call.
+        
+        Files are hashed concurrently and cached results are collected first;
+        the remaining files are read concurrently and then analyzed in order.
+        Each result is the same as analyze_file would return for that path.
+        
+        Args:
+            file_paths: Paths of the files to analyze
+            max_workers: Maximum number of threads used to hash and read files
+            
+        Returns:
+            Dictionary mapping each file path (as a string) to its analysis results
+        """
+        paths = [Path(file_path) for file_path in file_paths]
+        file_hashes = (
+            self.file_hasher.hash_many(paths, max_workers=max_workers)
+            if self.cache_provider else [None] * len(paths)
+        )
+        
+        results = {}
+        pending = []
+        for path, file_hash in zip(paths, file_hashes):
+            file_hash, cached_result = self._lookup_cache(path, file_hash)
+            # Misses keep their slot so results follow the input order
+            results[str(path)] = cached_result
+            if not cached_result:
+                pending.append((path, file_hash))
+        
+        if not pending:
+            return results
+        
+        with ThreadPoolExecutor(max_workers=min(max_workers, len(pending))) as executor:
+            reads = [
+                executor.submit(self.file_reader.read_file, path)
+                for path, _ in pending
+            ]
+            for (path, file_hash), read in zip(pending, reads):
+                results[str(path)] = self._analyze_uncached(path, file_hash, read.result)
+        
+        return results
+    
+    def _lookup_cache(
+        self,
+        path: Path,
+        file_hash: Optional[str] = None
+    ) -> Tuple[Optional[str], Optional[Dict[str, Any]]]:
+        """
+        Look up a file in the cache and record the hit or miss.
+        
+        Args:
+            path: Path to the file
+            file_hash: Precomputed hash of the file (computed here if omitted)
+            
+        Returns:
+            Tuple of the file hash (None when caching is disabled) and the
+            cached result (None on a miss)
+        """
+        if not self.cache_provider:
+            return None, None
+        
+        if file_hash is None:
             file_hash = self.file_hasher.get_file_hash(path)
-            cached_result = self.cache_provider.get(file_hash)
-            if cached_result:
-                logger.debug(f"Cache hit for {path}")
-                if self.cache_stats:
-                    self.cache_stats["hit"] = self.cache_stats.get("hit", 0) + 1
-                cache_hit = True
-                return cached_result
-            else:
-                if self.cache_stats:
-                    self.cache_stats["miss"] = self.cache_stats.get("miss", 0) + 1
+        cached_result = self.cache_provider.get(file_hash)
+        if cached_result:
+            logger.debug(f"Cache hit for {path}")
+            if self.cache_stats:
+                self.cache_stats["hit"] = self.cache_stats.get("hit", 0) + 1
+            return file_hash, cached_result
         
+        if self.cache_stats:
+            self.cache_stats["miss"] = self.cache_stats.get("miss", 0) + 1
+        return file_hash, None
+    
+    def _analyze_uncached(
+        self,
+        path: Path,
+        file_hash: Optional[str],
+        read_content: Callable[[], str]
+    ) -> Dict[str, Any]:
+        """
+        Analyze a file that was not found in the cache.
+        
+        Args:
+            path: Path to the file
+            file_hash: Hash of the file, used as the cache key
+            read_content: Callable returning the file content
+            
+        Returns:
+            Dictionary with file analysis results
+        """
         try:
             # Read file content
-            content = self.file_reader.read_file(path)
+            content = read_content()
             
             # Analyze with AI provider
             result = self.ai_provider.analyze_content(str(path), content)
             
             # Cache result if caching is enabled and analysis succeeded
             if self.cache_provider and 'error' not in result:
-                file_hash = self.file_hasher.get_file_hash(path)
                 self.cache_provider.set(file_hash, result)
                 if self.cache_stats:
                     self.cache_stats["store"] = self.cache_stats.get("store", 0) + 1
@@ -6,12 +6,18 @@ based on their content and metadata from previous analysis steps.
 It supports various file types and programming languages, providing
 specialized documentation for each.
 """
+import json
 import logging
 import os
 import re
 from typing import Dict, Any, List, Optional, Union, Set
 from pathlib import Path
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from file_analyzer.ai_providers.provider_interface import AIModelProvider
 from file_analyzer.ai_providers.mock_provider import MockAIProvider
 
@@ -1137,8 +1143,7 @@ run_tests path/to/test_file
             
             # Try to extract scripts as targets
             try:
-                import json
-                package_data = json.loads(content)
+                package_data = orjson.loads(content) if orjson is not None else json.loads(content)
                 
                 # Extract scripts
                 if "scripts" in package_data:
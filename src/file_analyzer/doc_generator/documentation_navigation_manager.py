@@ -6,9 +6,11 @@ table of contents, breadcrumbs, cross-references, and section navigation.
 """
 import os
 import re
+import sys
 import logging
+from dataclasses import dataclass
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Tuple, Set
+from typing import Dict, Any, Iterator, List, Optional, Tuple, Set, Union
 
 import jinja2
 from file_analyzer.doc_generator.markdown_formatter import (
@@ -18,6 +20,66 @@ from file_analyzer.doc_generator.markdown_formatter import (
 
 logger = logging.getLogger("file_analyzer.doc_generator")
 
+# Precompiled patterns for extracting titles, headings, and links
+_TITLE_RE = re.compile(r'^# (.+)$', re.MULTILINE)
+_TITLE_LINE_RE = re.compile(r'^# .+$', re.MULTILINE)
+_HEADING_RE = re.compile(r'^(#{1,6})\s+(.+)$')
+_LINK_RE = re.compile(r'\[([^\]]+)\]\(([^)]+)\)')
+
+# dataclass(slots=True) is only available on Python 3.10+
+_DATACLASS_SLOTS = {"slots": True} if sys.version_info >= (3, 10) else {}
+
+
+@dataclass(frozen=True, **_DATACLASS_SLOTS)
+class DocNode:
+    """Immutable metadata record for a single documentation page."""
+    title: str
+    path: str
+    headings: Tuple[Tuple[int, str], ...] = ()
+    children: Tuple[str, ...] = ()
+    parent: Optional[str] = None
+    related_files: Tuple[str, ...] = ()
+
+
+DocRecord = Union[Dict[str, Any], DocNode]
+
+
+def _doc_get(document: Optional[DocRecord], key: str, default: Any = None) -> Any:
+    """
+    Read a field from a document record.
+    
+    Args:
+        document: Document metadata as a dict or DocNode
+        key: Field name
+        default: Value returned when the field is missing or empty
+        
+    Returns:
+        Field value or default
+    """
+    if document is None:
+        return default
+    if isinstance(document, dict):
+        return document.get(key, default)
+    value = getattr(document, key, None)
+    return default if value is None else value
+
+
+def _iter_headings(document: DocRecord) -> Iterator[Tuple[Optional[int], str]]:
+    """
+    Iterate over the headings of a document as (level, text) pairs.
+    
+    Args:
+        document: Document metadata as a dict or DocNode
+        
+    Yields:
+        Tuples of heading level and heading text
+    """
+    for heading in _doc_get(document, "headings", ()):
+        if isinstance(heading, dict):
+            yield heading.get("level"), heading.get("text", "")
+        else:
+            yield heading[0], heading[1]
+
 
 class NavigationConfig:
     """Configuration for documentation navigation."""
@@ -109,7 +171,7 @@ class DocumentationNavigationManager:
         self.jinja_env.filters['sanitize_markdown'] = sanitize_markdown
         self.jinja_env.filters['create_anchor'] = create_anchor_link
     
-    def generate_toc(self, document: Dict[str, Any]) -> str:
+    def generate_toc(self, document: DocRecord) -> str:
         """
         Generate table of contents for a document.
         
@@ -122,24 +184,24 @@ class DocumentationNavigationManager:
         toc_lines = ["## Table of Contents\n"]
         
         # Extract headings from document
-        headings = document.get("headings", [])
+        headings = list(_iter_headings(document))
         
         # Skip the title (first h1)
         start_index = 0
-        for i, heading in enumerate(headings):
-            if heading.get("level") == 1:
+        for i, (level, _) in enumerate(headings):
+            if level == 1:
                 start_index = i + 1
                 break
         
         # Generate TOC entries for remaining headings
-        for heading in headings[start_index:]:
-            level = heading.get("level", 2)
+        for level, text in headings[start_index:]:
+            if level is None:
+                level = 2
             
             # Skip headings deeper than max_toc_depth
             if level > self.config.max_toc_depth + 1:
                 continue
                 
-            text = heading.get("text", "")
             indent = "  " * (level - 2)  # Indent based on heading level
             anchor = create_anchor_link(text)
             
@@ -149,8 +211,8 @@ class DocumentationNavigationManager:
     
     def generate_breadcrumbs(
         self,
-        document: Dict[str, Any],
-        doc_structure: Dict[str, Dict[str, Any]]
+        document: DocRecord,
+        doc_structure: Dict[str, DocRecord]
     ) -> str:
         """
         Generate breadcrumb navigation for a document.
@@ -163,7 +225,7 @@ class DocumentationNavigationManager:
             Markdown string with breadcrumb navigation
         """
         breadcrumbs = []
-        current_path = document.get("path", "")
+        current_path = _doc_get(document, "path", "")
         
         # Build breadcrumb chain by following parent links
         while current_path:
@@ -172,11 +234,11 @@ class DocumentationNavigationManager:
                 break
                 
             # Add current document to breadcrumbs
-            title = current_doc.get("title", os.path.basename(current_path))
+            title = _doc_get(current_doc, "title", os.path.basename(current_path))
             breadcrumbs.insert(0, (title, current_path))
             
             # Move to parent
-            current_path = current_doc.get("parent", "")
+            current_path = _doc_get(current_doc, "parent", "")
             
             # Prevent infinite loops
             if len(breadcrumbs) >= 20:  # Safeguard against circular references
@@ -206,7 +268,7 @@ class DocumentationNavigationManager:
                 continue
             
             # Calculate relative path
-            current_doc_path = document.get("path", "")
+            current_doc_path = _doc_get(document, "path", "")
             relative_path = self._get_relative_path(current_doc_path, path)
             
             # Add as link
@@ -215,7 +277,7 @@ class DocumentationNavigationManager:
         # Join with separator
         return " &raquo; ".join(breadcrumb_links)
     
-    def generate_section_navigation(self, document: Dict[str, Any]) -> str:
+    def generate_section_navigation(self, document: DocRecord) -> str:
         """
         Generate section navigation for a document.
         
@@ -226,20 +288,20 @@ class DocumentationNavigationManager:
             Markdown string with section navigation
         """
         # Extract headings from document
-        headings = document.get("headings", [])
+        headings = list(_iter_headings(document))
         
         # Skip the title (first h1)
         start_index = 0
-        for i, heading in enumerate(headings):
-            if heading.get("level") == 1:
+        for i, (level, _) in enumerate(headings):
+            if level == 1:
                 start_index = i + 1
                 break
         
         # Use only h2 headings for section navigation
         section_headings = []
-        for heading in headings[start_index:]:
-            if heading.get("level") == 2:
-                section_headings.append(heading)
+        for level, text in headings[start_index:]:
+            if level == 2:
+                section_headings.append(text)
         
         # If not enough sections, return empty navigation
         if len(section_headings) < 2:
@@ -247,8 +309,7 @@ class DocumentationNavigationManager:
         
         # Create section navigation links
         nav_links = []
-        for heading in section_headings:
-            text = heading.get("text", "")
+        for text in section_headings:
             anchor = create_anchor_link(text)
             nav_links.append(f"[{text}](#{anchor})")
         
@@ -256,8 +317,8 @@ class DocumentationNavigationManager:
     
     def generate_cross_references(
         self,
-        document: Dict[str, Any],
-        doc_structure: Dict[str, Dict[str, Any]]
+        document: DocRecord,
+        doc_structure: Dict[str, DocRecord]
     ) -> str:
         """
         Generate cross-references to related documents.
@@ -269,7 +330,7 @@ class DocumentationNavigationManager:
         Returns:
             Markdown string with cross-references
         """
-        related_files = document.get("related_files", [])
+        related_files = _doc_get(document, "related_files", [])
         
         # If no related files, return empty string
         if not related_files:
@@ -278,7 +339,7 @@ class DocumentationNavigationManager:
         # Build cross-references section
         xref_lines = ["## Related Files\n"]
         
-        current_path = document.get("path", "")
+        current_path = _doc_get(document, "path", "")
         current_dir = os.path.dirname(current_path)
         
         for related_path in related_files:
@@ -287,7 +348,7 @@ class DocumentationNavigationManager:
                 continue
                 
             # Get title or fallback to filename
-            title = related_doc.get("title", os.path.basename(related_path))
+            title = _doc_get(related_doc, "title", os.path.basename(related_path))
             
             # Calculate relative path
             relative_path = self._get_relative_path(current_path, related_path)
@@ -299,8 +360,8 @@ class DocumentationNavigationManager:
     
     def generate_header_footer(
         self,
-        document: Dict[str, Any],
-        doc_structure: Dict[str, Dict[str, Any]]
+        document: DocRecord,
+        doc_structure: Dict[str, DocRecord]
     ) -> Tuple[str, str]:
         """
         Generate header and footer navigation elements.
@@ -330,14 +391,16 @@ class DocumentationNavigationManager:
             footer_lines.append("## Navigation\n")
             
             # Add link to home page
-            current_path = document.get("path", "")
+            current_path = _doc_get(document, "path", "")
             home_path = self._get_relative_path(current_path, "index.md")
             footer_lines.append(f"- [Home]({home_path})")
             
             # Add link to parent directory if available
-            parent_path = document.get("parent", "")
+            parent_path = _doc_get(document, "parent", "")
             if parent_path:
-                parent_title = doc_structure.get(parent_path, {}).get("title", "Parent Directory")
+                parent_title = _doc_get(
+                    doc_structure.get(parent_path), "title", "Parent Directory"
+                )
                 parent_rel_path = self._get_relative_path(current_path, parent_path)
                 footer_lines.append(f"- [Up to {parent_title}]({parent_rel_path})")
             
@@ -346,7 +409,9 @@ class DocumentationNavigationManager:
                 dir_path = os.path.dirname(current_path)
                 dir_index = f"{dir_path}/index.md" if dir_path else "index.md"
                 if dir_index in doc_structure:
-                    dir_title = doc_structure.get(dir_index, {}).get("title", "Directory Index")
+                    dir_title = _doc_get(
+                        doc_structure.get(dir_index), "title", "Directory Index"
+                    )
                     dir_rel_path = self._get_relative_path(current_path, dir_index)
                     footer_lines.append(f"- [Directory: {dir_title}]({dir_rel_path})")
         
@@ -356,8 +421,8 @@ class DocumentationNavigationManager:
     def add_navigation_to_document(
         self,
         content: str,
-        document: Dict[str, Any],
-        doc_structure: Dict[str, Dict[str, Any]]
+        document: DocRecord,
+        doc_structure: Dict[str, DocRecord]
     ) -> str:
         """
         Add navigation elements to a document.
@@ -372,20 +437,22 @@ class DocumentationNavigationManager:
         """
         # Split content into parts - we'll insert navigation at appropriate points
         # First, ensure we have a title
-        title_match = re.match(r'^# (.+)$', content, re.MULTILINE)
+        title_match = _TITLE_RE.match(content)
         if not title_match:
             # If no title, add document title from metadata
-            title = document.get("title", os.path.basename(document.get("path", "")))
+            title = _doc_get(
+                document, "title", os.path.basename(_doc_get(document, "path", ""))
+            )
             content = f"# {title}\n\n{content}"
         
         # Find where to insert navigation - after the title
-        parts = re.split(r'^# .+$', content, 1, re.MULTILINE)
+        parts = _TITLE_LINE_RE.split(content, 1)
         if len(parts) != 2:
             # Fallback to beginning if can't find title
             header_part = ""
             body_part = content
         else:
-            header_part = parts[0] + re.search(r'^# .+$', content, re.MULTILINE).group(0)
+            header_part = parts[0] + _TITLE_LINE_RE.search(content).group(0)
             body_part = parts[1]
         
         # Generate navigation elements
@@ -437,7 +504,7 @@ class DocumentationNavigationManager:
     def process_documentation_structure(
         self,
         document_files: List[Dict[str, Any]],
-        doc_structure: Dict[str, Dict[str, Any]]
+        doc_structure: Dict[str, DocRecord]
     ) -> Dict[str, Any]:
         """
         Process a complete documentation structure to add navigation.
@@ -525,10 +592,9 @@ class DocumentationNavigationManager:
             List of headings with level and text
         """
         headings = []
-        heading_pattern = r'^(#{1,6})\s+(.+)$'
         
         for line in content.split('\n'):
-            match = re.match(heading_pattern, line)
+            match = _HEADING_RE.match(line)
             if match:
                 level = len(match.group(1))
                 text = match.group(2).strip()
@@ -566,7 +632,7 @@ class DocumentationNavigationManager:
                 
                 # Extract title from first heading
                 title = os.path.basename(file_path)
-                heading_match = re.search(r'^# (.+)$', content, re.MULTILINE)
+                heading_match = _TITLE_RE.search(content)
                 if heading_match:
                     title = heading_match.group(1).strip()
                 
@@ -631,8 +697,7 @@ class DocumentationNavigationManager:
                     content = f.read()
                 
                 # Find Markdown links to other documentation files
-                link_pattern = r'\[([^\]]+)\]\(([^)]+)\)'
-                link_matches = re.findall(link_pattern, content)
+                link_matches = _LINK_RE.findall(content)
                 
                 related_files = set()
                 for link_text, link_target in link_matches:
@@ -6,13 +6,96 @@ broken references, missing sections, and other common problems.
 """
 import os
 import re
+import copy
 import logging
-from typing import List, Optional
+import threading
+from concurrent.futures import ThreadPoolExecutor
+from functools import cached_property
+from typing import FrozenSet, Iterator, List, Optional, Tuple
 from dataclasses import dataclass, field
 import datetime
 
+from file_analyzer.core.file_hasher import FileHasher
+from file_analyzer.core.cache_provider import InMemoryCache
+
 logger = logging.getLogger("file_analyzer.doc_generator.documentation_tester")
 
+# Precompiled Markdown patterns shared by the quality checks
+_SECTION_HEADING_RE = re.compile(r'^##\s+(.+?)\s*$', re.MULTILINE)
+_HEADING_RE = re.compile(r'^#+\s+(.*?)$', re.MULTILINE)
+_INTERNAL_LINK_RE = re.compile(r'\[([^\]]+)\]\(#([^\)]+)\)')
+_CODE_BLOCK_RE = re.compile(r'```(?:\w+)?\n(.+?)```', re.DOTALL)
+_USAGE_SECTION_RE = re.compile(r'##\s+Usage\s+Examples.*?(?=##|\Z)', re.DOTALL)
+_COMPONENTS_SECTION_RE = re.compile(r'##\s+Key\s+Components.*?(?=##|\Z)', re.DOTALL)
+_TABLE_SEPARATOR_LINE_RE = re.compile(r'\|\s*-+\s*\|.*?\n', re.MULTILINE)
+_TABLE_SEPARATOR_RE = re.compile(r'\|\s*-+\s*\|')
+_TABLE_CELLS_RE = re.compile(r'\|[\s-]*\|')
+_PARAGRAPH_BREAK_RE = re.compile(r'\n\s*\n')
+_SECTION_RE = re.compile(r'##\s+([^\n]+).*?(?=##|\Z)', re.DOTALL)
+_NON_ANCHOR_CHARS_RE = re.compile(r'[^\w-]')
+_HYPHEN_RUN_RE = re.compile(r'-+')
+
+
+class ParsedDoc:
+    """
+    Markdown constructs of a document, each extracted on first use.
+
+    Checks given the same instance share its scans, and a standalone check
+    only scans the constructs it reads.
+    """
+
+    def __init__(self, content: str):
+        """
+        Initialize the parsed document.
+
+        Args:
+            content: Documentation content to parse
+        """
+        self.content = content
+
+    @cached_property
+    def section_headings(self) -> FrozenSet[str]:
+        """Titles of the level-two section headings."""
+        return frozenset(_SECTION_HEADING_RE.findall(self.content))
+
+    @cached_property
+    def headings(self) -> Tuple[str, ...]:
+        """Titles of all headings."""
+        return tuple(_HEADING_RE.findall(self.content))
+
+    @cached_property
+    def links(self) -> Tuple[Tuple[str, str], ...]:
+        """Internal links as (text, anchor) pairs."""
+        return tuple(_INTERNAL_LINK_RE.findall(self.content))
+
+    @cached_property
+    def code_blocks(self) -> Tuple[str, ...]:
+        """Bodies of fenced code blocks."""
+        # Substring test lets documents without code blocks skip the regex scan
+        if '```' not in self.content:
+            return ()
+        return tuple(_CODE_BLOCK_RE.findall(self.content))
+
+    @cached_property
+    def usage_section(self) -> Optional[str]:
+        """The Usage Examples section, if present."""
+        match = _USAGE_SECTION_RE.search(self.content)
+        return match.group(0) if match else None
+
+    @cached_property
+    def components_section(self) -> Optional[str]:
+        """The Key Components section, if present."""
+        match = _COMPONENTS_SECTION_RE.search(self.content)
+        return match.group(0) if match else None
+
+    @cached_property
+    def tables(self) -> Tuple[str, ...]:
+        """Table header separator lines."""
+        # Substring test lets documents without tables skip the regex scan
+        if '|' not in self.content:
+            return ()
+        return tuple(_TABLE_SEPARATOR_LINE_RE.findall(self.content))
+
 
 @dataclass
 class DocumentationQualityCheck:
@@ -41,8 +124,17 @@ class DocumentationTester:
     missing information, formatting problems, and quality metrics.
     """
 
-    def __init__(self):
-        """Initialize the documentation tester."""
+    def __init__(self, cache_size: int = 128, concurrency: Optional[int] = None):
+        """
+        Initialize the documentation tester.
+
+        Args:
+            cache_size: Maximum number of quality results cached by content hash
+            concurrency: Maximum number of files tested in parallel when testing
+                a directory (defaults to the CPU count)
+        """
+        self.concurrency = concurrency or os.cpu_count() or 1
+
         # Define the required sections for documentation
         self.required_sections = [
             "Description",
@@ -60,12 +152,22 @@ class DocumentationTester:
             "readability": 0.15,         # 15% of score
         }
 
-    def check_required_sections(self, content: str) -> DocumentationQualityCheck:
+        # Cache quality results keyed by content hash
+        self.file_hasher = FileHasher()
+        self.quality_cache = InMemoryCache(max_size=cache_size)
+        self._cache_lock = threading.Lock()
+
+    def check_required_sections(
+        self,
+        content: str,
+        parsed: Optional[ParsedDoc] = None
+    ) -> DocumentationQualityCheck:
         """
         Check if the documentation has all required sections.
 
         Args:
             content: Documentation content to check
+            parsed: Pre-parsed document (parsed from content if omitted)
 
         Returns:
             Quality check resul
@@ -74,10 +176,12 @@ class DocumentationTester:
         score = 10.0  # Start with maximum score
 
         # Look for section headings (## Section)
+        if parsed is None:
+            parsed = ParsedDoc(content)
+        headings = parsed.section_headings
         found_sections = set()
         for section in self.required_sections:
-            pattern = re.compile(r'^##\s+' + re.escape(section) + r'\s*$', re.MULTILINE)
-            if pattern.search(content):
+            if section in headings:
                 found_sections.add(section)
             else:
                 issues.append(f"Missing required section: {section}")
@@ -96,12 +200,17 @@ class DocumentationTester:
             issues=issues
         )
 
-    def check_broken_links(self, content: str) -> DocumentationQualityCheck:
+    def check_broken_links(
+        self,
+        content: str,
+        parsed: Optional[ParsedDoc] = None
+    ) -> DocumentationQualityCheck:
         """
         Check for broken internal links in documentation.
 
         Args:
             content: Documentation content to check
+            parsed: Pre-parsed document (parsed from content if omitted)
 
         Returns:
             Quality check resul
@@ -109,25 +218,33 @@ class DocumentationTester:
         issues = []
         score = 10.0
 
+        # Fast path: without any internal link markers there is nothing to check
+        if '](#' not in content:
+            return DocumentationQualityCheck(
+                name="broken_links",
+                passed=True,
+                score=score,
+                issues=issues
+            )
+
+        if parsed is None:
+            parsed = ParsedDoc(content)
+
         # Find all internal links [text](#anchor)
-        link_pattern = re.compile(r'\[([^\]]+)\]\(#([^\)]+)\)')
-        links = link_pattern.findall(content)
+        links = parsed.links
 
         # Find all heading anchors
-        heading_pattern = re.compile(r'^#+\s+(.*?)$', re.MULTILINE)
-        headings = heading_pattern.findall(content)
+        headings = parsed.headings
 
-        # Create normalized heading anchors
-        anchors = set()
-        for heading in headings:
-            anchor = self._normalize_anchor(heading.strip())
-            anchors.add(anchor)
+        # Create normalized heading anchors for constant-time link lookups
+        anchors = frozenset(self._normalize_anchor(heading.strip()) for heading in headings)
 
-        # Check each link against anchors
-        broken_links = []
-        for text, anchor in links:
-            if anchor not in anchors:
-                broken_links.append(f"Broken link to '{text}' with anchor '#{anchor}'")
+        # Check each link against anchors in a single pass
+        broken_links = [
+            f"Broken link to '{text}' with anchor '#{anchor}'"
+            for text, anchor in links
+            if anchor not in anchors
+        ]
 
         # Adjust score based on broken links
         if links:
@@ -145,12 +262,17 @@ class DocumentationTester:
             issues=issues
         )
 
-    def check_code_blocks(self, content: str) -> DocumentationQualityCheck:
+    def check_code_blocks(
+        self,
+        content: str,
+        parsed: Optional[ParsedDoc] = None
+    ) -> DocumentationQualityCheck:
         """
         Check for proper code blocks in documentation.
 
         Args:
             content: Documentation content to check
+            parsed: Pre-parsed document (parsed from content if omitted)
 
         Returns:
             Quality check resul
@@ -158,16 +280,17 @@ class DocumentationTester:
         issues = []
         score = 10.0
 
+        if parsed is None:
+            parsed = ParsedDoc(content)
+
         # Look for code blocks
-        code_blocks = re.findall(r'```(?:\w+)?\n(.+?)```', content, re.DOTALL)
+        code_blocks = parsed.code_blocks
 
         # Check if Usage Examples section has code blocks
-        usage_section_pattern = re.compile(r'##\s+Usage\s+Examples.*?(?=##|\Z)', re.DOTALL)
-        usage_section = usage_section_pattern.search(content)
+        usage_content = parsed.usage_section
 
-        if usage_section:
-            usage_content = usage_section.group(0)
-            if not re.search(r'```', usage_content):
+        if usage_content is not None:
+            if '```' not in usage_content:
                 issues.append("Usage Examples section does not contain code blocks")
                 score -= 5.0
                 # Important: Force failed test if no code blocks in Usage Examples section
@@ -199,12 +322,17 @@ class DocumentationTester:
             issues=issues
         )
 
-    def check_table_formatting(self, content: str) -> DocumentationQualityCheck:
+    def check_table_formatting(
+        self,
+        content: str,
+        parsed: Optional[ParsedDoc] = None
+    ) -> DocumentationQualityCheck:
         """
         Check for proper table formatting in documentation.
 
         Args:
             content: Documentation content to check
+            parsed: Pre-parsed document (parsed from content if omitted)
 
         Returns:
             Quality check resul
@@ -212,16 +340,17 @@ class DocumentationTester:
         issues = []
         score = 10.0
 
+        if parsed is None:
+            parsed = ParsedDoc(content)
+
         # Look for tables
-        tables = re.findall(r'\|\s*-+\s*\|.*?\n', content, re.MULTILINE)
+        tables = parsed.tables
 
         # Check Components section for tables
-        components_section_pattern = re.compile(r'##\s+Key\s+Components.*?(?=##|\Z)', re.DOTALL)
-        components_section = components_section_pattern.search(content)
+        components_content = parsed.components_section
 
-        if components_section:
-            components_content = components_section.group(0)
-            if not re.search(r'\|\s*-+\s*\|', components_content):
+        if components_content is not None:
+            if not _TABLE_SEPARATOR_RE.search(components_content):
                 issues.append("Key Components section would benefit from a table format")
                 score -= 3.0
                 # Force failure for Key Components section without table
@@ -235,7 +364,7 @@ class DocumentationTester:
 
         # Check for misaligned tables
         for table in tables:
-            if not re.search(r'\|[\s-]*\|', table):
+            if not _TABLE_CELLS_RE.search(table):
                 issues.append("Table header separator line is not properly formatted")
                 score -= 2.0
 
@@ -270,7 +399,7 @@ class DocumentationTester:
         score = 10.0
 
         # Check for paragraph length (avoid walls of text)
-        paragraphs = re.split(r'\n\s*\n', content)
+        paragraphs = _PARAGRAPH_BREAK_RE.split(content)
         long_paragraphs = [p for p in paragraphs if len(p.split()) > 100]
 
         if long_paragraphs:
@@ -278,8 +407,7 @@ class DocumentationTester:
             score -= min(5.0, len(long_paragraphs))
 
         # Check for section length
-        section_pattern = re.compile(r'##\s+([^\n]+).*?(?=##|\Z)', re.DOTALL)
-        sections = section_pattern.findall(content)
+        sections = _SECTION_RE.findall(content)
 
         for section in sections:
             section_match = re.search(r'##\s+' + re.escape(section) + r'.*?(?=##|\Z)', content, re.DOTALL)
@@ -311,11 +439,42 @@ class DocumentationTester:
         Returns:
             Documentation test result with quality score
         """
+        # The score also depends on the configured sections and weights, which
+        # callers may change between calls
+        settings = repr((self.required_sections, sorted(self.quality_weights.items())))
+        cache_key = (
+            f"quality:{self.file_hasher.get_string_hash(settings)}"
+            f":{self.file_hasher.get_string_hash(content)}"
+        )
+        with self._cache_lock:
+            cached_result = self.quality_cache.get(cache_key)
+        if cached_result is not None:
+            # Callers may mutate the result (e.g. file_path), so hand out a copy
+            return copy.deepcopy(cached_result)
+
+        result = self._measure_documentation_quality(content)
+        with self._cache_lock:
+            self.quality_cache.set(cache_key, result)
+        return copy.deepcopy(result)
+
+    def _measure_documentation_quality(self, content: str) -> DocumentationTestResult:
+        """
+        Run all quality checks on documentation content without caching.
+
+        Args:
+            content: Documentation content to evaluate
+
+        Returns:
+            Documentation test result with quality score
+        """
+        # Share one lazily parsed document across the checks
+        parsed = ParsedDoc(content)
+
         # Run all checks
-        required_sections = self.check_required_sections(content)
-        broken_links = self.check_broken_links(content)
-        code_blocks = self.check_code_blocks(content)
-        table_formatting = self.check_table_formatting(content)
+        required_sections = self.check_required_sections(content, parsed)
+        broken_links = self.check_broken_links(content, parsed)
+        code_blocks = self.check_code_blocks(content, parsed)
+        table_formatting = self.check_table_formatting(content, parsed)
         readability = self.check_readability(content)
 
         # Collect all checks
@@ -411,17 +570,50 @@ class DocumentationTester:
             logger.error(f"Directory not found: {directory_path}")
             return []
 
-        results = []
+        file_paths = list(self._iter_markdown_files(directory_path))
+
+        if self.concurrency <= 1 or len(file_paths) <= 1:
+            return [self.test_documentation_file(path) for path in file_paths]
+
+        # Threads overlap the file reads; the regex checks hold the GIL, so
+        # CPU-bound documents gain little beyond that
+        max_workers = min(self.concurrency, len(file_paths))
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(executor.map(self.test_documentation_file, file_paths))
+
+    def _iter_markdown_files(self, directory_path: str) -> Iterator[str]:
+        """
+        Recursively yield Markdown file paths under a directory.
+
+        Uses os.scandir so file type checks come from the cached directory
+        entry instead of a separate stat call per file.
 
-        # Walk through directory
-        for root, _, files in os.walk(directory_path):
-            for file in files:
-                if file.endswith('.md'):
-                    file_path = os.path.join(root, file)
-                    result = self.test_documentation_file(file_path)
-                    results.append(result)
+        Args:
+            directory_path: Directory to search
 
-        return results
+        Yields:
+            Paths of Markdown files, parent directory files first
+        """
+        markdown_files = []
+        subdirectories = []
+        try:
+            with os.scandir(directory_path) as entries:
+                for entry in entries:
+                    if entry.is_dir():
+                        # Match os.walk: don't descend into symlinked directories
+                        if not entry.is_symlink():
+                            subdirectories.append(entry.path)
+                    elif entry.name.endswith('.md'):
+                        markdown_files.append(entry.path)
+        except OSError as e:
+            # Unreadable directories (and non-directories) are skipped, as os.walk does by default
+            logger.debug(f"Skipping unreadable directory {directory_path}: {str(e)}")
+            return
+
+        yield from markdown_files
+
+        for subdirectory in subdirectories:
+            yield from self._iter_markdown_files(subdirectory)
 
     def generate_test_report(self, results: List[DocumentationTestResult]) -> str:
         """
@@ -502,10 +694,10 @@ class DocumentationTester:
         anchor = anchor.replace(" ", "-")
 
         # Remove non-alphanumeric characters (except hyphens and underscores)
-        anchor = re.sub(r'[^\w-]', '', anchor)
+        anchor = _NON_ANCHOR_CHARS_RE.sub('', anchor)
 
         # Fix duplicate hyphens
-        anchor = re.sub(r'-+', '-', anchor)
+        anchor = _HYPHEN_RUN_RE.sub('-', anchor)
 
         return anchor
 
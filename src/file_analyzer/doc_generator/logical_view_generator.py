@@ -9,7 +9,7 @@ import os
 import re
 import logging
 from pathlib import Path
-from typing import Dict, Any, List, Optional, Set, Tuple, Union
+from typing import Dict, Any, List, NamedTuple, Optional, Set, Tuple, Union
 
 from file_analyzer.ai_providers.provider_interface import AIModelProvider
 from file_analyzer.core.file_reader import FileReader
@@ -20,6 +20,16 @@ from file_analyzer.utils.exceptions import FileAnalyzerError
 
 logger = logging.getLogger("file_analyzer.logical_view_generator")
 
+
+class ClassTable(NamedTuple):
+    """Column-oriented view of class data, one list entry per class."""
+    names: List[str]
+    attributes: List[List[Dict[str, Any]]]
+    methods: List[List[Dict[str, Any]]]
+    inherits: List[List[str]]
+    implements: List[List[str]]
+
+
 class LogicalViewGenerator:
     """
     Generates UML Logical View diagrams for code repositories.
@@ -89,29 +99,41 @@ class LogicalViewGenerator:
         # Normalize paths
         paths = [Path(p) if isinstance(p, str) else p for p in file_paths]
         
-        # Check cache
+        # Check cache (keyed by the ordered file contents so renames still hit;
+        # class file paths are rebound to the current paths on a hit)
         if self.cache_provider:
-            cache_key = f"class_diagram:{self._hash_paths(paths)}"
+            cache_key = f"class_diagram:{self._hash_contents(paths, title)}"
             cached_result = self.cache_provider.get(cache_key)
             if cached_result:
                 logger.debug(f"Using cached class diagram for {len(paths)} files")
                 self.stats["cache_hits"] += 1
-                return cached_result
+                return self._rebind_class_paths(cached_result, paths)
             self.stats["cache_misses"] += 1
         
         # Collect class data from all files
         classes = []
         relationships = []
-        
-        for path in paths:
+        # Classes declared so far; a name seen in an earlier file is not
+        # emitted twice, and names only referenced by relationships (e.g. an
+        # interface defined elsewhere) are never synthesized
+        declared = set()
+        # Index into paths of the file each class was taken from
+        class_sources = []
+        
+        for index, path in enumerate(paths):
             # Analyze code for each file
             try:
                 analysis = self.code_analyzer.analyze_code(str(path))
                 
                 # Extract classes and their properties
                 for cls in analysis.get("structure", {}).get("classes", []):
+                    name = cls.get("name", "UnknownClass")
+                    if name in declared:
+                        continue
+                    declared.add(name)
+                    class_sources.append(index)
                     classes.append({
-                        "name": cls.get("name", "UnknownClass"),
+                        "name": name,
                         "file_path": str(path),
                         "attributes": cls.get("attributes", []),
                         "methods": cls.get("methods", []),
@@ -146,8 +168,7 @@ class LogicalViewGenerator:
         
         # Cache result
         if self.cache_provider:
-            cache_key = f"class_diagram:{self._hash_paths(paths)}"
-            self.cache_provider.set(cache_key, result)
+            self.cache_provider.set(cache_key, {"diagram": result, "class_sources": class_sources})
         
         # Update stats
         self.stats["class_diagrams_generated"] += 1
@@ -359,6 +380,21 @@ class LogicalViewGenerator:
         paths_str = "|".join(sorted([str(p) for p in paths]))
         return self.file_hasher.get_string_hash(paths_str)
     
+    def _hash_contents(self, paths: List[Path], salt: str = "") -> str:
+        """Calculate a hash of the contents of a list of files, in order."""
+        file_hashes = [self.file_hasher.get_file_hash(p) for p in paths]
+        return self.file_hasher.get_string_hash(salt + "|" + "|".join(file_hashes))
+    
+    @staticmethod
+    def _rebind_class_paths(cached: Dict[str, Any], paths: List[Path]) -> Dict[str, Any]:
+        """Rebuild a cached class diagram with the file paths of the current call."""
+        result = dict(cached["diagram"])
+        result["classes"] = [
+            {**cls, "file_path": str(paths[index])}
+            for cls, index in zip(result["classes"], cached["class_sources"])
+        ]
+        return result
+    
     def _extract_object_instances(
         self, 
         code_snippet: str, 
@@ -462,15 +498,17 @@ class LogicalViewGenerator:
         Returns:
             String with Mermaid diagram syntax
         """
+        table = self._build_class_table(classes)
+        class_names = set(table.names)
+        
         diagram = f"classDiagram\n    %% {title}\n"
         
         # Add classes
-        for cls in classes:
-            class_name = cls["name"]
+        for class_name, attributes, methods in zip(table.names, table.attributes, table.methods):
             diagram += f"    class {class_name}\n"
             
             # Add attributes
-            for attr in cls.get("attributes", []):
+            for attr in attributes:
                 visibility = "+"
                 if attr.get("accessibility") == "private":
                     visibility = "-"
@@ -484,7 +522,7 @@ class LogicalViewGenerator:
                 diagram += f"    {class_name} : {visibility}{attr.get('name', 'unknown')}{attr_type}\n"
             
             # Add methods
-            for method in cls.get("methods", []):
+            for method in methods:
                 visibility = "+"
                 if method.get("accessibility") == "private":
                     visibility = "-"
@@ -516,7 +554,7 @@ class LogicalViewGenerator:
             # Skip if source or target not in our diagram
             if not source or not target:
                 continue
-            if not any(c["name"] == source for c in classes) or not any(c["name"] == target for c in classes):
+            if source not in class_names or target not in class_names:
                 continue
             
             rel_type = rel.get("type", "").lower()
@@ -539,22 +577,39 @@ class LogicalViewGenerator:
                 diagram += f"    {source} --> {target}\n"
         
         # Add inheritance relationships from class data
-        for cls in classes:
-            class_name = cls["name"]
-            for parent in cls.get("parent_classes", []):
+        for class_name, parents, interfaces in zip(table.names, table.inherits, table.implements):
+            for parent in parents:
                 parent_name = parent.split(".")[-1]  # Get class name without package
                 # Check if parent class is in diagram
-                if any(c["name"] == parent_name for c in classes):
+                if parent_name in class_names:
                     diagram += f"    {class_name} --|> {parent_name}\n"
             
-            for interface in cls.get("interfaces", []):
+            for interface in interfaces:
                 interface_name = interface.split(".")[-1]  # Get interface name without package
                 # Check if interface is in diagram
-                if any(c["name"] == interface_name for c in classes):
+                if interface_name in class_names:
                     diagram += f"    {class_name} ..|> {interface_name}\n"
         
         return diagram
     
+    def _build_class_table(self, classes: List[Dict[str, Any]]) -> ClassTable:
+        """
+        Convert per-class dictionaries into a column-oriented ClassTable.
+        
+        Args:
+            classes: List of class definitions
+            
+        Returns:
+            ClassTable with one entry per class in each column
+        """
+        return ClassTable(
+            names=[cls["name"] for cls in classes],
+            attributes=[cls.get("attributes", []) for cls in classes],
+            methods=[cls.get("methods", []) for cls in classes],
+            inherits=[cls.get("parent_classes", []) for cls in classes],
+            implements=[cls.get("interfaces", []) for cls in classes]
+        )
+    
     def _generate_mermaid_object_diagram(
         self, 
         objects: List[Dict[str, Any]], 
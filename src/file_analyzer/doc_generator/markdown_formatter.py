@@ -8,10 +8,41 @@ cross-references.
 import os
 import re
 import logging
+from functools import lru_cache
 from typing import Dict, Any, List, Optional, Union
 
 logger = logging.getLogger("file_analyzer.doc_generator.markdown_formatter")
 
+# Precompiled patterns used by sanitize_markdown
+_SCRIPT_BLOCK_RE = re.compile(r'<script.*?>.*?</script>', re.DOTALL)
+_IFRAME_BLOCK_RE = re.compile(r'<iframe.*?>.*?</iframe>', re.DOTALL)
+_STYLE_BLOCK_RE = re.compile(r'<style.*?>.*?</style>', re.DOTALL)
+_QUOTED_EVENT_HANDLER_RE = re.compile(
+    r'\s(on\w+)(\s*=\s*["\'][^"\']*["\'])', re.IGNORECASE
+)
+_UNQUOTED_EVENT_HANDLER_RE = re.compile(r'\s(on\w+)(\s*=\s*[^\s>]*)', re.IGNORECASE)
+_DANGEROUS_TAG_PATTERNS = tuple(
+    (
+        re.compile(f'<{tag}[^>]*>.*?</{tag}>', re.DOTALL | re.IGNORECASE),
+        re.compile(f'<{tag}[^>]*/?>', re.IGNORECASE),
+    )
+    for tag in ('script', 'iframe', 'object', 'embed', 'svg')
+)
+_DANGEROUS_ATTR_PATTERNS = tuple(
+    (
+        re.compile(f'\\s{attr}\\s*=\\s*["\'][^"\']*["\']', re.IGNORECASE),
+        re.compile(f'\\s{attr}\\s*=\\s*[^\\s>]*', re.IGNORECASE),
+    )
+    for attr in ('onerror', 'onload', 'onclick', 'onmouseover', 'onblur', 'onchange',
+                 'onfocus', 'onscroll', 'onsubmit')
+)
+_IMG_ONERROR_RE = re.compile(r'<img\s+[^>]*onerror\s*=\s*[^>]*>', re.IGNORECASE)
+_HEADING_SPACING_RE = re.compile(r'(\S)(\n#+\s+)')
+_LIST_ITEM_SPACING_RE = re.compile(r'(\n)([*+-])\s+')
+_ANCHOR_INVALID_CHARS_RE = re.compile(r'[^\w\- ]+')
+_ANCHOR_SEPARATOR_RE = re.compile(r'[- ]+')
+
+
 class MarkdownFormatter:
     """
     Formats AI-generated documentation into well-structured Markdown.
@@ -49,8 +80,8 @@ class MarkdownFormatter:
         # Extract file name for title
         file_name = os.path.basename(file_path)
         
-        # Start with the title
-        markdown = f"# {file_name}\n\n"
+        # Collect output pieces and join once at the end
+        parts = [f"# {file_name}\n\n"]
         
         # Create table of contents with available sections
         available_sections = []
@@ -60,9 +91,9 @@ class MarkdownFormatter:
                 available_sections.append(section)
                 
         # Add table of contents
-        markdown += "## Table of Contents\n\n"
-        markdown += create_toc(available_sections)
-        markdown += "\n\n"
+        parts.append("## Table of Contents\n\n")
+        parts.append(create_toc(available_sections))
+        parts.append("\n\n")
         
         # Add each section
         for section in self.default_sections:
@@ -73,22 +104,22 @@ class MarkdownFormatter:
                 continue
                 
             # Create section heading with anchor
-            markdown += f"## {section}\n\n"
+            parts.append(f"## {section}\n\n")
             
             # Format section content based on type
             if section == "Usage Examples":
                 # Format code examples
                 examples = doc_data.get("usage_examples", [])
                 for example in examples:
-                    markdown += f"{example}\n\n"
+                    parts.append(f"{example}\n\n")
             
             elif section == "Key Components":
                 # Format components as a list or table
                 components = doc_data.get("key_components", [])
                 if components:
                     # Create a table for components
-                    markdown += "| Component | Description |\n"
-                    markdown += "|-----------|-------------|\n"
+                    parts.append("| Component | Description |\n")
+                    parts.append("|-----------|-------------|\n")
                     
                     for component in components:
                         name = component.get("name", "")
@@ -98,16 +129,16 @@ class MarkdownFormatter:
                         name = name.replace("\n", " ").replace("|", "\\|")
                         description = description.replace("\n", " ").replace("|", "\\|")
                         
-                        markdown += f"| {name} | {description} |\n"
+                        parts.append(f"| {name} | {description} |\n")
                     
-                    markdown += "\n"
+                    parts.append("\n")
             
             elif section == "Main Concepts":
                 # Format concepts as a list
                 concepts = doc_data.get("main_concepts", [])
                 for concept in concepts:
-                    markdown += f"- {concept}\n"
-                markdown += "\n"
+                    parts.append(f"- {concept}\n")
+                parts.append("\n")
             
             else:
                 # Regular text content
@@ -115,9 +146,9 @@ class MarkdownFormatter:
                 if content:
                     # Sanitize content
                     content = sanitize_markdown(content)
-                    markdown += f"{content}\n\n"
+                    parts.append(f"{content}\n\n")
         
-        return markdown
+        return "".join(parts)
 
 
 def format_documentation(
@@ -151,11 +182,9 @@ def create_toc(sections: List[str]) -> str:
     Returns:
         Markdown table of contents
     """
-    toc = ""
-    for section in sections:
-        anchor = create_anchor_link(section)
-        toc += f"- [{section}](#{anchor})\n"
-    return toc
+    return "".join(
+        f"- [{section}](#{create_anchor_link(section)})\n" for section in sections
+    )
 
 
 def sanitize_markdown(content: str) -> str:
@@ -168,44 +197,62 @@ def sanitize_markdown(content: str) -> str:
     Returns:
         Sanitized Markdown
     """
+    content = _strip_unsafe_html(content)
+    
+    # Fix common Markdown issues
+    
+    # Ensure blank line before headings for proper parsing
+    content = _HEADING_SPACING_RE.sub(r'\1\n\n\2', content)
+    
+    # Ensure proper spacing for list items
+    content = _LIST_ITEM_SPACING_RE.sub(r'\1\2 ', content)
+    
+    return content
+
+
+def _strip_unsafe_html(content: str) -> str:
+    """
+    Remove dangerous HTML tags and event handler attributes.
+    
+    Args:
+        content: Markdown content to clean
+        
+    Returns:
+        Content with unsafe HTML removed
+    """
+    # Every tag pattern starts with '<', so tag-free content only needs the
+    # event handler patterns
+    has_tags = '<' in content
+    
     # Remove potentially dangerous HTML tags
-    content = re.sub(r'<script.*?>.*?</script>', '', content, flags=re.DOTALL)
-    content = re.sub(r'<iframe.*?>.*?</iframe>', '', content, flags=re.DOTALL)
-    content = re.sub(r'<style.*?>.*?</style>', '', content, flags=re.DOTALL)
+    if has_tags:
+        content = _SCRIPT_BLOCK_RE.sub('', content)
+        content = _IFRAME_BLOCK_RE.sub('', content)
+        content = _STYLE_BLOCK_RE.sub('', content)
     
     # Remove all on* event handlers - more comprehensive pattern
-    content = re.sub(r'\s(on\w+)(\s*=\s*["\'][^"\']*["\'])', ' ', content, flags=re.IGNORECASE)
-    content = re.sub(r'\s(on\w+)(\s*=\s*[^\s>]*)', ' ', content, flags=re.IGNORECASE)
+    content = _QUOTED_EVENT_HANDLER_RE.sub(' ', content)
+    content = _UNQUOTED_EVENT_HANDLER_RE.sub(' ', content)
     
     # Remove potentially dangerous HTML tags completely
-    dangerous_tags = ['script', 'iframe', 'object', 'embed', 'svg']
-    for tag in dangerous_tags:
-        content = re.sub(f'<{tag}[^>]*>.*?</{tag}>', '', content, flags=re.DOTALL | re.IGNORECASE)
-        content = re.sub(f'<{tag}[^>]*/?>', '', content, flags=re.IGNORECASE)
-    
-    # More comprehensive approach to remove dangerous HTML attributes
-    dangerous_attrs = ['onerror', 'onload', 'onclick', 'onmouseover', 'onblur', 'onchange',
-                      'onfocus', 'onscroll', 'onsubmit']
+    if has_tags:
+        for block_pattern, tag_pattern in _DANGEROUS_TAG_PATTERNS:
+            content = block_pattern.sub('', content)
+            content = tag_pattern.sub('', content)
     
     # Use more aggressive pattern to remove event handlers
-    for attr in dangerous_attrs:
-        content = re.sub(f'\\s{attr}\\s*=\\s*["\'][^"\']*["\']', ' ', content, flags=re.IGNORECASE)
-        content = re.sub(f'\\s{attr}\\s*=\\s*[^\\s>]*', ' ', content, flags=re.IGNORECASE)
+    for quoted_pattern, unquoted_pattern in _DANGEROUS_ATTR_PATTERNS:
+        content = quoted_pattern.sub(' ', content)
+        content = unquoted_pattern.sub(' ', content)
     
     # Remove entire img tags with onerror attributes as a last resort
-    content = re.sub(r'<img\s+[^>]*onerror\s*=\s*[^>]*>', '', content, flags=re.IGNORECASE)
-    
-    # Fix common Markdown issues
-    
-    # Ensure blank line before headings for proper parsing
-    content = re.sub(r'(\S)(\n#+\s+)', r'\1\n\n\2', content)
-    
-    # Ensure proper spacing for list items
-    content = re.sub(r'(\n)([*+-])\s+', r'\1\2 ', content)
+    if has_tags:
+        content = _IMG_ONERROR_RE.sub('', content)
     
     return content
 
 
+@lru_cache(maxsize=1024)
 def create_anchor_link(text: str) -> str:
     """
     Create an anchor link from text.
@@ -215,22 +262,16 @@ def create_anchor_link(text: str) -> str:
     - Replace spaces with hyphens
     - Remove characters that are not alphanumeric, hyphen, or underscore
     
+    Results are memoized since the same section names recur across documents.
+    
     Args:
         text: Text to create anchor from
         
     Returns:
         Anchor link string
     """
-    # Convert to lowercase
-    anchor = text.lower()
-    
-    # Replace spaces with hyphens
-    anchor = anchor.replace(" ", "-")
-    
-    # Remove non-alphanumeric characters (except hyphens and underscores)
-    anchor = re.sub(r'[^\w-]', '', anchor)
-    
-    # Fix duplicate hyphens (caused by replacing special chars with nothing)
-    anchor = re.sub(r'-+', '-', anchor)
+    # Remove non-alphanumeric characters (except spaces, hyphens and underscores)
+    anchor = _ANCHOR_INVALID_CHARS_RE.sub('', text.lower())
     
-    return anchor
\ No newline at end of file
+    # Turn each run of spaces and hyphens into a single hyphen
+    return _ANCHOR_SEPARATOR_RE.sub('-', anchor)
\ No newline at end of file
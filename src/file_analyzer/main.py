@@ -12,6 +12,11 @@ import sys
 from pathlib import Path
 from typing import Dict, Any, List, Optional, Union
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from file_analyzer.core.file_type_analyzer import FileTypeAnalyzer
 from file_analyzer.core.file_reader import FileReader
 from file_analyzer.core.file_hasher import FileHasher
@@ -210,10 +215,31 @@ def analyze_path(
     return results
 
 
-def main() -> int:
+def write_results(results: Dict[str, Any], output_path: Path) -> None:
+    """
+    Write analysis results to a JSON file.
+    
+    Uses orjson when it is installed, falling back to the standard library.
+    
+    Args:
+        results: Analysis results to write
+        output_path: Path of the JSON file
+    """
+    if orjson is not None:
+        with open(output_path, 'wb') as f:
+            f.write(orjson.dumps(results, option=orjson.OPT_INDENT_2 | orjson.OPT_NON_STR_KEYS))
+    else:
+        with open(output_path, 'w') as f:
+            json.dump(results, f, indent=2)
+
+
+def main(argv: Optional[List[str]] = None) -> int:
     """
     Main entry point for the CLI.
     
+    Args:
+        argv: Command-line arguments (defaults to sys.argv[1:])
+        
     Returns:
         Exit code (0 for success, non-zero for failure)
     """
@@ -253,7 +279,7 @@ def main() -> int:
     output_group.add_argument('--no-progress', action='store_true',
                        help='Disable progress reporting')
     
-    args = parser.parse_args()
+    args = parser.parse_args(argv)
     
     # Configure logging
     if args.verbose:
@@ -326,8 +352,7 @@ def main() -> int:
         if args.output:
             output_path = Path(args.output)
             output_path.parent.mkdir(parents=True, exist_ok=True)
-            with open(output_path, 'w') as f:
-                json.dump(results, f, indent=2)
+            write_results(results, output_path)
             logger.info(f"Results written to {output_path}")
         else:
             print(json.dumps(results, indent=2))
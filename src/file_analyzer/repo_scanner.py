@@ -5,12 +5,14 @@ This module provides functionality to scan a repository directory structure,
 identify files, and prepare them for AI-based analysis.
 """
 import asyncio
-import glob
+import fnmatch
 import logging
 import os
+import re
+from functools import lru_cache
 from pathlib import Path
 import time
-from typing import Dict, List, Set, Any, Optional, Callable, Union, Tuple
+from typing import Dict, List, Set, Any, Optional, Callable, Pattern, Union, Tuple
 
 from file_analyzer.core.file_type_analyzer import FileTypeAnalyzer
 from file_analyzer.utils.exceptions import FileAnalyzerError
@@ -18,6 +20,78 @@ from file_analyzer.utils.exceptions import FileAnalyzerError
 # Configure logging
 logger = logging.getLogger("file_analyzer.repo_scanner")
 
+# An exclusion is either a name/extension pattern or a precompiled regex
+ExclusionPattern = Union[str, Pattern[str]]
+
+# Characters that make a "*<suffix>" pattern depend on more than the file name
+_PATH_DEPENDENT_SUFFIX_RE = re.compile(r'[*?\[/\\]')
+
+
+@lru_cache(maxsize=32)
+def _split_exclusions(
+    exclusions: Tuple[ExclusionPattern, ...]
+) -> Tuple[frozenset, frozenset, Tuple[str, ...], Tuple[Pattern[str], ...]]:
+    """
+    Split exclusion patterns into lookups that need no per-pattern loop.
+    
+    Args:
+        exclusions: Exclusion patterns, as configured on the scanner
+        
+    Returns:
+        Tuple of (excluded directory names, excluded file names,
+        excluded file suffixes, precompiled regexes)
+    """
+    dir_names, file_names, suffixes, regexes = set(), set(), [], []
+    for pattern in exclusions:
+        if not isinstance(pattern, str):
+            regexes.append(pattern)
+        elif pattern.startswith("*"):
+            # Extension pattern like "*.exe"
+            suffixes.append(pattern[1:])
+        else:
+            file_names.add(pattern)
+            # Patterns with wildcards are for files, not directories
+            if "*" not in pattern:
+                dir_names.add(pattern)
+    return frozenset(dir_names), frozenset(file_names), tuple(suffixes), tuple(regexes)
+
+
+@lru_cache(maxsize=32)
+def _split_priority_patterns(
+    patterns: Tuple[str, ...]
+) -> Tuple[frozenset, Tuple[str, ...], Tuple[str, ...], Tuple[Pattern[str], ...]]:
+    """
+    Split priority glob patterns into lookups that need no per-pattern loop.
+    
+    Args:
+        patterns: Priority glob patterns, as configured on the scanner
+        
+    Returns:
+        Tuple of (exact file names, file name suffixes, file name prefixes,
+        compiled relative path patterns)
+    """
+    names, suffixes, prefixes, path_patterns = set(), [], [], []
+    for pattern in patterns:
+        if "*" not in pattern:
+            names.add(pattern)
+            continue
+        
+        if pattern.startswith("*"):
+            # Extension pattern
+            suffixes.append(pattern[1:])
+            if not _PATH_DEPENDENT_SUFFIX_RE.search(pattern[1:]):
+                # A plain "*<suffix>" matches a relative path exactly when
+                # the file name ends with the suffix, so no regex is needed
+                continue
+        elif pattern.endswith("*"):
+            # Prefix pattern
+            prefixes.append(pattern[:-1])
+        
+        # Any wildcard pattern is also matched against the relative path,
+        # like fnmatch.fnmatch
+        path_patterns.append(re.compile(fnmatch.translate(os.path.normcase(pattern))))
+    return frozenset(names), tuple(suffixes), tuple(prefixes), tuple(path_patterns)
+
 
 class RepositoryScanner:
     """
@@ -69,7 +143,7 @@ class RepositoryScanner:
     
     def __init__(self, 
                  analyzer: FileTypeAnalyzer,
-                 exclusions: Optional[List[str]] = None,
+                 exclusions: Optional[List[ExclusionPattern]] = None,
                  max_file_size: Optional[int] = None,
                  concurrency: int = 5,
                  batch_size: int = 10,
@@ -80,7 +154,9 @@ class RepositoryScanner:
         
         Args:
             analyzer: FileTypeAnalyzer instance to use for file analysis
-            exclusions: List of exclusion patterns (added to defaults)
+            exclusions: List of exclusion patterns (added to defaults); names,
+                "*"-prefixed extensions, or precompiled regexes matched against
+                file and directory names
             max_file_size: Maximum file size to analyze in bytes
             concurrency: Maximum number of concurrent analysis tasks
             batch_size: Number of files to analyze in each batch
@@ -119,7 +195,7 @@ class RepositoryScanner:
         Returns:
             Dictionary with scan results and repository statistics
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         repo_path = Path(repo_path).resolve()
         
         if not repo_path.exists() or not repo_path.is_dir():
@@ -146,7 +222,7 @@ class RepositoryScanner:
         results = self._analyze_files(filtered_files, repo_path)
         
         self.stats["analyzed_files"] = len(results)
-        self.stats["processing_time"] = time.time() - start_time
+        self.stats["processing_time"] = time.perf_counter() - start_time
         
         # Generate final statistics
         self._update_stats(results)
@@ -172,7 +248,7 @@ class RepositoryScanner:
         Returns:
             Dictionary with scan results and repository statistics
         """
-        start_time = time.time()
+        start_time = time.perf_counter()
         repo_path = Path(repo_path).resolve()
         
         if not repo_path.exists() or not repo_path.is_dir():
@@ -199,7 +275,7 @@ class RepositoryScanner:
         results = await self._analyze_files_async(filtered_files, repo_path)
         
         self.stats["analyzed_files"] = len(results)
-        self.stats["processing_time"] = time.time() - start_time
+        self.stats["processing_time"] = time.perf_counter() - start_time
         
         # Generate final statistics
         self._update_stats(results)
@@ -227,34 +303,48 @@ class RepositoryScanner:
         """
         all_files = []
         
-        # Walk directory tree
-        for root, dirs, files in os.walk(repo_path):
-            # Convert the root path to a Path object for easier manipulation
-            root_path = Path(root)
-            
-            # Check if the current directory should be excluded by checking all parts
-            # This handles nested directories within excluded directories (like .git/hooks/*)
-            is_excluded_path = False
-            for part in root_path.parts:
-                if part in self.exclusions:
-                    is_excluded_path = True
-                    break
-            
-            if is_excluded_path:
-                # Skip this directory entirely
-                dirs[:] = []  # Clear dirs to prevent further traversal into this path
-                continue
-            
-            # Apply directory exclusions (modify dirs in-place to skip excluded directories)
-            dirs[:] = [d for d in dirs if not self._is_excluded_dir(d)]
-            
-            # Add files that aren't excluded
-            for file in files:
-                file_path = root_path / file
-                all_files.append(file_path)
+        # Skip the scan entirely if the repository itself lives inside an excluded
+        # directory; below the root, excluded directories are pruned by name
+        if any(part in self.exclusions for part in Path(repo_path).parts):
+            return all_files
+        
+        self._scan_directory(str(repo_path), all_files)
         
         return all_files
     
+    def _scan_directory(self, dir_path: str, all_files: List[Path]) -> None:
+        """
+        Recursively collect files below a directory using os.scandir.
+        
+        Directory entries carry their file type from the directory listing, so
+        telling files from directories does not need a separate stat call.
+        Files are collected before descending, matching a top-down os.walk.
+        
+        Args:
+            dir_path: Directory to scan
+            all_files: List to append discovered file paths to
+        """
+        try:
+            with os.scandir(dir_path) as entries:
+                subdirs = []
+                for entry in entries:
+                    try:
+                        is_dir = entry.is_dir()
+                    except OSError:
+                        is_dir = False
+                    
+                    if not is_dir:
+                        all_files.append(Path(entry.path))
+                    elif not entry.is_symlink() and not self._is_excluded_dir(entry.name):
+                        subdirs.append(entry.path)
+        except OSError as e:
+            # Unreadable directories are skipped, as os.walk does by default
+            logger.debug(f"Skipping unreadable directory {dir_path}: {str(e)}")
+            return
+        
+        for subdir in subdirs:
+            self._scan_directory(subdir, all_files)
+    
     def _filter_files(self, files: List[Path], repo_path: Path) -> List[Tuple[Path, bool]]:
         """
         Filter files based on exclusion patterns and file size.
@@ -401,7 +491,7 @@ class RepositoryScanner:
         
         try:
             # Use run_in_executor to offload blocking I/O
-            loop = asyncio.get_event_loop()
+            loop = asyncio.get_running_loop()
             result = await loop.run_in_executor(
                 None, self.analyzer.analyze_file, file_path
             )
@@ -462,17 +552,8 @@ class RepositoryScanner:
         Returns:
             True if the directory should be excluded
         """
-        # VCS and package directories are specified without wildcards in the exclusion list
-        for pattern in self.exclusions:
-            # Skip patterns with wildcards - they're for file extensions, not directories
-            if "*" in pattern:
-                continue
-                
-            # Exact directory name match
-            if pattern == dir_name:
-                return True
-        
-        return False
+        dir_names, _, _, regexes = _split_exclusions(tuple(self.exclusions))
+        return dir_name in dir_names or any(regex.match(dir_name) for regex in regexes)
     
     def _is_excluded_file(self, file_path: Path) -> bool:
         """
@@ -485,18 +566,12 @@ class RepositoryScanner:
             True if the file should be excluded
         """
         file_name = file_path.name
-        
-        # Check against filename/extension patterns
-        for pattern in self.exclusions:
-            if pattern.startswith("*"):
-                # It's an extension pattern like "*.exe"
-                if file_name.endswith(pattern[1:]):
-                    return True
-            elif pattern == file_name:
-                # Exact filename match
-                return True
-        
-        return False
+        _, file_names, suffixes, regexes = _split_exclusions(tuple(self.exclusions))
+        return (
+            file_name in file_names
+            or file_name.endswith(suffixes)
+            or any(regex.match(file_name) for regex in regexes)
+        )
     
     def _is_priority_file(self, file_path: Path, repo_path: Path) -> bool:
         """
@@ -510,24 +585,16 @@ class RepositoryScanner:
             True if the file is a priority
         """
         file_name = file_path.name
-        relative_path = os.path.relpath(file_path, repo_path)
-        
-        for pattern in self.priority_patterns:
-            if pattern.startswith("*") and file_name.endswith(pattern[1:]):
-                # Extension pattern
-                return True
-            elif pattern.endswith("*") and file_name.startswith(pattern[:-1]):
-                # Prefix pattern
-                return True
-            elif "*" in pattern:
-                # Path pattern with wildcard
-                if glob.fnmatch.fnmatch(relative_path, pattern):
-                    return True
-            elif pattern == file_name:
-                # Exact match
-                return True
-        
-        return False
+        names, suffixes, prefixes, path_patterns = _split_priority_patterns(
+            tuple(self.priority_patterns)
+        )
+        if file_name in names or file_name.endswith(suffixes) or file_name.startswith(prefixes):
+            return True
+        if not path_patterns:
+            return False
+        
+        relative_path = os.path.normcase(os.path.relpath(file_path, repo_path))
+        return any(pattern.match(relative_path) for pattern in path_patterns)
     
     def _reset_stats(self) -> None:
         """Reset the statistics dictionary."""
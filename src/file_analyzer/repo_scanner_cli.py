@@ -158,12 +158,9 @@ def main() -> int:
         # Run scan
         if args.use_async:
             logger.info("Using asynchronous processing")
-            # Create event loop and run async scan
-            if sys.platform == 'win32':
-                asyncio.set_event_loop_policy(asyncio.WindowsSelectorEventLoopPolicy())
-            
-            loop = asyncio.get_event_loop()
-            results = loop.run_until_complete(scanner.scan_repository_async(repo_path))
+            # Run async scan on a fresh event loop; the scan only offloads
+            # work to executor threads, so the platform default loop is enough
+            results = asyncio.run(scanner.scan_repository_async(repo_path))
         else:
             # Run synchronous scan
             results = scanner.scan_repository(repo_path)
@@ -86,6 +86,7 @@ class TestInMemoryCache:
         assert cache.stats["sets"] == 3
         assert cache.stats["hits"] == 3
     
+    @pytest.mark.slow
     def test_ttl_expiration(self):
         """Test that items expire after the TTL."""
         # Arrange
@@ -132,6 +133,22 @@ class TestInMemoryCache:
         assert cache.stats["hits"] == 2
         assert cache.stats["misses"] == 1
     
+    def test_default_max_size_eviction(self):
+        """Test that the default cache is bounded and evicts the oldest item."""
+        # Arrange
+        cache = InMemoryCache()
+        max_size = InMemoryCache.DEFAULT_MAX_SIZE
+        
+        # Act
+        for i in range(max_size + 1):
+            cache.set(f"key{i}", {"index": i})
+        
+        # Assert
+        assert len(cache.cache) == max_size
+        assert cache.get("key0") is None
+        assert cache.get(f"key{max_size}") == {"index": max_size}
+        assert cache.stats["evictions"] == 1
+    
     def test_get_stats(self):
         """Test getting cache statistics."""
         # Arrange
@@ -235,6 +252,18 @@ class TestSqliteCache:
         
         conn.close()
     
+    def test_wal_journal_mode(self, db_path):
+        """Test that the database is switched to write-ahead logging."""
+        # Arrange & Act
+        SqliteCache(db_path)
+        conn = sqlite3.connect(str(db_path))
+        
+        # Assert
+        try:
+            assert conn.execute("PRAGMA journal_mode").fetchone()[0] == "wal"
+        finally:
+            conn.close()
+    
     def test_set_and_get(self, db_path):
         """Test setting and retrieving a value."""
         # Arrange
@@ -260,6 +289,7 @@ class TestSqliteCache:
         # Assert
         assert result is None
     
+    @pytest.mark.slow
     def test_ttl_expiration(self, db_path):
         """Test that items expire after the TTL."""
         # Arrange
@@ -400,6 +430,7 @@ class TestFileSystemCache:
         # Assert
         assert result is None
     
+    @pytest.mark.slow
     def test_ttl_expiration(self, cache_dir):
         """Test that items expire after the TTL."""
         # Arrange
@@ -16,6 +16,43 @@ from file_analyzer.core.cache_config import get_cache_settings
 from file_analyzer.ai_providers.mock_provider import MockAIProvider
 
 
+@pytest.fixture(scope="class")
+def test_files():
+    """Create temporary test files shared by every test in the class.
+    
+    The tests only read these files, so the tree is built once per class.
+    """
+    with tempfile.TemporaryDirectory() as tempdir:
+        # Create Python file
+        py_path = Path(tempdir) / "test.py"
+        with open(py_path, "w") as f:
+            f.write("def test(): print('Hello, world!')")
+        
+        # Create Markdown file
+        md_path = Path(tempdir) / "README.md"
+        with open(md_path, "w") as f:
+            f.write("# Test Markdown\n\nThis is a test file.")
+        
+        # Create JSON file
+        json_path = Path(tempdir) / "config.json"
+        with open(json_path, "w") as f:
+            f.write('{"name": "test", "version": "1.0.0"}')
+        
+        # Create directory structure for testing path exclusions
+        os.makedirs(Path(tempdir) / ".git")
+        git_file = Path(tempdir) / ".git" / "HEAD"
+        with open(git_file, "w") as f:
+            f.write("ref: refs/heads/main")
+        
+        yield {
+            "dir": Path(tempdir),
+            "py": py_path,
+            "md": md_path,
+            "json": json_path,
+            "git": git_file
+        }
+
+
 class TestCacheIntegration:
     """Test integration of the caching system with the file type analyzer."""
     
@@ -24,39 +61,6 @@ class TestCacheIntegration:
         """Create a mock AI provider for testing."""
         return MockAIProvider()
     
-    @pytest.fixture
-    def test_files(self):
-        """Create temporary test files for analysis."""
-        with tempfile.TemporaryDirectory() as tempdir:
-            # Create Python file
-            py_path = Path(tempdir) / "test.py"
-            with open(py_path, "w") as f:
-                f.write("def test(): print('Hello, world!')")
-            
-            # Create Markdown file
-            md_path = Path(tempdir) / "README.md"
-            with open(md_path, "w") as f:
-                f.write("# Test Markdown\n\nThis is a test file.")
-            
-            # Create JSON file
-            json_path = Path(tempdir) / "config.json"
-            with open(json_path, "w") as f:
-                f.write('{"name": "test", "version": "1.0.0"}')
-            
-            # Create directory structure for testing path exclusions
-            os.makedirs(Path(tempdir) / ".git")
-            git_file = Path(tempdir) / ".git" / "HEAD"
-            with open(git_file, "w") as f:
-                f.write("ref: refs/heads/main")
-            
-            yield {
-                "dir": Path(tempdir),
-                "py": py_path,
-                "md": md_path,
-                "json": json_path,
-                "git": git_file
-            }
-    
     def test_memory_cache_integration(self, mock_provider, test_files):
         """Test integration with in-memory cache."""
         # Create analyzer with memory cache
@@ -151,47 +155,74 @@ class TestCacheIntegration:
     
     def test_tiered_cache_integration(self, mock_provider, test_files):
         """Test integration with tiered cache."""
+        # In-memory tiers keep the tiering logic under test without the
+        # setup cost of the persistent backends
+        memory_cache = InMemoryCache()
+        slower_cache = InMemoryCache()
+        cache_manager = CacheManager([memory_cache, slower_cache])
+        
+        analyzer = FileTypeAnalyzer(
+            ai_provider=mock_provider,
+            cache_provider=cache_manager
+        )
+        
+        # First analysis (should miss all caches)
+        result1 = analyzer.analyze_file(test_files["py"])
+        
+        # Second analysis (should hit memory cache)
+        result2 = analyzer.analyze_file(test_files["py"])
+        
+        # Check results match
+        assert result1 == result2
+        
+        # Memory cache should have a hit, the slower tier should have no hits
+        assert memory_cache.stats["hits"] == 1
+        assert slower_cache.stats["hits"] == 0
+        
+        # Both caches should have the item stored
+        assert len(memory_cache.cache) == 1
+        assert len(slower_cache.cache) == 1
+        
+        # A hit in the slower tier is propagated back to the memory cache
+        memory_cache.clear()
+        before = slower_cache.get_stats()
+        result3 = analyzer.analyze_file(test_files["py"])
+        after = slower_cache.get_stats()
+        
+        assert result1 == result3
+        assert after["hits"] - before["hits"] == 1
+        assert len(memory_cache.cache) == 1
+    
+    def test_sqlite_cache_persistence(self, mock_provider, test_files):
+        """Test that SQLite cache entries survive a new cache instance."""
         with tempfile.TemporaryDirectory() as tempdir:
             db_path = Path(tempdir) / "cache.db"
             
-            # Create tiered cache
-            memory_cache = InMemoryCache()
-            sqlite_cache = SqliteCache(db_path=db_path)
-            cache_manager = CacheManager([memory_cache, sqlite_cache])
-            
             analyzer = FileTypeAnalyzer(
                 ai_provider=mock_provider,
-                cache_provider=cache_manager
+                cache_provider=SqliteCache(db_path=db_path)
             )
-            
-            # First analysis (should miss all caches)
             result1 = analyzer.analyze_file(test_files["py"])
             
-            # Second analysis (should hit memory cache)
-            result2 = analyzer.analyze_file(test_files["py"])
-            
-            # Check results match
-            assert result1 == result2
-            
-            # Memory cache should have a hit, SQLite should have no hits
-            assert memory_cache.stats["hits"] == 1
-            assert sqlite_cache.stats["hits"] == 0
-            
-            # Both caches should have the item stored
-            assert len(memory_cache.cache) == 1
-            
-            # Create new analyzer with just SQLite cache to test persistence
+            # Create new analyzer with a fresh SQLite cache on the same file
+            new_cache = SqliteCache(db_path=db_path)
             new_analyzer = FileTypeAnalyzer(
                 ai_provider=mock_provider,
-                cache_provider=SqliteCache(db_path=db_path)
+                cache_provider=new_cache
             )
             
-            # This analysis should hit the SQLite cache
-            result3 = new_analyzer.analyze_file(test_files["py"])
+            # This analysis should hit the SQLite cache; the statistics are
+            # persisted too, so compare snapshots rather than totals
+            before = new_cache.get_stats()
+            result2 = new_analyzer.analyze_file(test_files["py"])
+            after = new_cache.get_stats()
             
             # Results should still match
-            assert result1 == result3
+            assert result1 == result2
+            assert after["hits"] - before["hits"] == 1
+            assert after["sets"] - before["sets"] == 0
     
+    @pytest.mark.slow
     def test_cache_ttl_expiration(self, mock_provider, test_files):
         """Test TTL expiration in the cache."""
         # Use short TTL for testing
@@ -277,7 +308,7 @@ class TestCacheIntegration:
         # Different caches may have different stat names, but we should have some hit stats
         assert stats.get("hit", 0) >= 1 or "provider" in stats
     
-    def test_pre_warming(self, mock_provider):
+    def test_pre_warming(self, mock_provider, tmp_path):
         """Test pre-warming the cache."""
         cache = InMemoryCache()
         
@@ -314,19 +345,18 @@ class TestCacheIntegration:
         
         # We can't directly test retrieving the warmed-up values because
         # they are keyed by file hash, but we can verify the cache is functioning
-        with tempfile.NamedTemporaryFile(suffix=".py", mode="w+") as tf:
-            tf.write("def test(): pass")
-            tf.flush()
-            
-            # First analysis (cache miss)
-            result1 = analyzer.analyze_file(tf.name)
-            
-            # Second analysis (cache hit)
-            result2 = analyzer.analyze_file(tf.name)
-            
-            assert result1 == result2
-            
-            # Check cache statistics
-            stats = analyzer.get_cache_stats()
-            assert stats["hit"] == 1
-            assert stats["miss"] == 1
\ No newline at end of file
+        filepath = tmp_path / "test.py"
+        filepath.write_text("def test(): pass")
+        
+        # First analysis (cache miss)
+        result1 = analyzer.analyze_file(filepath)
+        
+        # Second analysis (cache hit)
+        result2 = analyzer.analyze_file(filepath)
+        
+        assert result1 == result2
+        
+        # Check cache statistics
+        stats = analyzer.get_cache_stats()
+        assert stats["hit"] == 1
+        assert stats["miss"] == 1
\ No newline at end of file
@@ -0,0 +1,63 @@
+"""
+Shared fixtures and stubs for the documentation generator tests.
+"""
+from unittest.mock import MagicMock
+import pytest
+
+from file_analyzer.ai_providers.mock_provider import MockAIProvider
+from file_analyzer.core.file_hasher import FileHasher
+
+
+class _NoopCache:
+    """Cache provider stand-in that never stores anything."""
+
+    def get(self, key):
+        return None
+
+    def set(self, key, value):
+        pass
+
+
+class _FakeFileReader:
+    """Minimal FileReader stand-in; tests replace read_file where they need it."""
+
+    def read_file(self, file_path):
+        return ""
+
+
+@pytest.fixture(scope="session")
+def noop_cache():
+    """Create a cache provider that never stores anything."""
+    return _NoopCache()
+
+
+@pytest.fixture(scope="module")
+def mock_provider():
+    """Create the AI provider shared by the module."""
+    return MockAIProvider()
+
+
+@pytest.fixture(scope="module")
+def file_hasher():
+    """Create the file hasher shared by the module."""
+    return FileHasher()
+
+
+@pytest.fixture
+def file_reader():
+    """Create a stub file reader for a single test."""
+    return _FakeFileReader()
+
+
+@pytest.fixture
+def bare_generator():
+    """Return a factory for view generators used to test generate_diagram dispatch."""
+    def build(generator_cls, **diagram_results):
+        # generate_diagram only dispatches and counts, so skip the full constructor
+        generator = object.__new__(generator_cls)
+        generator.stats = {"diagrams_generated": 0}
+        for method_name, result in diagram_results.items():
+            setattr(generator, method_name, MagicMock(return_value=result))
+        return generator
+
+    return build
@@ -3,7 +3,6 @@ Unit tests for the documentation generator CLI.
 """
 import os
 import sys
-import tempfile
 from unittest.mock import patch, MagicMock
 import pytest
 
@@ -99,22 +98,17 @@ class TestCLI:
         provider = create_ai_provider("openai", "test-param-key", "custom-model")
         assert isinstance(provider, OpenAIProvider)
     
-    def test_load_analysis_results(self):
+    def test_load_analysis_results(self, tmp_path):
         """Test loading analysis results from a file."""
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as tmp:
-            tmp.write('{"test": "data"}')
-            tmp_path = tmp.name
+        analysis_file = tmp_path / "analysis.json"
+        analysis_file.write_text('{"test": "data"}')
         
-        try:
-            result = load_analysis_results(tmp_path)
-            assert result == {"test": "data"}
-            
-            # Test with invalid file
-            with pytest.raises(SystemExit):
-                load_analysis_results("/non/existent/file.json")
-                
-        finally:
-            os.unlink(tmp_path)
+        result = load_analysis_results(analysis_file)
+        assert result == {"test": "data"}
+        
+        # Test with invalid file
+        with pytest.raises(SystemExit):
+            load_analysis_results("/non/existent/file.json")
     
     @patch('file_analyzer.doc_generator.cli.generate_documentation')
     @patch('file_analyzer.doc_generator.cli.load_analysis_results')
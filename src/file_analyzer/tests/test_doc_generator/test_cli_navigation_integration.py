@@ -55,6 +55,7 @@ def sample_repo_analysis():
     }
 
 
+@pytest.mark.slow
 class TestCliNavigationIntegration:
     """Test suite for CLI integration with DocumentationNavigationManager."""
     
@@ -72,6 +73,10 @@ class TestCliNavigationIntegration:
             mock_args = MagicMock()
             mock_args.analysis_file = "analysis.json"
             mock_args.output_dir = tmpdir
+            # Keep cache, diagram and assembly output inside the temporary directory
+            mock_args.cache_dir = None
+            mock_args.diagram_output_dir = None
+            mock_args.assembly_output_dir = None
             mock_args.template_dir = None
             mock_args.no_code_snippets = False
             mock_args.max_code_lines = 15
@@ -141,6 +146,10 @@ class TestCliNavigationIntegration:
             mock_args = MagicMock()
             mock_args.analysis_file = "analysis.json"
             mock_args.output_dir = tmpdir
+            # Keep cache, diagram and assembly output inside the temporary directory
+            mock_args.cache_dir = None
+            mock_args.diagram_output_dir = None
+            mock_args.assembly_output_dir = None
             mock_args.template_dir = None
             mock_args.no_code_snippets = False
             mock_args.max_code_lines = 15
@@ -204,6 +213,10 @@ class TestCliNavigationIntegration:
             mock_args = MagicMock()
             mock_args.analysis_file = "analysis.json"
             mock_args.output_dir = tmpdir
+            # Keep cache, diagram and assembly output inside the temporary directory
+            mock_args.cache_dir = None
+            mock_args.diagram_output_dir = None
+            mock_args.assembly_output_dir = None
             mock_args.template_dir = None
             mock_args.no_code_snippets = False
             mock_args.max_code_lines = 15
@@ -84,6 +84,10 @@ class TestCliStructureIntegration:
             mock_args = MagicMock()
             mock_args.analysis_file = "analysis.json"
             mock_args.output_dir = tmpdir
+            # Keep cache, diagram and assembly output inside the temporary directory
+            mock_args.cache_dir = None
+            mock_args.diagram_output_dir = None
+            mock_args.assembly_output_dir = None
             mock_args.template_dir = None
             mock_args.no_code_snippets = False
             mock_args.max_code_lines = 15
@@ -147,6 +151,10 @@ class TestCliStructureIntegration:
             mock_args = MagicMock()
             mock_args.analysis_file = "analysis.json"
             mock_args.output_dir = tmpdir
+            # Keep cache, diagram and assembly output inside the temporary directory
+            mock_args.cache_dir = None
+            mock_args.diagram_output_dir = None
+            mock_args.assembly_output_dir = None
             mock_args.template_dir = None
             mock_args.no_code_snippets = False
             mock_args.max_code_lines = 15
@@ -203,6 +211,10 @@ class TestCliStructureIntegration:
             mock_args = MagicMock()
             mock_args.analysis_file = "analysis.json"
             mock_args.output_dir = tmpdir
+            # Keep cache, diagram and assembly output inside the temporary directory
+            mock_args.cache_dir = None
+            mock_args.diagram_output_dir = None
+            mock_args.assembly_output_dir = None
             mock_args.template_dir = None
             mock_args.no_code_snippets = False
             mock_args.max_code_lines = 15
@@ -1,5 +1,3 @@
-import os
-import tempfile
 import pytest
 from pathlib import Path
 from unittest.mock import MagicMock, patch
@@ -122,44 +120,39 @@ class TestConfigDocumentationGenerator:
         assert config_generator.relationship_mapper == mock_relationship_mapper
         assert config_generator.file_reader is not None
     
-    def test_generate_config_documentation(self, config_generator, mock_relationship_mapper):
+    def test_generate_config_documentation(self, config_generator, mock_relationship_mapper, tmp_path):
         """Test generating documentation for a config file."""
-        # Create a temporary config file
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as temp_file:
-            temp_file.write(b'{"app": {"name": "TestApp"}, "database": {"host": "localhost"}}')
-            temp_path = temp_file.name
+        # Create a config file
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(b'{"app": {"name": "TestApp"}, "database": {"host": "localhost"}}')
         
-        try:
-            # Generate documentation
-            result = config_generator.generate_config_documentation(temp_path)
-            
-            # Check that relationship mapper was called
-            mock_relationship_mapper.map_config_to_code_relationships.assert_called_once()
-            
-            # Check that the result contains expected sections
-            assert "variables" in result
-            assert "environment_vars" in result
-            assert "env_var_descriptions" in result
-            assert "param_usage" in result
-            
-            # Check variables are formatted correctly
-            assert len(result["variables"]) == 4
-            assert any(var["name"] == "app.name" for var in result["variables"])
-            assert any(var["name"] == "database.host" for var in result["variables"])
-            
-            # Check environment variables
-            assert "${DB_PASSWORD}" in result["environment_vars"]
-            assert "${DB_PASSWORD}" in result["env_var_descriptions"]
-            
-            # Check parameter usage mapping
-            assert "param_usage" in result
-            assert isinstance(result["param_usage"], dict)
-            
-            # Check AI documentation
-            assert "ai_documentation" in result
-        finally:
-            # Clean up temp file
-            os.unlink(temp_path)
+        # Generate documentation
+        result = config_generator.generate_config_documentation(config_path)
+        
+        # Check that relationship mapper was called
+        mock_relationship_mapper.map_config_to_code_relationships.assert_called_once()
+        
+        # Check that the result contains expected sections
+        assert "variables" in result
+        assert "environment_vars" in result
+        assert "env_var_descriptions" in result
+        assert "param_usage" in result
+        
+        # Check variables are formatted correctly
+        assert len(result["variables"]) == 4
+        assert any(var["name"] == "app.name" for var in result["variables"])
+        assert any(var["name"] == "database.host" for var in result["variables"])
+        
+        # Check environment variables
+        assert "${DB_PASSWORD}" in result["environment_vars"]
+        assert "${DB_PASSWORD}" in result["env_var_descriptions"]
+        
+        # Check parameter usage mapping
+        assert "param_usage" in result
+        assert isinstance(result["param_usage"], dict)
+        
+        # Check AI documentation
+        assert "ai_documentation" in result
     
     def test_generate_parameter_documentation(self, config_generator):
         """Test generating documentation for parameters."""
@@ -208,38 +201,33 @@ class TestConfigDocumentationGenerator:
         assert host_doc
         assert isinstance(host_doc, str)
     
-    def test_convenience_function(self, mock_ai_provider, mock_relationship_mapper):
+    def test_convenience_function(self, mock_ai_provider, mock_relationship_mapper, tmp_path):
         """Test the convenience function for generating config documentation."""
-        # Create a temporary config file
-        with tempfile.NamedTemporaryFile(suffix='.json', delete=False) as temp_file:
-            temp_file.write(b'{"app": {"name": "TestApp"}}')
-            temp_path = temp_file.name
+        # Create a config file
+        config_path = tmp_path / "config.json"
+        config_path.write_bytes(b'{"app": {"name": "TestApp"}}')
         
-        try:
-            # Use the convenience function
-            with patch('file_analyzer.doc_generator.config_documentation_generator.ConfigDocumentationGenerator') as MockGenerator:
-                # Setup the mock to return a simple result
-                mock_instance = MockGenerator.return_value
-                mock_instance.generate_config_documentation.return_value = {"variables": [{"name": "app.name"}]}
-                
-                # Call the convenience function
-                result = generate_config_file_documentation(
-                    config_file_path=temp_path,
-                    relationship_mapper=mock_relationship_mapper,
-                    ai_provider=mock_ai_provider
-                )
-                
-                # Verify the generator was initialized correctly
-                MockGenerator.assert_called_once_with(
-                    ai_provider=mock_ai_provider,
-                    relationship_mapper=mock_relationship_mapper
-                )
-                
-                # Verify generate_config_documentation was called
-                mock_instance.generate_config_documentation.assert_called_once_with(temp_path)
-                
-                # Check the result
-                assert "variables" in result
-        finally:
-            # Clean up temp file
-            os.unlink(temp_path)
\ No newline at end of file
+        # Use the convenience function
+        with patch('file_analyzer.doc_generator.config_documentation_generator.ConfigDocumentationGenerator') as MockGenerator:
+            # Setup the mock to return a simple result
+            mock_instance = MockGenerator.return_value
+            mock_instance.generate_config_documentation.return_value = {"variables": [{"name": "app.name"}]}
+            
+            # Call the convenience function
+            result = generate_config_file_documentation(
+                config_file_path=config_path,
+                relationship_mapper=mock_relationship_mapper,
+                ai_provider=mock_ai_provider
+            )
+            
+            # Verify the generator was initialized correctly
+            MockGenerator.assert_called_once_with(
+                ai_provider=mock_ai_provider,
+                relationship_mapper=mock_relationship_mapper
+            )
+            
+            # Verify generate_config_documentation was called
+            mock_instance.generate_config_documentation.assert_called_once_with(config_path)
+            
+            # Check the result
+            assert "variables" in result
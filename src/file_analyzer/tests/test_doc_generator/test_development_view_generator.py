@@ -2,7 +2,7 @@
 Unit tests for the development view generator.
 """
 import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock, create_autospec, patch
 from pathlib import Path
 import os
 import tempfile
@@ -13,6 +13,9 @@ from file_analyzer.core.file_reader import FileReader
 from file_analyzer.core.file_hasher import FileHasher
 from file_analyzer.core.cache_provider import InMemoryCache
 
+# FileReader spec is introspected once; setUp resets the mock between tests
+_FILE_READER = create_autospec(FileReader, instance=True, spec_set=True)
+
 class TestDevelopmentViewGenerator(unittest.TestCase):
     """Test case for the DevelopmentViewGenerator class."""
     
@@ -20,7 +23,8 @@ class TestDevelopmentViewGenerator(unittest.TestCase):
         """Set up test fixtures."""
         self.mock_provider = MockAIProvider()
         self.cache = InMemoryCache()
-        self.file_reader = MagicMock(spec=FileReader)
+        _FILE_READER.reset_mock(return_value=True, side_effect=True)
+        self.file_reader = _FILE_READER
         self.file_hasher = FileHasher()
         
         # Create mock code analyzer
@@ -17,6 +17,10 @@ from file_analyzer.doc_generator.documentation_assembler import (
     DocumentationCompressor
 )
 
+# Minimal image payloads for the compressor tests
+_MIN_PNG = b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82"
+_MIN_JPEG_HEADER = b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00H\x00H\x00\x00\xff\xdb\x00C\x00\x08\x06\x06\x07\x06\x05\x08\x07\x07\x07\t\t\x08\n\x0c\x14\r\x0c\x0b\x0b\x0c\x19\x12\x13\x0f\x14\x1d\x1a\x1f\x1e\x1d\x1a\x1c\x1c $.' \",#\x1c\x1c(7),01444\x1f'9=82<.342"
+
 
 class TestAssemblyConfig:
     """Test suite for AssemblyConfig."""
@@ -376,7 +380,7 @@ class TestDocumentationCompressor:
             
             # Create a dummy image file
             with open(os.path.join(tmpdir, "img.png"), "wb") as f:
-                f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82")
+                f.write(_MIN_PNG)
             
             # Create compressor
             compressor = DocumentationCompressor(tmpdir)
@@ -396,10 +400,10 @@ class TestDocumentationCompressor:
         with tempfile.TemporaryDirectory() as tmpdir:
             # Create dummy image files
             with open(os.path.join(tmpdir, "img1.png"), "wb") as f:
-                f.write(b"\x89PNG\r\n\x1a\n\x00\x00\x00\rIHDR\x00\x00\x00\x01\x00\x00\x00\x01\x08\x06\x00\x00\x00\x1f\x15\xc4\x89\x00\x00\x00\nIDATx\x9cc\x00\x01\x00\x00\x05\x00\x01\r\n-\xb4\x00\x00\x00\x00IEND\xaeB`\x82")
+                f.write(_MIN_PNG)
             
             with open(os.path.join(tmpdir, "img2.jpg"), "wb") as f:
-                f.write(b"\xff\xd8\xff\xe0\x00\x10JFIF\x00\x01\x01\x01\x00H\x00H\x00\x00\xff\xdb\x00C\x00\x08\x06\x06\x07\x06\x05\x08\x07\x07\x07\t\t\x08\n\x0c\x14\r\x0c\x0b\x0b\x0c\x19\x12\x13\x0f\x14\x1d\x1a\x1f\x1e\x1d\x1a\x1c\x1c $.' \",#\x1c\x1c(7),01444\x1f'9=82<.342")
+                f.write(_MIN_JPEG_HEADER)
             
             # Create compressor
             compressor = DocumentationCompressor(tmpdir)
@@ -6,15 +6,82 @@ documentation including table of contents, breadcrumbs, cross-references,
 and section navigation.
 """
 import os
-import tempfile
+import re
 import pytest
 from unittest.mock import MagicMock, patch
 
 from file_analyzer.doc_generator.documentation_navigation_manager import (
     DocumentationNavigationManager,
+    DocNode,
     NavigationConfig
 )
 
+# Navigation markers checked in a single pass over generated documents
+_NAV_MARKERS_RE = re.compile(r'Table of Contents|Breadcrumbs|Description')
+
+# Sample documentation structure shared by the tests
+_SAMPLE_DOC_STRUCTURE = {
+    "index.md": DocNode(
+        title="Repository Documentation",
+        path="index.md",
+        headings=(
+            (1, "Repository Documentation"),
+            (2, "Overview"),
+            (2, "Modules"),
+            (2, "Key Files"),
+        ),
+        children=("src/index.md", "config/index.md"),
+    ),
+    "src/index.md": DocNode(
+        title="Source Code",
+        path="src/index.md",
+        headings=((1, "Source Code"), (2, "Overview"), (2, "Files")),
+        children=("src/main.md", "src/utils.md"),
+        parent="index.md",
+    ),
+    "src/main.md": DocNode(
+        title="main.py",
+        path="src/main.md",
+        headings=(
+            (1, "main.py"),
+            (2, "Description"),
+            (2, "Usage"),
+            (2, "Functions"),
+        ),
+        parent="src/index.md",
+        related_files=("src/utils.md",),
+    ),
+    "src/utils.md": DocNode(
+        title="utils.py",
+        path="src/utils.md",
+        headings=(
+            (1, "utils.py"),
+            (2, "Description"),
+            (2, "Classes"),
+            (2, "Functions"),
+        ),
+        parent="src/index.md",
+        related_files=("src/main.md",),
+    ),
+    "config/index.md": DocNode(
+        title="Configuration",
+        path="config/index.md",
+        headings=((1, "Configuration"), (2, "Overview"), (2, "Files")),
+        children=("config/settings.md",),
+        parent="index.md",
+    ),
+    "config/settings.md": DocNode(
+        title="settings.json",
+        path="config/settings.md",
+        headings=(
+            (1, "settings.json"),
+            (2, "Description"),
+            (2, "Configuration Options"),
+        ),
+        parent="config/index.md",
+    ),
+}
+
 class TestNavigationConfig:
     """Test suite for NavigationConfig."""
     
@@ -62,75 +129,7 @@ class TestDocumentationNavigationManager:
     @pytest.fixture
     def sample_doc_structure(self):
         """Sample documentation structure for testing."""
-        return {
-            "index.md": {
-                "title": "Repository Documentation",
-                "path": "index.md",
-                "headings": [
-                    {"level": 1, "text": "Repository Documentation"},
-                    {"level": 2, "text": "Overview"},
-                    {"level": 2, "text": "Modules"},
-                    {"level": 2, "text": "Key Files"}
-                ],
-                "children": ["src/index.md", "config/index.md"]
-            },
-            "src/index.md": {
-                "title": "Source Code",
-                "path": "src/index.md",
-                "headings": [
-                    {"level": 1, "text": "Source Code"},
-                    {"level": 2, "text": "Overview"},
-                    {"level": 2, "text": "Files"}
-                ],
-                "children": ["src/main.md", "src/utils.md"],
-                "parent": "index.md"
-            },
-            "src/main.md": {
-                "title": "main.py",
-                "path": "src/main.md",
-                "headings": [
-                    {"level": 1, "text": "main.py"},
-                    {"level": 2, "text": "Description"},
-                    {"level": 2, "text": "Usage"},
-                    {"level": 2, "text": "Functions"}
-                ],
-                "parent": "src/index.md",
-                "related_files": ["src/utils.md"]
-            },
-            "src/utils.md": {
-                "title": "utils.py",
-                "path": "src/utils.md",
-                "headings": [
-                    {"level": 1, "text": "utils.py"},
-                    {"level": 2, "text": "Description"},
-                    {"level": 2, "text": "Classes"},
-                    {"level": 2, "text": "Functions"}
-                ],
-                "parent": "src/index.md",
-                "related_files": ["src/main.md"]
-            },
-            "config/index.md": {
-                "title": "Configuration",
-                "path": "config/index.md",
-                "headings": [
-                    {"level": 1, "text": "Configuration"},
-                    {"level": 2, "text": "Overview"},
-                    {"level": 2, "text": "Files"}
-                ],
-                "children": ["config/settings.md"],
-                "parent": "index.md"
-            },
-            "config/settings.md": {
-                "title": "settings.json",
-                "path": "config/settings.md",
-                "headings": [
-                    {"level": 1, "text": "settings.json"},
-                    {"level": 2, "text": "Description"},
-                    {"level": 2, "text": "Configuration Options"}
-                ],
-                "parent": "config/index.md"
-            }
-        }
+        return _SAMPLE_DOC_STRUCTURE
     
     @pytest.fixture
     def sample_doc_content(self):
@@ -147,6 +146,24 @@ class TestDocumentationNavigationManager:
         assert manager.config.output_dir == "/tmp/docs"
         assert manager.config.include_breadcrumbs is True
     
+    def test_generate_toc_from_dict_metadata(self):
+        """Test that dict metadata is still accepted alongside DocNode records."""
+        config = NavigationConfig(output_dir="/tmp/docs")
+        manager = DocumentationNavigationManager(config)
+        
+        document = {
+            "title": "main.py",
+            "path": "src/main.md",
+            "headings": [
+                {"level": 1, "text": "main.py"},
+                {"level": 2, "text": "Description"}
+            ]
+        }
+        toc = manager.generate_toc(document)
+        
+        assert "- [Description](#description)" in toc
+        assert "main.py" not in toc
+    
     def test_generate_toc(self, sample_doc_structure):
         """Test generation of table of contents."""
         config = NavigationConfig(output_dir="/tmp/docs")
@@ -241,36 +258,35 @@ class TestDocumentationNavigationManager:
         
         result = manager.add_navigation_to_document(content, document, sample_doc_structure)
         
-        assert "Table of Contents" not in result
-        assert "Breadcrumbs" not in result
-        assert "Description" in result  # Original content still there
+        # Only the original content should remain
+        markers = {m.group() for m in _NAV_MARKERS_RE.finditer(result)}
+        assert markers == {"Description"}
     
-    def test_process_documentation_structure(self, sample_doc_structure, sample_doc_content):
+    def test_process_documentation_structure(self, sample_doc_structure, sample_doc_content, tmp_path):
         """Test processing full documentation structure."""
-        with tempfile.TemporaryDirectory() as tmpdir:
-            config = NavigationConfig(output_dir=tmpdir)
-            manager = DocumentationNavigationManager(config)
-            
-            # Create a test document file
-            doc_path = os.path.join(tmpdir, "src/main.md")
-            os.makedirs(os.path.dirname(doc_path), exist_ok=True)
-            with open(doc_path, "w") as f:
-                f.write(sample_doc_content["src/main.md"])
-            
-            # Process the document
-            mock_structure = {
-                "file_path": doc_path,
-                "metadata": sample_doc_structure["src/main.md"]
-            }
-            
-            result = manager.process_documentation_structure([mock_structure], sample_doc_structure)
-            
-            assert result["total_files"] == 1
-            assert result["processed_files"] == 1
-            assert os.path.exists(doc_path)
-            
-            # Check the content of the processed file
-            with open(doc_path, "r") as f:
-                content = f.read()
-                assert "Table of Contents" in content
-                assert "Navigation" in content or "Breadcrumbs" in content
\ No newline at end of file
+        config = NavigationConfig(output_dir=str(tmp_path))
+        manager = DocumentationNavigationManager(config)
+        
+        # Create a test document file
+        doc_path = os.path.join(tmp_path, "src/main.md")
+        os.makedirs(os.path.dirname(doc_path), exist_ok=True)
+        with open(doc_path, "w") as f:
+            f.write(sample_doc_content["src/main.md"])
+        
+        # Process the document
+        mock_structure = {
+            "file_path": doc_path,
+            "metadata": sample_doc_structure["src/main.md"]
+        }
+        
+        result = manager.process_documentation_structure([mock_structure], sample_doc_structure)
+        
+        assert result["total_files"] == 1
+        assert result["processed_files"] == 1
+        assert os.path.exists(doc_path)
+        
+        # Check the content of the processed file
+        with open(doc_path, "r") as f:
+            content = f.read()
+            assert "Table of Contents" in content
+            assert "Navigation" in content or "Breadcrumbs" in content
\ No newline at end of file
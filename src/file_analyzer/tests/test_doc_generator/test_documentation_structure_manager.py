@@ -4,16 +4,87 @@ Tests for the DocumentationStructureManager class.
 This module tests the functionality for creating hierarchical and logical 
 documentation structure beyond simple directory-based organization.
 """
+import json
 import os
 import tempfile
 import pytest
 from unittest.mock import MagicMock, patch
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from file_analyzer.doc_generator.documentation_structure_manager import (
     DocumentationStructureManager,
     DocumentationStructureConfig
 )
 
+# Sample file analysis results, parsed once at import time
+_SAMPLE_FILE_RESULTS_JSON = r'''{
+    "/repo/src/core/main.py": {
+        "file_type": "code",
+        "language": "python",
+        "code_structure": {
+            "structure": {
+                "classes": [],
+                "functions": [{"name": "main"}],
+                "imports": ["from core.utils import helper"]
+            },
+            "documentation": "Main entry point for the application."
+        },
+        "frameworks": []
+    },
+    "/repo/src/core/utils/helper.py": {
+        "file_type": "code",
+        "language": "python",
+        "code_structure": {
+            "structure": {
+                "classes": [{"name": "Helper"}],
+                "functions": [{"name": "util_function"}],
+                "imports": []
+            },
+            "documentation": "Helper utilities for the application."
+        },
+        "frameworks": []
+    },
+    "/repo/src/api/routes.py": {
+        "file_type": "code",
+        "language": "python",
+        "code_structure": {
+            "structure": {
+                "classes": [],
+                "functions": [{"name": "get_data"}],
+                "imports": ["from core.utils.helper import util_function"]
+            },
+            "documentation": "API route definitions."
+        },
+        "frameworks": [{"name": "FastAPI"}]
+    },
+    "/repo/config/settings.json": {
+        "file_type": "config",
+        "language": "json",
+        "code_structure": {
+            "structure": {
+                "classes": [],
+                "functions": [],
+                "imports": []
+            },
+            "documentation": "Application configuration settings."
+        },
+        "frameworks": []
+    }
+}'''
+_SAMPLE_FILE_RESULTS = (
+    orjson.loads(_SAMPLE_FILE_RESULTS_JSON) if orjson
+    else json.loads(_SAMPLE_FILE_RESULTS_JSON)
+)
+
+
+def _basenames(paths):
+    """Return the set of file names for a collection of paths."""
+    return frozenset(os.path.basename(p) for p in paths)
+
 
 class TestDocumentationStructureManager:
     """Test suite for DocumentationStructureManager."""
@@ -21,60 +92,7 @@ class TestDocumentationStructureManager:
     @pytest.fixture
     def sample_file_results(self):
         """Sample file analysis results for testing."""
-        return {
-            "/repo/src/core/main.py": {
-                "file_type": "code",
-                "language": "python",
-                "code_structure": {
-                    "structure": {
-                        "classes": [],
-                        "functions": [{"name": "main"}],
-                        "imports": ["from core.utils import helper"]
-                    },
-                    "documentation": "Main entry point for the application."
-                },
-                "frameworks": []
-            },
-            "/repo/src/core/utils/helper.py": {
-                "file_type": "code",
-                "language": "python",
-                "code_structure": {
-                    "structure": {
-                        "classes": [{"name": "Helper"}],
-                        "functions": [{"name": "util_function"}],
-                        "imports": []
-                    },
-                    "documentation": "Helper utilities for the application."
-                },
-                "frameworks": []
-            },
-            "/repo/src/api/routes.py": {
-                "file_type": "code",
-                "language": "python",
-                "code_structure": {
-                    "structure": {
-                        "classes": [],
-                        "functions": [{"name": "get_data"}],
-                        "imports": ["from core.utils.helper import util_function"]
-                    },
-                    "documentation": "API route definitions."
-                },
-                "frameworks": [{"name": "FastAPI"}]
-            },
-            "/repo/config/settings.json": {
-                "file_type": "config",
-                "language": "json",
-                "code_structure": {
-                    "structure": {
-                        "classes": [],
-                        "functions": [],
-                        "imports": []
-                    },
-                    "documentation": "Application configuration settings."
-                },
-                "frameworks": []
-            }
-        }
+        return _SAMPLE_FILE_RESULTS
     
     @pytest.fixture
     def sample_relationships(self):
@@ -186,10 +204,7 @@ class TestDocumentationStructureManager:
         assert "src" in logical_groups
         
         # Check src module contents
-        src_files = [os.path.basename(f) for f in logical_groups["src"]]
-        assert any("main.py" in f for f in src_files)
-        assert any("helper.py" in f for f in src_files)
-        assert any("routes.py" in f for f in src_files)
+        assert {"main.py", "helper.py", "routes.py"} <= _basenames(logical_groups["src"])
     
     def test_generate_hierarchical_structure(self, sample_file_results, sample_relationships):
         """Test generation of hierarchical documentation structure."""
@@ -217,10 +232,8 @@ class TestDocumentationStructureManager:
             assert "config" in hierarchy["modules"]
             
             # Check file assignments
-            src_files = [os.path.basename(f) for f in hierarchy["modules"]["src"]["files"]]
-            assert any("main.py" in f for f in src_files) or \
-                  any("routes.py" in f for f in src_files) or \
-                  any("helper.py" in f for f in src_files)
+            src_files = _basenames(hierarchy["modules"]["src"]["files"])
+            assert {"main.py", "helper.py", "routes.py"} & src_files
     
     def test_adaptive_depth_control(self, sample_file_results):
         """Test adaptive depth control based on repository size."""
@@ -3,10 +3,16 @@ Tests for the documentation testing system.
 
 This module tests functionality for verifying documentation quality and correctness.
 """
+import io
 import os
+import tempfile
+import threading
+import time
 import unittest
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import patch
+import pytest
 
+from file_analyzer.doc_generator import documentation_tester
 from file_analyzer.doc_generator.documentation_tester import (
     DocumentationTester,
     run_documentation_test,
@@ -15,15 +21,30 @@ from file_analyzer.doc_generator.documentation_tester import (
 )
 
 
+def _fake_open_factory(contents_by_path):
+    """Create an open() replacement that serves file contents from memory."""
+    def _open(path, *args, **kwargs):
+        return io.StringIO(contents_by_path[path])
+    return _open
+
+
+def _write_docs(directory, contents_by_name):
+    """Write documentation files into a directory."""
+    for name, content in contents_by_name.items():
+        with open(os.path.join(directory, name), "w", encoding="utf-8") as f:
+            f.write(content)
+
+
 class TestDocumentationTester(unittest.TestCase):
     """Test case for the documentation testing system."""
     
-    def setUp(self):
-        """Set up test fixtures."""
-        self.tester = DocumentationTester()
+    @classmethod
+    def setUpClass(cls):
+        """Set up shared test fixtures; the tester and sample docs are read-only."""
+        cls.tester = DocumentationTester()
         
         # Sample documentation content
-        self.good_doc = """# example.py
+        cls.good_doc = """# example.py
 
 ## Table of Contents
 
@@ -56,7 +77,7 @@ result = test_function()
 | TestClass | A class for advanced testing |
 """
 
-        self.poor_doc = """# example.py
+        cls.poor_doc = """# example.py
 
 Some text without proper sections.
 
@@ -65,7 +86,7 @@ Some text without proper sections.
 No code examples provided.
 """
 
-        self.broken_doc = """# example.py
+        cls.broken_doc = """# example.py
 
 ## Table of Contents
 
@@ -89,6 +110,69 @@ This has a broken link: [Missing](#nowhere)
         self.assertFalse(result.passed)
         self.assertGreater(len(result.issues), 0)
         
+    def test_checks_match_each_markdown_construct(self):
+        """Test that the checks find headings, links, code blocks and tables."""
+        # Arrange
+        content = """# sample.py
+
+## Description
+
+See [Usage](#usage-examples) and [Gone](#gone).
+
+## Usage Examples
+
+No example yet.
+
+## Key Components
+
+| Component | Description |
+|-----------|-------------|
+| run | Runs the sample |
+"""
+        fixed = content.replace("No example yet.", "```python\nrun()\n```")
+        
+        # Act
+        sections = self.tester.check_required_sections(content)
+        links = self.tester.check_broken_links(content)
+        code_blocks = self.tester.check_code_blocks(content)
+        fixed_code_blocks = self.tester.check_code_blocks(fixed)
+        tables = self.tester.check_table_formatting(content)
+        
+        # Assert
+        self.assertEqual(sections.issues, ["Missing required section: Purpose"])
+        self.assertEqual(sections.score, 7.5)
+        self.assertEqual(links.issues, ["Broken link to 'Gone' with anchor '#gone'"])
+        self.assertEqual(links.score, 5.0)
+        self.assertEqual(code_blocks.issues, ["Usage Examples section does not contain code blocks"])
+        self.assertEqual(code_blocks.score, 5.0)
+        self.assertTrue(fixed_code_blocks.passed)
+        self.assertEqual(fixed_code_blocks.score, 10.0)
+        self.assertTrue(tables.passed)
+        self.assertEqual(tables.score, 10.0)
+        
+    def test_standalone_check_scans_only_its_constructs(self):
+        """Test that a single check does not scan constructs it never reads."""
+        with patch.object(documentation_tester, "_HEADING_RE") as mock_heading_re, \
+                patch.object(documentation_tester, "_INTERNAL_LINK_RE") as mock_link_re, \
+                patch.object(documentation_tester, "_TABLE_SEPARATOR_LINE_RE") as mock_table_re:
+            result = self.tester.check_code_blocks(self.good_doc)
+        
+        self.assertTrue(result.passed)
+        mock_heading_re.findall.assert_not_called()
+        mock_link_re.findall.assert_not_called()
+        mock_table_re.findall.assert_not_called()
+        
+    def test_parsed_doc_scans_each_construct_once(self):
+        """Test that checks sharing a parsed document reuse its scans."""
+        parsed = documentation_tester.ParsedDoc(self.good_doc)
+        heading_re = documentation_tester._HEADING_RE
+        
+        with patch.object(documentation_tester, "_HEADING_RE", wraps=heading_re) as spy:
+            self.tester.check_broken_links(self.good_doc, parsed)
+            self.tester.check_broken_links(self.good_doc, parsed)
+        
+        spy.findall.assert_called_once_with(self.good_doc)
+        
     def test_check_broken_links(self):
         """Test checking for broken internal links."""
         # Test with good documentation
@@ -100,6 +184,29 @@ This has a broken link: [Missing](#nowhere)
         self.assertFalse(result.passed)
         self.assertGreater(len(result.issues), 0)
         
+    def test_check_broken_links_fastpath_empty(self):
+        """Test that documents without internal links skip the link regex."""
+        with patch.object(documentation_tester, "_INTERNAL_LINK_RE") as mock_link_re:
+            result = self.tester.check_broken_links(self.poor_doc)
+        
+        mock_link_re.findall.assert_not_called()
+        self.assertTrue(result.passed)
+        self.assertEqual(result.score, 10.0)
+        
+    @pytest.mark.slow
+    def test_check_broken_links_scales_linear(self):
+        """Test that link checking stays fast with many headings and links."""
+        headings = "\n\n".join(f"## Section {i}" for i in range(1000))
+        links = "\n".join(f"- [Section {i}](#section-{i})" for i in range(1000))
+        content = f"# large.py\n\n{links}\n\n{headings}\n"
+        
+        start = time.perf_counter()
+        result = self.tester.check_broken_links(content)
+        elapsed = time.perf_counter() - start
+        
+        self.assertTrue(result.passed)
+        self.assertLess(elapsed, 1.0)
+        
     def test_check_code_blocks(self):
         """Test checking for proper code blocks."""
         # Test with proper code blocks
@@ -130,45 +237,110 @@ This has a broken link: [Missing](#nowhere)
         result = self.tester.measure_documentation_quality(self.poor_doc)
         self.assertLess(result.quality_score, 5.0)  # Poor score
     
+    def test_measure_documentation_quality_cached(self):
+        """Test that repeated quality measurements are served from the cache."""
+        tester = DocumentationTester()
+        
+        first = tester.measure_documentation_quality(self.good_doc)
+        first.file_path = "/path/to/docs/changed.md"
+        second = tester.measure_documentation_quality(self.good_doc)
+        
+        stats = tester.quality_cache.get_stats()
+        self.assertEqual(stats["hits"], 1)
+        self.assertEqual(stats["size"], 1)
+        self.assertEqual(second.quality_score, first.quality_score)
+        # Mutating a returned result must not leak into the cache
+        self.assertEqual(second.file_path, "")
+    
+    def test_measure_documentation_quality_cache_follows_settings(self):
+        """Test that changing the weights or required sections invalidates cached scores."""
+        tester = DocumentationTester()
+        first = tester.measure_documentation_quality(self.good_doc)
+        
+        tester.quality_weights = {name: 0.0 for name in tester.quality_weights}
+        reweighted = tester.measure_documentation_quality(self.good_doc)
+        
+        tester.required_sections = tester.required_sections + ["Changelog"]
+        extra_section = tester.measure_documentation_quality(self.good_doc)
+        
+        self.assertGreater(first.quality_score, 0.0)
+        self.assertEqual(reweighted.quality_score, 0.0)
+        self.assertIn("Missing required section: Changelog", extra_section.issues)
+        self.assertNotIn("Missing required section: Changelog", reweighted.issues)
+    
     @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_test_documentation_file(self, mock_file, mock_exists):
+    def test_test_documentation_file(self, mock_exists):
         """Test testing a documentation file."""
         # Setup mocks
         mock_exists.return_value = True
-        mock_file.return_value.read.return_value = self.good_doc
+        file_path = "/path/to/docs/example.py.md"
         
         # Test good documentation file
-        file_path = "/path/to/docs/example.py.md"
-        result = self.tester.test_documentation_file(file_path)
+        with patch('builtins.open', side_effect=_fake_open_factory({file_path: self.good_doc})):
+            result = self.tester.test_documentation_file(file_path)
         self.assertTrue(result.passed)
         
         # Test with poor documentation
-        mock_file.return_value.read.return_value = self.poor_doc
-        result = self.tester.test_documentation_file(file_path)
+        with patch('builtins.open', side_effect=_fake_open_factory({file_path: self.poor_doc})):
+            result = self.tester.test_documentation_file(file_path)
         self.assertFalse(result.passed)
     
-    @patch('os.walk')
-    @patch('os.path.exists')
-    @patch('builtins.open', new_callable=mock_open)
-    def test_test_documentation_directory(self, mock_file, mock_exists, mock_walk):
+    def test_test_documentation_directory(self):
         """Test testing a directory of documentation."""
-        # Setup mocks
-        mock_exists.return_value = True
-        mock_walk.return_value = [
-            ("/path/to/docs", [], ["file1.md", "file2.md"])
-        ]
-        mock_file.return_value.read.side_effect = [self.good_doc, self.poor_doc]
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_docs(tmpdir, {
+                "file1.md": self.good_doc,
+                "notes.txt": "Not documentation",
+                "file2.md": self.poor_doc,
+            })
+            
+            # Test directory
+            results = self.tester.test_documentation_directory(tmpdir)
         
-        # Test directory
-        dir_path = "/path/to/docs"
-        results = self.tester.test_documentation_directory(dir_path)
+        # Should have the two Markdown files; the good one passes, the poor one fails
+        passed = {os.path.basename(r.file_path): r.passed for r in results}
+        self.assertEqual(passed, {"file1.md": True, "file2.md": False})
+    
+    def test_test_documentation_directory_skips_unreadable_entries(self):
+        """Test that unreadable subdirectories and file paths are skipped, as os.walk does."""
+        with tempfile.TemporaryDirectory() as tmpdir:
+            doc_path = os.path.join(tmpdir, "readme.md")
+            with open(doc_path, "w", encoding="utf-8") as f:
+                f.write(self.good_doc)
+            locked_dir = os.path.join(tmpdir, "locked")
+            os.mkdir(locked_dir)
+            real_scandir = os.scandir
+            
+            def scandir(path):
+                if path == locked_dir:
+                    raise PermissionError(13, "Permission denied", path)
+                return real_scandir(path)
+            
+            with patch('os.scandir', side_effect=scandir):
+                results = self.tester.test_documentation_directory(tmpdir)
+            file_results = self.tester.test_documentation_directory(doc_path)
+        
+        self.assertEqual([r.file_path for r in results], [doc_path])
+        self.assertEqual(file_results, [])
+    
+    def test_test_documentation_directory_parallel(self):
+        """Test that directory files are tested in parallel, preserving order."""
+        tester = DocumentationTester(concurrency=8)
+        # Every file waits for all the others, so a sequential run breaks the barrier
+        barrier = threading.Barrier(8, timeout=5)
+        
+        def concurrent_test_file(file_path):
+            barrier.wait()
+            return DocumentationTestResult(file_path=file_path, passed=True, quality_score=9.0)
+        
+        with tempfile.TemporaryDirectory() as tmpdir:
+            _write_docs(tmpdir, {f"file{i}.md": self.good_doc for i in range(8)})
+            paths = list(tester._iter_markdown_files(tmpdir))
+            
+            with patch.object(tester, 'test_documentation_file', side_effect=concurrent_test_file):
+                results = tester.test_documentation_directory(tmpdir)
         
-        # Should have two files
-        self.assertEqual(len(results), 2)
-        # First should pass, second should fail
-        self.assertTrue(results[0].passed)
-        self.assertFalse(results[1].passed)
+        self.assertEqual([r.file_path for r in results], paths)
     
     def test_generate_test_report(self):
         """Test generating a test report."""
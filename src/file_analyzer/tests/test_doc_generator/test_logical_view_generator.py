@@ -2,17 +2,79 @@
 Unit tests for the logical view generator.
 """
 import unittest
-from unittest.mock import MagicMock, patch
+from types import SimpleNamespace
+from unittest.mock import DEFAULT, MagicMock, patch
 from pathlib import Path
-import os
-import tempfile
 
 from file_analyzer.ai_providers.mock_provider import MockAIProvider
-from file_analyzer.doc_generator.logical_view_generator import LogicalViewGenerator
+from file_analyzer.doc_generator.logical_view_generator import (
+    ClassTable,
+    LogicalViewGenerator
+)
 from file_analyzer.core.file_reader import FileReader
 from file_analyzer.core.file_hasher import FileHasher
 from file_analyzer.core.cache_provider import InMemoryCache
 
+# Code analysis shared by all tests; never mutated
+_MOCK_ANALYSIS_RESULT = {
+    "language": "python",
+    "structure": {
+        "classes": [
+            {
+                "name": "TestClass",
+                "attributes": [
+                    {"name": "attr1", "type": "str", "accessibility": "public"},
+                    {"name": "attr2", "type": "int", "accessibility": "private"}
+                ],
+                "methods": [
+                    {
+                        "name": "test_method",
+                        "parameters": [{"name": "param1", "type": "str"}],
+                        "return_type": "bool",
+                        "accessibility": "public"
+                    }
+                ],
+                "inherits_from": ["BaseClass"],
+                "implements": ["Interface1"]
+            },
+            {
+                "name": "BaseClass",
+                "attributes": [
+                    {"name": "base_attr", "type": "str", "accessibility": "protected"}
+                ],
+                "methods": [
+                    {
+                        "name": "base_method",
+                        "parameters": [],
+                        "return_type": "None",
+                        "accessibility": "public"
+                    }
+                ]
+            }
+        ],
+        "functions": [
+            {
+                "name": "create_objects",
+                "body": "obj1 = TestClass('test')\nobj2 = BaseClass()\nobj1.test_method(obj2)",
+                "parameters": []
+            }
+        ],
+        "relationships": [
+            {
+                "source": "BaseClass",
+                "target": "TestClass",
+                "type": "inheritance"
+            },
+            {
+                "source": "Interface1",
+                "target": "TestClass",
+                "type": "implementation"
+            }
+        ]
+    }
+}
+
+
 class TestLogicalViewGenerator(unittest.TestCase):
     """Test case for the LogicalViewGenerator class."""
     
@@ -23,65 +85,10 @@ class TestLogicalViewGenerator(unittest.TestCase):
         self.file_reader = FileReader()
         self.file_hasher = FileHasher()
         
-        # Create mock code analyzer
-        self.mock_code_analyzer = MagicMock()
-        self.mock_code_analyzer.analyze_code.return_value = {
-            "language": "python",
-            "structure": {
-                "classes": [
-                    {
-                        "name": "TestClass",
-                        "attributes": [
-                            {"name": "attr1", "type": "str", "accessibility": "public"},
-                            {"name": "attr2", "type": "int", "accessibility": "private"}
-                        ],
-                        "methods": [
-                            {
-                                "name": "test_method",
-                                "parameters": [{"name": "param1", "type": "str"}],
-                                "return_type": "bool",
-                                "accessibility": "public"
-                            }
-                        ],
-                        "inherits_from": ["BaseClass"],
-                        "implements": ["Interface1"]
-                    },
-                    {
-                        "name": "BaseClass",
-                        "attributes": [
-                            {"name": "base_attr", "type": "str", "accessibility": "protected"}
-                        ],
-                        "methods": [
-                            {
-                                "name": "base_method",
-                                "parameters": [],
-                                "return_type": "None",
-                                "accessibility": "public"
-                            }
-                        ]
-                    }
-                ],
-                "functions": [
-                    {
-                        "name": "create_objects",
-                        "body": "obj1 = TestClass('test')\nobj2 = BaseClass()\nobj1.test_method(obj2)",
-                        "parameters": []
-                    }
-                ],
-                "relationships": [
-                    {
-                        "source": "BaseClass",
-                        "target": "TestClass",
-                        "type": "inheritance"
-                    },
-                    {
-                        "source": "Interface1",
-                        "target": "TestClass",
-                        "type": "implementation"
-                    }
-                ]
-            }
-        }
+        # Create stub code analyzer; tests that count calls swap in a MagicMock
+        self.mock_code_analyzer = SimpleNamespace(
+            analyze_code=lambda *args, **kwargs: _MOCK_ANALYSIS_RESULT
+        )
         
         # Create generator with mock code analyzer
         self.generator = LogicalViewGenerator(
@@ -98,6 +105,8 @@ class TestLogicalViewGenerator(unittest.TestCase):
     
     def test_generate_class_diagram(self):
         """Test generation of class diagrams."""
+        self.mock_code_analyzer.analyze_code = MagicMock(return_value=_MOCK_ANALYSIS_RESULT)
+        
         # Generate diagram
         result = self.generator.generate_class_diagram(
             [self.test_file, self.base_file],
@@ -109,19 +118,23 @@ class TestLogicalViewGenerator(unittest.TestCase):
         self.assertEqual(result["diagram_type"], "class")
         self.assertEqual(result["syntax_type"], "mermaid")
         
+        lines = {line.strip() for line in result["content"].splitlines()}
+        
         # Check diagram content
-        self.assertIn("classDiagram", result["content"])
-        self.assertIn("TestClass", result["content"])
-        self.assertIn("BaseClass", result["content"])
+        self.assertIn("classDiagram", lines)
+        self.assertIn("class TestClass", lines)
+        self.assertIn("class BaseClass", lines)
         
         # Verify relationships
-        self.assertIn("TestClass --|> BaseClass", result["content"])
+        self.assertIn("TestClass --|> BaseClass", lines)
         
         # Check metadata
         self.assertEqual(result["metadata"]["file_count"], 2)
-        # The mock_code_analyzer.analyze_code provides TestClass, BaseClass and Interface1 (from relationship)
-        # so we should expect 3 or 4 classes in the diagram (varies depending on implementation)
-        self.assertTrue(result["metadata"]["class_count"] >= 2)
+        # Both files declare TestClass and BaseClass; duplicates are collapsed and
+        # Interface1 (only referenced by a relationship) is not materialized
+        self.assertEqual(result["metadata"]["class_count"], 2)
+        self.assertEqual(result["content"].count("    class TestClass\n"), 1)
+        self.assertNotIn("class Interface1", result["content"])
         
         # Verify cache
         self.assertEqual(self.generator.stats["cache_misses"], 1)
@@ -134,8 +147,56 @@ class TestLogicalViewGenerator(unittest.TestCase):
         
         # Check cache stats
         self.assertEqual(self.generator.stats["cache_hits"], 1)
+        self.assertEqual(self.mock_code_analyzer.analyze_code.call_count, 2)
         self.assertEqual(result, result2)  # Should get identical result from cache
     
+    def test_generate_class_diagram_cache_follows_content(self):
+        """Test that renamed files with unchanged content reuse the cached diagram."""
+        self.mock_code_analyzer.analyze_code = MagicMock(return_value=_MOCK_ANALYSIS_RESULT)
+        
+        with patch.object(self.file_hasher, "get_file_hash", side_effect=lambda p: f"hash-{p.stem}"):
+            first = self.generator.generate_class_diagram([self.test_file])
+            moved = self.generator.generate_class_diagram([Path("/moved/test_class.py")])
+        
+        self.assertEqual(self.generator.stats["cache_hits"], 1)
+        self.assertEqual(self.mock_code_analyzer.analyze_code.call_count, 1)
+        self.assertEqual(
+            [cls["file_path"] for cls in first["classes"]],
+            [str(self.test_file)] * len(first["classes"])
+        )
+        self.assertEqual(
+            [cls["file_path"] for cls in moved["classes"]],
+            [str(Path("/moved/test_class.py"))] * len(moved["classes"])
+        )
+    
+    def test_generate_class_diagram_cache_respects_file_order(self):
+        """Test that reordered inputs are not served a diagram built in another order."""
+        self.mock_code_analyzer.analyze_code = MagicMock(return_value=_MOCK_ANALYSIS_RESULT)
+        other_file = Path("/other/test_class.py")
+        
+        with patch.object(self.file_hasher, "get_file_hash", side_effect=lambda p: f"hash-{p.parent.name}"):
+            self.generator.generate_class_diagram([self.test_file, other_file])
+            reordered = self.generator.generate_class_diagram([other_file, self.test_file])
+        
+        self.assertEqual(self.generator.stats["cache_hits"], 0)
+        self.assertEqual(
+            {cls["file_path"] for cls in reordered["classes"]},
+            {str(other_file)}
+        )
+    
+    def test_class_table_soa_layout(self):
+        """Test conversion of class data into the column-oriented ClassTable."""
+        result = self.generator.generate_class_diagram([self.test_file])
+        
+        table = self.generator._build_class_table(result["classes"])
+        
+        self.assertIsInstance(table, ClassTable)
+        self.assertEqual(table.names, ["TestClass", "BaseClass"])
+        self.assertEqual(table.inherits, [["BaseClass"], []])
+        self.assertEqual(table.implements, [["Interface1"], []])
+        self.assertEqual([len(methods) for methods in table.methods], [1, 1])
+        self.assertEqual([len(attrs) for attrs in table.attributes], [2, 1])
+    
     def test_generate_object_model(self):
         """Test generation of object model diagrams."""
         # Generate diagram
@@ -168,47 +229,50 @@ class TestLogicalViewGenerator(unittest.TestCase):
             "transitions": [{"from": "[*]", "to": "State1"}, {"from": "State1", "to": "State2"}, {"from": "State2", "to": "[*]"}]
         }
         
-        # Write a test file to a temp location
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write("""
-            class StateMachine:
-                def __init__(self):
-                    self.state = 'initial'
-                
-                def transition(self, event):
-                    if self.state == 'initial' and event == 'start':
-                        self.state = 'running'
-                    elif self.state == 'running' and event == 'pause':
-                        self.state = 'paused'
-                    elif self.state == 'paused' and event == 'resume':
-                        self.state = 'running'
-                    elif self.state == 'running' and event == 'stop':
-                        self.state = 'stopped'
-            """)
-            temp_file = Path(f.name)
-        
-        try:
-            # Generate diagram
-            result = self.generator.generate_state_diagram(temp_file)
-            
-            # Verify result
-            self.assertEqual(result["diagram_type"], "state")
-            self.assertEqual(result["syntax_type"], "mermaid")
-            self.assertIn("stateDiagram", result["content"])
-            
-            # Verify stats
-            self.assertEqual(self.generator.stats["state_diagrams_generated"], 1)
-        
-        finally:
-            # Clean up temp file
-            if os.path.exists(temp_file):
-                os.unlink(temp_file)
+        source_code = """
+class StateMachine:
+    def __init__(self):
+        self.state = 'initial'
+
+    def transition(self, event):
+        if self.state == 'initial' and event == 'start':
+            self.state = 'running'
+        elif self.state == 'running' and event == 'pause':
+            self.state = 'paused'
+        elif self.state == 'paused' and event == 'resume':
+            self.state = 'running'
+        elif self.state == 'running' and event == 'stop':
+            self.state = 'stopped'
+"""
+        
+        # Serve the source from memory instead of a temporary file
+        with patch.object(self.file_reader, 'read_file', return_value=source_code):
+            result = self.generator.generate_state_diagram(Path("/virtual/state_machine.py"))
+        
+        # Verify result
+        self.assertEqual(result["diagram_type"], "state")
+        self.assertEqual(result["syntax_type"], "mermaid")
+        self.assertIn("stateDiagram", result["content"])
+        
+        # Verify the in-memory source reached the AI step
+        self.assertEqual(mock_ai_diagram.call_args[0][1], source_code)
+        
+        # Verify stats
+        self.assertEqual(self.generator.stats["state_diagrams_generated"], 1)
     
-    @patch("file_analyzer.doc_generator.logical_view_generator.LogicalViewGenerator._find_code_files")
-    @patch("file_analyzer.doc_generator.logical_view_generator.LogicalViewGenerator._select_important_files")
-    @patch("file_analyzer.doc_generator.logical_view_generator.LogicalViewGenerator.generate_class_diagram")
-    def test_generate_combined_class_diagram(self, mock_class_diagram, mock_select, mock_find):
+    @patch.multiple(
+        "file_analyzer.doc_generator.logical_view_generator.LogicalViewGenerator",
+        autospec=True,
+        _find_code_files=DEFAULT,
+        _select_important_files=DEFAULT,
+        generate_class_diagram=DEFAULT
+    )
+    def test_generate_combined_class_diagram(self, **mocks):
         """Test generation of combined repository class diagrams."""
+        mock_find = mocks["_find_code_files"]
+        mock_select = mocks["_select_important_files"]
+        mock_class_diagram = mocks["generate_class_diagram"]
+        
         # Setup mocks
         mock_find.return_value = [self.test_file, self.base_file]
         mock_select.return_value = [self.test_file, self.base_file]
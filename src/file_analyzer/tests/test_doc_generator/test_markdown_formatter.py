@@ -5,9 +5,12 @@ This module tests the functionality for formatting AI-generated
 documentation into well-structured Markdown.
 """
 import os
+import time
 import unittest
 from unittest.mock import MagicMock, patch
+import pytest
 
+from file_analyzer.doc_generator import markdown_formatter
 from file_analyzer.doc_generator.markdown_formatter import (
     MarkdownFormatter,
     format_documentation,
@@ -46,22 +49,40 @@ class TestMarkdownFormatter(unittest.TestCase):
         
         formatted = self.formatter.format_documentation(file_path, self.sample_doc)
         
+        lines = set(formatted.splitlines())
+        
         # Check that basic structure is present
-        self.assertIn("# example.py", formatted)
-        self.assertIn("## Description", formatted)
-        self.assertIn("## Purpose", formatted)
-        self.assertIn("## Usage Examples", formatted)
-        self.assertIn("## Key Components", formatted)
-        self.assertIn("## Main Concepts", formatted)
-        self.assertIn("## Architecture Notes", formatted)
+        self.assertIn("# example.py", lines)
+        for section in ("Description", "Purpose", "Usage Examples", "Key Components",
+                        "Main Concepts", "Architecture Notes"):
+            self.assertIn(f"## {section}", lines)
         
         # Check that code blocks are preserved
-        self.assertIn("```python", formatted)
+        self.assertIn("```python", lines)
         self.assertIn("from example import function", formatted)
         
         # Check that TOC is generated
-        self.assertIn("## Table of Contents", formatted)
-        self.assertIn("- [Description](#description)", formatted)
+        self.assertIn("## Table of Contents", lines)
+        self.assertIn("- [Description](#description)", lines)
+        
+    @pytest.mark.slow
+    def test_format_documentation_large_input(self):
+        """Test that formatting scales linearly with the amount of content."""
+        doc_data = {
+            "key_components": [
+                {"name": f"Component{i}", "description": f"Description of component {i}"}
+                for i in range(10000)
+            ],
+            "main_concepts": [f"Concept {i}" for i in range(10000)]
+        }
+        
+        start = time.perf_counter()
+        formatted = self.formatter.format_documentation("/path/to/large.py", doc_data)
+        elapsed = time.perf_counter() - start
+        
+        self.assertIn("| Component9999 | Description of component 9999 |", formatted)
+        self.assertIn("- Concept 9999", formatted)
+        self.assertLess(elapsed, 0.25)
         
     def test_create_toc(self):
         """Test table of contents generation."""
@@ -91,6 +112,16 @@ class TestMarkdownFormatter(unittest.TestCase):
         sanitized_code = sanitize_markdown(code_block)
         self.assertEqual(code_block, sanitized_code)
     
+    def test_sanitize_markdown_fastpath(self):
+        """Test that tag patterns are skipped for tag-free content but event handlers are still removed."""
+        markdown = "# Heading\nSet onload = true in the config"
+        
+        with patch.object(markdown_formatter, "_SCRIPT_BLOCK_RE") as mock_script_re:
+            sanitized = sanitize_markdown(markdown)
+        
+        mock_script_re.sub.assert_not_called()
+        self.assertEqual("# Heading\nSet  in the config", sanitized)
+    
     def test_create_anchor_link(self):
         """Test anchor link creation."""
         # Test regular text
@@ -102,6 +133,16 @@ class TestMarkdownFormatter(unittest.TestCase):
         
         # Test with unicode characters
         self.assertEqual("section-", create_anchor_link("Section §"))
+    
+    def test_anchor_link_is_cached(self):
+        """Test that repeated anchor lookups are served from the cache."""
+        create_anchor_link.cache_clear()
+        
+        first = create_anchor_link("Key Components")
+        second = create_anchor_link("Key Components")
+        
+        self.assertEqual(first, second)
+        self.assertGreaterEqual(create_anchor_link.cache_info().hits, 1)
 
 
 if __name__ == "__main__":
@@ -2,10 +2,11 @@
 Unit tests for the Markdown documentation generator.
 """
 import os
+import shutil
 import tempfile
 from pathlib import Path
 import pytest
-from unittest.mock import patch, MagicMock
+from unittest.mock import patch, MagicMock, mock_open
 
 from file_analyzer.doc_generator.markdown_generator import (
     MarkdownGenerator, DocumentationConfig, generate_documentation
@@ -51,12 +52,20 @@ class TestDocumentationConfig:
 class TestMarkdownGenerator:
     """Tests for MarkdownGenerator class."""
     
-    @pytest.fixture
+    @pytest.fixture(scope="module")
     def generator(self):
-        """Create a MarkdownGenerator with a temporary output directory."""
-        with tempfile.TemporaryDirectory() as temp_dir:
+        """
+        Create a MarkdownGenerator with a temporary output directory.
+        
+        The generator (and its Jinja environment) is shared by all tests in the
+        module, so tests that change its state must do so through monkeypatch.
+        """
+        temp_dir = tempfile.mkdtemp()
+        try:
             config = DocumentationConfig(output_dir=temp_dir)
             yield MarkdownGenerator(config), temp_dir
+        finally:
+            shutil.rmtree(temp_dir, ignore_errors=True)
     
     def test_initialization(self, generator):
         """Test that the generator initializes correctly."""
@@ -81,14 +90,14 @@ class TestMarkdownGenerator:
         rel_path = markdown_generator._get_relative_path(file_path, repo_path)
         assert rel_path == file_path
     
-    def test_exclusion(self, generator):
+    def test_exclusion(self, generator, monkeypatch):
         """Test file exclusion logic."""
         markdown_generator, _ = generator
         
         # Add some exclude patterns
-        markdown_generator.config.exclude_patterns = [
+        monkeypatch.setattr(markdown_generator.config, "exclude_patterns", [
             "node_modules", ".git", "test_"
-        ]
+        ])
         
         # Test excluded files
         assert markdown_generator._should_exclude("/path/to/node_modules/file.js") is True
@@ -150,16 +159,17 @@ class TestMarkdownGenerator:
         assert "test" in c_patterns
         assert '#include "test' in c_patterns
     
-    @patch('builtins.open', new_callable=MagicMock)
+    @patch('file_analyzer.doc_generator.markdown_generator.open', new_callable=mock_open, create=True)
     @patch('os.makedirs', new_callable=MagicMock)
-    def test_generate_indexes(self, mock_makedirs, mock_open, generator):
+    def test_generate_indexes(self, mock_makedirs, mock_file, generator, monkeypatch):
         """Test generating index files."""
         markdown_generator, output_dir = generator
         
         # Mock template environment
         mock_template = MagicMock()
         mock_template.render.return_value = "# Test Index"
-        markdown_generator.jinja_env.get_template = MagicMock(return_value=mock_template)
+        monkeypatch.setattr(markdown_generator.jinja_env, "get_template",
+                            MagicMock(return_value=mock_template))
         
         # Test data
         repo_path = "/path/to/repo"
@@ -177,13 +187,12 @@ class TestMarkdownGenerator:
         # Check the results
         assert len(index_paths) >= 1  # At least the main index
         
-        # Main index file should be created
-        assert os.path.join(output_dir, "index.md") in index_paths
-        
-        # Directory indexes for src, src/module1, src/module2 should be created
-        assert os.path.join(output_dir, "src", "index.md") in index_paths
-        assert os.path.join(output_dir, "src/module1", "index.md") in index_paths
-        assert os.path.join(output_dir, "src/module2", "index.md") in index_paths
+        # Main index plus directory indexes for src, src/module1, src/module2 should be created
+        expected = {
+            os.path.join(output_dir, rel_path)
+            for rel_path in ("index.md", "src/index.md", "src/module1/index.md", "src/module2/index.md")
+        }
+        assert expected <= set(index_paths)
         
         # Template should be called for each index
         assert mock_template.render.call_count >= 4  # Main + 3 directories
@@ -192,26 +201,29 @@ class TestMarkdownGenerator:
         assert mock_makedirs.called
         
         # Index files should be written
-        assert mock_open.call_count >= 4  # Main + 3 directories
+        assert mock_file.call_count >= 4  # Main + 3 directories
     
-    @patch('builtins.open', new_callable=MagicMock)
-    def test_generate_file_documentation(self, mock_open, generator):
+    @patch('file_analyzer.doc_generator.markdown_generator.open', new_callable=mock_open, create=True)
+    def test_generate_file_documentation(self, mock_file, generator, monkeypatch):
         """Test generating documentation for a single file."""
         markdown_generator, output_dir = generator
         
         # Mock methods
-        markdown_generator._get_code_snippet = MagicMock(return_value="# Code snippet")
-        markdown_generator._get_file_relationships = MagicMock(return_value={
+        monkeypatch.setattr(markdown_generator, "_get_code_snippet",
+                            MagicMock(return_value="# Code snippet"))
+        monkeypatch.setattr(markdown_generator, "_get_file_relationships", MagicMock(return_value={
             "imports": [],
             "imported_by": [],
             "related": []
-        })
+        }))
         
         # Mock template environment
         mock_template = MagicMock()
         mock_template.render.return_value = "# Test Documentation"
-        markdown_generator.jinja_env.get_template = MagicMock(return_value=mock_template)
-        markdown_generator._get_template_for_file = MagicMock(return_value="python_file.md.j2")
+        monkeypatch.setattr(markdown_generator.jinja_env, "get_template",
+                            MagicMock(return_value=mock_template))
+        monkeypatch.setattr(markdown_generator, "_get_template_for_file",
+                            MagicMock(return_value="python_file.md.j2"))
         
         # Test data
         file_path = "/path/to/repo/src/test.py"
@@ -245,13 +257,14 @@ class TestMarkdownGenerator:
             }
         ]
         
+        expected_doc_path = os.path.join(output_dir, "src/test.py.md")
+        
         # Call the method
         doc_path = markdown_generator._generate_file_documentation(
             file_path, file_result, repo_path, frameworks
         )
         
         # Check the result
-        expected_doc_path = os.path.join(output_dir, "src/test.py.md")
         assert doc_path == expected_doc_path
         
         # Check that the template was rendered with the expected context
@@ -266,8 +279,8 @@ class TestMarkdownGenerator:
         markdown_generator._get_template_for_file.assert_called_once_with("python", "code")
         
         # Check that the file was written
-        mock_open.assert_called_once()
-        mock_open().__enter__().write.assert_called_once_with("# Test Documentation")
+        mock_file.assert_called_once_with(expected_doc_path, "w")
+        mock_file().write.assert_called_once_with("# Test Documentation")
 
 
 class TestGenerateDocumentation:
@@ -13,55 +13,13 @@ from file_analyzer.core.file_reader import FileReader
 from file_analyzer.core.file_hasher import FileHasher
 from file_analyzer.core.cache_provider import InMemoryCache
 
-class TestPhysicalViewGenerator(unittest.TestCase):
-    """Test case for the PhysicalViewGenerator class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_provider = MockAIProvider()
-        self.cache = InMemoryCache()
-        self.file_reader = MagicMock(spec=FileReader)
-        self.file_hasher = FileHasher()
-        
-        # Create mock code analyzer
-        self.mock_code_analyzer = MagicMock()
-        
-        # Create generator with mock code analyzer
-        self.generator = PhysicalViewGenerator(
-            ai_provider=self.mock_provider,
-            code_analyzer=self.mock_code_analyzer,
-            file_reader=self.file_reader,
-            file_hasher=self.file_hasher,
-            cache_provider=self.cache
-        )
-        
-        # Repository path for testing
-        self.repo_path = Path("/test/repo")
-        
-        # Setup common mocks
-        self.generator._find_deployment_files = MagicMock(return_value=[
-            Path("/test/repo/Dockerfile"),
-            Path("/test/repo/kubernetes/deployment.yaml"),
-            Path("/test/repo/docker-compose.yml")
-        ])
-        
-        self.generator._find_infrastructure_files = MagicMock(return_value=[
-            Path("/test/repo/terraform/main.tf"),
-            Path("/test/repo/cloudformation/template.json")
-        ])
-    
-    def test_generate_deployment_diagram(self):
-        """Test generation of deployment diagrams."""
-        # Mock file reading
-        def mock_read_file(file_path):
-            if "Dockerfile" in str(file_path):
-                return """FROM python:3.8
+_DOCKERFILE = """FROM python:3.8
 WORKDIR /app
 COPY . .
 RUN pip install -r requirements.txt
 CMD ["python", "app.py"]"""
-            elif "deployment.yaml" in str(file_path):
-                return """apiVersion: apps/v1
+
+_K8S_DEPLOYMENT = """apiVersion: apps/v1
 kind: Deployment
 metadata:
   name: api-server
@@ -80,8 +38,8 @@ spec:
         image: api-server:latest
         ports:
         - containerPort: 8080"""
-            elif "docker-compose.yml" in str(file_path):
-                return """version: '3'
+
+_DOCKER_COMPOSE = """version: '3'
 services:
   web:
     build: .
@@ -91,12 +49,107 @@ services:
     image: postgres
     environment:
       POSTGRES_PASSWORD: password"""
-            return ""
+
+_TERRAFORM_MAIN = """provider "aws" {
+  region = "us-west-2"
+}
+
+resource "aws_instance" "web" {
+  ami           = "ami-0c55b159cbfafe1f0"
+  instance_type = "t2.micro"
+}
+
+resource "aws_db_instance" "default" {
+  allocated_storage    = 10
+  engine               = "mysql"
+  engine_version       = "5.7"
+  instance_class       = "db.t2.micro"
+  name                 = "mydb"
+  username             = "admin"
+  password             = "password"
+}"""
+
+_CLOUDFORMATION_TEMPLATE = """{
+  "Resources": {
+    "EC2Instance": {
+      "Type": "AWS::EC2::Instance",
+      "Properties": {
+        "InstanceType": "t2.micro",
+        "ImageId": "ami-0c55b159cbfafe1f0"
+      }
+    },
+    "S3Bucket": {
+      "Type": "AWS::S3::Bucket"
+    }
+  }
+}"""
+
+# File contents returned by the mocked FileReader, keyed by file name
+_DEPLOYMENT_FILES = {
+    "Dockerfile": _DOCKERFILE,
+    "deployment.yaml": _K8S_DEPLOYMENT,
+    "docker-compose.yml": _DOCKER_COMPOSE
+}
+
+_INFRASTRUCTURE_FILES = {
+    "main.tf": _TERRAFORM_MAIN,
+    "template.json": _CLOUDFORMATION_TEMPLATE
+}
+
+class TestPhysicalViewGenerator(unittest.TestCase):
+    """Test case for the PhysicalViewGenerator class."""
+    
+    @classmethod
+    def setUpClass(cls):
+        """Set up collaborators shared by all tests."""
+        cls.mock_provider = MockAIProvider()
+        cls.cache = InMemoryCache()
+        cls.file_reader = MagicMock(spec=FileReader)
+        cls.file_hasher = FileHasher()
+        
+        # Repository path for testing
+        cls.repo_path = Path("/test/repo")
+    
+    def setUp(self):
+        """Set up test fixtures."""
+        # Reset state left behind by previous tests on the shared collaborators
+        self.cache.clear()
+        self.file_reader.reset_mock(return_value=True, side_effect=True)
+        
+        # Create mock code analyzer
+        self.mock_code_analyzer = MagicMock()
+        
+        # Create generator with mock code analyzer
+        self.generator = PhysicalViewGenerator(
+            ai_provider=self.mock_provider,
+            code_analyzer=self.mock_code_analyzer,
+            file_reader=self.file_reader,
+            file_hasher=self.file_hasher,
+            cache_provider=self.cache
+        )
+    
+    def _mock_discovered_files(self):
+        """Stub out discovery of deployment and infrastructure files."""
+        self.generator._find_deployment_files = MagicMock(return_value=[
+            Path("/test/repo/Dockerfile"),
+            Path("/test/repo/kubernetes/deployment.yaml"),
+            Path("/test/repo/docker-compose.yml")
+        ])
         
-        self.file_reader.read_file.side_effect = mock_read_file
+        self.generator._find_infrastructure_files = MagicMock(return_value=[
+            Path("/test/repo/terraform/main.tf"),
+            Path("/test/repo/cloudformation/template.json")
+        ])
+    
+    def test_generate_deployment_diagram(self):
+        """Test generation of deployment diagrams."""
+        self._mock_discovered_files()
+        
+        # Mock file reading
+        self.file_reader.read_file.side_effect = lambda path: _DEPLOYMENT_FILES.get(Path(path).name, "")
         
         # Mock AI provider response
-        self.mock_provider.analyze_content = MagicMock(return_value={
+        analyze_content = patch.object(self.mock_provider, "analyze_content", return_value={
             "nodes": [
                 {"id": "web-server", "type": "server", "name": "Web Server"},
                 {"id": "api-server", "type": "server", "name": "API Server"},
@@ -113,10 +166,11 @@ services:
         })
         
         # Generate diagram
-        result = self.generator.generate_deployment_diagram(
-            self.repo_path,
-            title="Test Deployment Diagram"
-        )
+        with analyze_content:
+            result = self.generator.generate_deployment_diagram(
+                self.repo_path,
+                title="Test Deployment Diagram"
+            )
         
         # Verify result structure
         self.assertEqual(result["title"], "Test Deployment Diagram")
@@ -135,48 +189,13 @@ services:
     
     def test_generate_infrastructure_diagram(self):
         """Test generation of infrastructure diagrams."""
-        # Mock file reading
-        def mock_read_file(file_path):
-            if "main.tf" in str(file_path):
-                return """provider "aws" {
-  region = "us-west-2"
-}
-
-resource "aws_instance" "web" {
-  ami           = "ami-0c55b159cbfafe1f0"
-  instance_type = "t2.micro"
-}
-
-resource "aws_db_instance" "default" {
-  allocated_storage    = 10
-  engine               = "mysql"
-  engine_version       = "5.7"
-  instance_class       = "db.t2.micro"
-  name                 = "mydb"
-  username             = "admin"
-  password             = "password"
-}"""
-            elif "template.json" in str(file_path):
-                return """{
-  "Resources": {
-    "EC2Instance": {
-      "Type": "AWS::EC2::Instance",
-      "Properties": {
-        "InstanceType": "t2.micro",
-        "ImageId": "ami-0c55b159cbfafe1f0"
-      }
-    },
-    "S3Bucket": {
-      "Type": "AWS::S3::Bucket"
-    }
-  }
-}"""
-            return ""
+        self._mock_discovered_files()
         
-        self.file_reader.read_file.side_effect = mock_read_file
+        # Mock file reading
+        self.file_reader.read_file.side_effect = lambda path: _INFRASTRUCTURE_FILES.get(Path(path).name, "")
         
         # Mock AI provider response
-        self.mock_provider.analyze_content = MagicMock(return_value={
+        analyze_content = patch.object(self.mock_provider, "analyze_content", return_value={
             "resources": [
                 {"id": "ec2-1", "type": "compute", "name": "Web Server", "provider": "AWS"},
                 {"id": "db-1", "type": "database", "name": "MySQL Database", "provider": "AWS"},
@@ -192,10 +211,11 @@ resource "aws_db_instance" "default" {
         })
         
         # Generate diagram
-        result = self.generator.generate_infrastructure_diagram(
-            self.repo_path,
-            title="Test Infrastructure Diagram"
-        )
+        with analyze_content:
+            result = self.generator.generate_infrastructure_diagram(
+                self.repo_path,
+                title="Test Infrastructure Diagram"
+            )
         
         # Verify result structure
         self.assertEqual(result["title"], "Test Infrastructure Diagram")
@@ -1,65 +1,13 @@
 """
 Unit tests for the scenarios view generator.
 """
-import unittest
-from unittest.mock import MagicMock, patch
+from unittest.mock import MagicMock
 from pathlib import Path
-import os
-import tempfile
+import pytest
 
-from file_analyzer.ai_providers.mock_provider import MockAIProvider
 from file_analyzer.doc_generator.scenarios_view_generator import ScenariosViewGenerator
-from file_analyzer.core.file_reader import FileReader
-from file_analyzer.core.file_hasher import FileHasher
-from file_analyzer.core.cache_provider import InMemoryCache
 
-class TestScenariosViewGenerator(unittest.TestCase):
-    """Test case for the ScenariosViewGenerator class."""
-    
-    def setUp(self):
-        """Set up test fixtures."""
-        self.mock_provider = MockAIProvider()
-        self.cache = InMemoryCache()
-        self.file_reader = MagicMock(spec=FileReader)
-        self.file_hasher = FileHasher()
-        
-        # Create mock code analyzer
-        self.mock_code_analyzer = MagicMock()
-        
-        # Create generator with mock code analyzer
-        self.generator = ScenariosViewGenerator(
-            ai_provider=self.mock_provider,
-            code_analyzer=self.mock_code_analyzer,
-            file_reader=self.file_reader,
-            file_hasher=self.file_hasher,
-            cache_provider=self.cache
-        )
-        
-        # Repository path for testing
-        self.repo_path = Path("/test/repo")
-        
-        # Setup common mocks
-        self.generator._find_documentation_files = MagicMock(return_value=[
-            Path("/test/repo/README.md"),
-            Path("/test/repo/docs/usage.md")
-        ])
-        
-        self.generator._find_test_files = MagicMock(return_value=[
-            Path("/test/repo/tests/test_user_login.py"),
-            Path("/test/repo/tests/test_search.py")
-        ])
-        
-        self.generator._find_route_files = MagicMock(return_value=[
-            Path("/test/repo/src/routes.py"),
-            Path("/test/repo/src/api/endpoints.py")
-        ])
-    
-    def test_generate_use_case_diagram(self):
-        """Test generation of use case diagrams."""
-        # Mock file reading
-        def mock_read_file(file_path):
-            if "README.md" in str(file_path):
-                return """# Test Project
+_README_CONTENT = """# Test Project
                 
 This application allows users to:
 - Log in to the system
@@ -70,16 +18,16 @@ This application allows users to:
 Administrators can:
 - Manage user accounts
 - View system statistics"""
-            elif "usage.md" in str(file_path):
-                return """## User Guide
+
+_USAGE_GUIDE_CONTENT = """## User Guide
                 
 Regular users can perform the following actions:
 1. Login with email and password
 2. Search the database for items
 3. Upload new files to the system
 4. Download existing files"""
-            elif "routes.py" in str(file_path):
-                return """
+
+_ROUTES_CONTENT = """
 @app.route('/login', methods=['GET', 'POST'])
 def login():
     # Login implementation
@@ -100,8 +48,8 @@ def download_file(file_id):
     # Download implementation
     pass
 """
-            elif "endpoints.py" in str(file_path):
-                return """
+
+_ENDPOINTS_CONTENT = """
 @api.route('/users')
 class UserManagement(Resource):
     @admin_required
@@ -126,64 +74,8 @@ class SystemStats(Resource):
         # System stats implementation
         pass
 """
-            return ""
-        
-        self.file_reader.read_file.side_effect = mock_read_file
-        
-        # Mock AI provider response
-        self.mock_provider.analyze_content = MagicMock(return_value={
-            "actors": [
-                {"id": "user", "name": "User", "type": "human"},
-                {"id": "admin", "name": "Administrator", "type": "human"},
-                {"id": "system", "name": "System", "type": "system"}
-            ],
-            "use_cases": [
-                {"id": "login", "name": "Log in", "description": "Authenticate to the system"},
-                {"id": "search", "name": "Search items", "description": "Search database for items"},
-                {"id": "upload", "name": "Upload file", "description": "Upload new file to the system"},
-                {"id": "download", "name": "Download file", "description": "Download existing file"},
-                {"id": "manage_users", "name": "Manage users", "description": "CRUD operations on users"},
-                {"id": "view_stats", "name": "View statistics", "description": "View system statistics"}
-            ],
-            "relationships": [
-                {"actor": "user", "use_case": "login"},
-                {"actor": "user", "use_case": "search"},
-                {"actor": "user", "use_case": "upload"},
-                {"actor": "user", "use_case": "download"},
-                {"actor": "admin", "use_case": "login"},
-                {"actor": "admin", "use_case": "manage_users"},
-                {"actor": "admin", "use_case": "view_stats"},
-                {"actor": "system", "use_case": "view_stats", "type": "include"}
-            ]
-        })
-        
-        # Generate diagram
-        result = self.generator.generate_use_case_diagram(
-            self.repo_path,
-            title="Test Use Case Diagram"
-        )
-        
-        # Verify result structure
-        self.assertEqual(result["title"], "Test Use Case Diagram")
-        self.assertEqual(result["diagram_type"], "use_case")
-        self.assertEqual(result["syntax_type"], "mermaid")
-        
-        # Check diagram content
-        self.assertIn("graph TD", result["content"])
-        
-        # Check actors and use cases
-        self.assertTrue(len(result["actors"]) >= 2)  # At least 2 actors
-        self.assertTrue(len(result["use_cases"]) >= 4)  # At least 4 use cases
-        
-        # Verify stats
-        self.assertEqual(self.generator.stats["use_case_diagrams_generated"], 1)
-    
-    def test_generate_user_flow_diagram(self):
-        """Test generation of user flow diagrams."""
-        # Mock file reading
-        def mock_read_file(file_path):
-            if "test_user_login.py" in str(file_path):
-                return """def test_user_login():
+
+_TEST_USER_LOGIN_CONTENT = """def test_user_login():
     # Test user login flow
     client = create_client()
     
@@ -199,8 +91,8 @@ class SystemStats(Resource):
     response = client.get('/dashboard')
     assert response.status_code == 200
     assert 'Welcome, test' in response.text"""
-            elif "test_search.py" in str(file_path):
-                return """def test_search_flow():
+
+_TEST_SEARCH_CONTENT = """def test_search_flow():
     client = create_client()
     login(client)  # Login first
     
@@ -217,94 +109,231 @@ class SystemStats(Resource):
     response = client.get('/items/1')
     assert response.status_code == 200
     assert 'Item details' in response.text"""
-            return ""
-        
-        self.file_reader.read_file.side_effect = mock_read_file
-        
-        # Mock AI provider response
-        self.mock_provider.analyze_content = MagicMock(return_value={
-            "title": "User Login Flow",
-            "actor": "User",
-            "steps": [
-                {"id": "start", "name": "Start", "type": "start"},
-                {"id": "visit_login", "name": "Visit Login Page", "type": "action"},
-                {"id": "enter_credentials", "name": "Enter Credentials", "type": "action"},
-                {"id": "submit_form", "name": "Submit Login Form", "type": "action"},
-                {"id": "valid_credentials", "name": "Valid Credentials?", "type": "decision"},
-                {"id": "show_error", "name": "Show Error Message", "type": "action"},
-                {"id": "redirect_dashboard", "name": "Redirect to Dashboard", "type": "action"},
-                {"id": "end", "name": "End", "type": "end"}
-            ],
-            "flows": [
-                {"source": "start", "target": "visit_login"},
-                {"source": "visit_login", "target": "enter_credentials"},
-                {"source": "enter_credentials", "target": "submit_form"},
-                {"source": "submit_form", "target": "valid_credentials"},
-                {"source": "valid_credentials", "target": "redirect_dashboard", "label": "Yes"},
-                {"source": "valid_credentials", "target": "show_error", "label": "No"},
-                {"source": "show_error", "target": "enter_credentials"},
-                {"source": "redirect_dashboard", "target": "end"}
-            ]
-        })
-        
-        # Generate diagram
-        result = self.generator.generate_user_flow_diagram(
-            self.repo_path,
-            use_case="login",
-            title="Test User Flow Diagram"
-        )
-        
-        # Verify result structure
-        self.assertEqual(result["title"], "Test User Flow Diagram")
-        self.assertEqual(result["diagram_type"], "user_flow")
-        self.assertEqual(result["syntax_type"], "mermaid")
-        
-        # Check diagram content
-        self.assertIn("flowchart TD", result["content"])
-        
-        # Check steps and flows
-        self.assertTrue(len(result["steps"]) >= 5)  # At least 5 steps
-        self.assertTrue(len(result["flows"]) >= 4)  # At least 4 flows
-        
-        # Verify stats
-        self.assertEqual(self.generator.stats["user_flow_diagrams_generated"], 1)
+
+# Repository and file paths used by the mocked file discovery
+_REPO_PATH = Path("/test/repo")
+_README = _REPO_PATH / "README.md"
+_USAGE = _REPO_PATH / "docs" / "usage.md"
+_ROUTES = _REPO_PATH / "src" / "routes.py"
+_ENDPOINTS = _REPO_PATH / "src" / "api" / "endpoints.py"
+_TEST_LOGIN = _REPO_PATH / "tests" / "test_user_login.py"
+_TEST_SEARCH = _REPO_PATH / "tests" / "test_search.py"
+
+# File contents returned by the mocked FileReader, keyed by file name
+_USE_CASE_FILES = {
+    "README.md": _README_CONTENT,
+    "usage.md": _USAGE_GUIDE_CONTENT,
+    "routes.py": _ROUTES_CONTENT,
+    "endpoints.py": _ENDPOINTS_CONTENT
+}
+
+_USER_FLOW_FILES = {
+    "test_user_login.py": _TEST_USER_LOGIN_CONTENT,
+    "test_search.py": _TEST_SEARCH_CONTENT
+}
+
+# Use case analysis returned by the mocked AI provider
+_AI_USE_CASE_RESPONSE = {
+    "actors": [
+        {"id": "user", "name": "User", "type": "human"},
+        {"id": "admin", "name": "Administrator", "type": "human"},
+        {"id": "system", "name": "System", "type": "system"}
+    ],
+    "use_cases": [
+        {"id": "login", "name": "Log in", "description": "Authenticate to the system"},
+        {"id": "search", "name": "Search items", "description": "Search database for items"},
+        {"id": "upload", "name": "Upload file", "description": "Upload new file to the system"},
+        {"id": "download", "name": "Download file", "description": "Download existing file"},
+        {"id": "manage_users", "name": "Manage users", "description": "CRUD operations on users"},
+        {"id": "view_stats", "name": "View statistics", "description": "View system statistics"}
+    ],
+    "relationships": [
+        {"actor": "user", "use_case": "login"},
+        {"actor": "user", "use_case": "search"},
+        {"actor": "user", "use_case": "upload"},
+        {"actor": "user", "use_case": "download"},
+        {"actor": "admin", "use_case": "login"},
+        {"actor": "admin", "use_case": "manage_users"},
+        {"actor": "admin", "use_case": "view_stats"},
+        {"actor": "system", "use_case": "view_stats", "type": "include"}
+    ]
+}
+
+# User flow analysis returned by the mocked AI provider
+_AI_USER_FLOW_RESPONSE = {
+    "title": "User Login Flow",
+    "actor": "User",
+    "steps": [
+        {"id": "start", "name": "Start", "type": "start"},
+        {"id": "visit_login", "name": "Visit Login Page", "type": "action"},
+        {"id": "enter_credentials", "name": "Enter Credentials", "type": "action"},
+        {"id": "submit_form", "name": "Submit Login Form", "type": "action"},
+        {"id": "valid_credentials", "name": "Valid Credentials?", "type": "decision"},
+        {"id": "show_error", "name": "Show Error Message", "type": "action"},
+        {"id": "redirect_dashboard", "name": "Redirect to Dashboard", "type": "action"},
+        {"id": "end", "name": "End", "type": "end"}
+    ],
+    "flows": [
+        {"source": "start", "target": "visit_login"},
+        {"source": "visit_login", "target": "enter_credentials"},
+        {"source": "enter_credentials", "target": "submit_form"},
+        {"source": "submit_form", "target": "valid_credentials"},
+        {"source": "valid_credentials", "target": "redirect_dashboard", "label": "Yes"},
+        {"source": "valid_credentials", "target": "show_error", "label": "No"},
+        {"source": "show_error", "target": "enter_credentials"},
+        {"source": "redirect_dashboard", "target": "end"}
+    ]
+}
+
+@pytest.fixture(scope="session")
+def ai_response_mocks():
+    """Mocked analyze_content callables, keyed by scenario, built once per session."""
+    return {
+        "use_case": MagicMock(return_value=_AI_USE_CASE_RESPONSE),
+        "user_flow": MagicMock(return_value=_AI_USER_FLOW_RESPONSE)
+    }
+
+
+@pytest.fixture
+def analyze_content(mock_provider, ai_response_mocks, monkeypatch):
+    """Return a helper that points the provider at one scenario's shared mock."""
+    def use(scenario):
+        mock = ai_response_mocks[scenario]
+        mock.reset_mock()
+        monkeypatch.setattr(mock_provider, "analyze_content", mock)
+        return mock
+    
+    return use
+
+
+@pytest.fixture
+def generator(mock_provider, file_reader, file_hasher, noop_cache):
+    """Create a ScenariosViewGenerator with stubbed file discovery."""
+    generator = ScenariosViewGenerator(
+        ai_provider=mock_provider,
+        code_analyzer=MagicMock(),
+        file_reader=file_reader,
+        file_hasher=file_hasher,
+        cache_provider=noop_cache
+    )
+    
+    # Setup common mocks
+    generator._find_documentation_files = MagicMock(return_value=[_README, _USAGE])
+    generator._find_test_files = MagicMock(return_value=[_TEST_LOGIN, _TEST_SEARCH])
+    generator._find_route_files = MagicMock(return_value=[_ROUTES, _ENDPOINTS])
+    return generator
+
+
+@pytest.fixture
+def routing_generator(bare_generator):
+    """Create a bare generator for testing generate_diagram dispatch."""
+    return bare_generator(
+        ScenariosViewGenerator,
+        generate_use_case_diagram={"diagram_type": "use_case"},
+        generate_user_flow_diagram={"diagram_type": "user_flow"}
+    )
+
+
+def test_generate_use_case_diagram(generator, file_reader, analyze_content):
+    """Test generation of use case diagrams."""
+    # Mock file reading
+    file_reader.read_file = lambda path: _USE_CASE_FILES.get(Path(path).name, "")
+    
+    # Mock AI provider response
+    use_case_analysis = analyze_content("use_case")
     
-    def test_generate_diagram(self):
-        """Test the generate_diagram method."""
-        # Mock the specific generator methods
-        self.generator.generate_use_case_diagram = MagicMock(return_value={"diagram_type": "use_case"})
-        self.generator.generate_user_flow_diagram = MagicMock(return_value={"diagram_type": "user_flow"})
-        
-        # Test use case diagram
-        result = self.generator.generate_diagram(self.repo_path, "use_case")
-        self.assertEqual(result["diagram_type"], "use_case")
-        self.generator.generate_use_case_diagram.assert_called_once()
-        
-        # Test user flow diagram
-        result = self.generator.generate_diagram(self.repo_path, "user_flow", use_case="login")
-        self.assertEqual(result["diagram_type"], "user_flow")
-        self.generator.generate_user_flow_diagram.assert_called_once_with(self.repo_path, use_case="login", title=None)
-        
-        # Test invalid diagram type
-        with self.assertRaises(ValueError):
-            self.generator.generate_diagram(self.repo_path, "invalid_type")
+    # Generate diagram
+    result = generator.generate_use_case_diagram(
+        _REPO_PATH,
+        title="Test Use Case Diagram"
+    )
     
-    def test_get_stats(self):
-        """Test retrieving statistics."""
-        # Update stats manually to test retrieval
-        self.generator.stats["use_case_diagrams_generated"] = 3
-        self.generator.stats["user_flow_diagrams_generated"] = 2
-        self.generator.stats["actors_identified"] = 5
-        self.generator.stats["use_cases_identified"] = 12
-        
-        # Get stats
-        stats = self.generator.get_stats()
-        
-        # Verify stats
-        self.assertEqual(stats["use_case_diagrams_generated"], 3)
-        self.assertEqual(stats["user_flow_diagrams_generated"], 2)
-        self.assertEqual(stats["actors_identified"], 5)
-        self.assertEqual(stats["use_cases_identified"], 12)
-
-if __name__ == '__main__':
-    unittest.main()
\ No newline at end of file
+    # Verify result structure
+    assert result["title"] == "Test Use Case Diagram"
+    assert result["diagram_type"] == "use_case"
+    assert result["syntax_type"] == "mermaid"
+    
+    # Check diagram content
+    assert "graph TD" in result["content"]
+    
+    # Check actors and use cases
+    assert len(result["actors"]) >= 2  # At least 2 actors
+    assert len(result["use_cases"]) >= 4  # At least 4 use cases
+    
+    # Verify the AI analysis was requested once
+    use_case_analysis.assert_called_once()
+    
+    # Verify stats
+    assert generator.stats["use_case_diagrams_generated"] == 1
+
+
+def test_generate_user_flow_diagram(generator, file_reader, analyze_content):
+    """Test generation of user flow diagrams."""
+    # Mock file reading
+    file_reader.read_file = lambda path: _USER_FLOW_FILES.get(Path(path).name, "")
+    
+    # Mock AI provider response
+    analyze_content("user_flow")
+    
+    # Generate diagram
+    result = generator.generate_user_flow_diagram(
+        _REPO_PATH,
+        use_case="login",
+        title="Test User Flow Diagram"
+    )
+    
+    # Verify result structure
+    assert result["title"] == "Test User Flow Diagram"
+    assert result["diagram_type"] == "user_flow"
+    assert result["syntax_type"] == "mermaid"
+    
+    # Check diagram content
+    assert "flowchart TD" in result["content"]
+    
+    # Check steps and flows
+    assert len(result["steps"]) >= 5  # At least 5 steps
+    assert len(result["flows"]) >= 4  # At least 4 flows
+    
+    # Verify stats
+    assert generator.stats["user_flow_diagrams_generated"] == 1
+
+
+def test_get_stats(generator):
+    """Test retrieving statistics."""
+    # Update stats manually to test retrieval
+    generator.stats["use_case_diagrams_generated"] = 3
+    generator.stats["user_flow_diagrams_generated"] = 2
+    generator.stats["actors_identified"] = 5
+    generator.stats["use_cases_identified"] = 12
+    
+    # Get stats
+    stats = generator.get_stats()
+    
+    # Verify stats
+    assert stats["use_case_diagrams_generated"] == 3
+    assert stats["user_flow_diagrams_generated"] == 2
+    assert stats["actors_identified"] == 5
+    assert stats["use_cases_identified"] == 12
+
+
+def test_generate_diagram_use_case(routing_generator):
+    """Test that generate_diagram dispatches use case requests."""
+    result = routing_generator.generate_diagram(_REPO_PATH, "use_case")
+    
+    assert result["diagram_type"] == "use_case"
+    routing_generator.generate_use_case_diagram.assert_called_once()
+    assert routing_generator.stats["diagrams_generated"] == 1
+
+
+def test_generate_diagram_user_flow(routing_generator):
+    """Test that generate_diagram dispatches user flow requests with a default title."""
+    result = routing_generator.generate_diagram(_REPO_PATH, "user_flow", use_case="login")
+    
+    assert result["diagram_type"] == "user_flow"
+    routing_generator.generate_user_flow_diagram.assert_called_once_with(_REPO_PATH, use_case="login", title=None)
+
+
+def test_generate_diagram_invalid_type(routing_generator):
+    """Test that generate_diagram rejects unsupported diagram types."""
+    with pytest.raises(ValueError):
+        routing_generator.generate_diagram(_REPO_PATH, "invalid_type")
@@ -1,9 +1,10 @@
 """
 Unit tests for FileReader.
 """
+import tracemalloc
 import pytest
 from pathlib import Path
-import tempfile
+from unittest.mock import mock_open, patch
 
 from file_analyzer.core.file_reader import FileReader
 from file_analyzer.utils.exceptions import FileReadError
@@ -12,40 +13,80 @@ from file_analyzer.utils.exceptions import FileReadError
 class TestFileReader:
     """Unit tests for the FileReader class."""
     
-    def test_read_file_success(self):
+    @pytest.fixture
+    def text_file(self, tmp_path):
+        """Return the path of a not-yet-written text file in a temporary directory."""
+        return tmp_path / "f.txt"
+    
+    def test_read_file_success(self, text_file):
         """Test that a file can be read successfully."""
         # Arrange
         reader = FileReader()
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write("Test content")
-            filepath = f.name
+        text_file.write_text("Test content")
         
         # Act
-        content = reader.read_file(Path(filepath))
+        content = reader.read_file(text_file)
         
         # Assert
         assert content == "Test content"
-        
-        # Cleanup
-        Path(filepath).unlink()
     
-    def test_read_file_truncates_large_files(self):
+    def test_read_file_truncates_large_files(self, text_file):
         """Test that large files are truncated to max_size."""
         # Arrange
         reader = FileReader()
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write("A" * 10000)  # Write 10KB of content
-            filepath = f.name
+        text_file.write_text("A" * 10000)  # Write 10KB of content
         
         # Act
-        content = reader.read_file(Path(filepath), max_size=100)
+        content = reader.read_file(text_file, max_size=100)
         
         # Assert
         assert len(content) == 100
         assert content == "A" * 100
+    
+    @pytest.mark.slow
+    def test_read_file_truncates_very_large_files(self, text_file):
+        """Test that reading the start of a 1 MB file doesn't load the whole file."""
+        # Arrange
+        reader = FileReader()
+        text_file.write_text("A" * 1_000_000)
         
-        # Cleanup
-        Path(filepath).unlink()
+        # Act
+        tracemalloc.start()
+        try:
+            content = reader.read_file(text_file)
+            _, peak = tracemalloc.get_traced_memory()
+        finally:
+            tracemalloc.stop()
+        
+        # Assert - Only about one read buffer is held, not the whole file
+        assert content == "A" * 4000
+        assert peak < 4 * FileReader.CHUNK_SIZE
+    
+    @pytest.mark.parametrize("size", [100, 8192, FileReader.CHUNK_SIZE, 2 * FileReader.CHUNK_SIZE])
+    def test_read_file_truncates_at_chunk_boundaries(self, text_file, size):
+        """Test that truncation is exact below, at and above the read chunk size."""
+        # Arrange
+        reader = FileReader()
+        text_file.write_text("A" * size + "B" * 100)
+        
+        # Act
+        content = reader.read_file(text_file, max_size=size)
+        
+        # Assert
+        assert content == "A" * size
+    
+    def test_read_file_reads_only_max_size(self, text_file):
+        """Test that only max_size characters are read from the file."""
+        # Arrange
+        reader = FileReader()
+        
+        # Act - Serve the file from memory
+        with patch.object(Path, "open", mock_open(read_data="A" * 10000)) as mock_file:
+            content = reader.read_file(text_file, max_size=100)
+        
+        # Assert - The rest of the file is never read
+        assert content == "A" * 100
+        mock_file.return_value.read.assert_called_once_with(100)
     
     def test_read_file_handles_nonexistent_file(self):
         """Test that attempting to read a nonexistent file raises FileReadError."""
@@ -57,19 +98,14 @@ class TestFileReader:
         with pytest.raises(FileReadError):
             reader.read_file(filepath)
             
-    def test_read_file_supports_string_path(self):
+    def test_read_file_supports_string_path(self, text_file):
         """Test that the file reader accepts string paths."""
         # Arrange
         reader = FileReader()
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            f.write("String path test")
-            filepath = f.name
+        text_file.write_text("String path test")
         
         # Act
-        content = reader.read_file(filepath)  # Pass string instead of Path
+        content = reader.read_file(str(text_file))  # Pass string instead of Path
         
         # Assert
         assert content == "String path test"
-        
-        # Cleanup
-        Path(filepath).unlink()
\ No newline at end of file
@@ -1,9 +1,8 @@
 """
 Unit tests for FileTypeAnalyzer.
 """
+import pytest
 from unittest.mock import MagicMock, patch
-import tempfile
-from pathlib import Path
 
 from file_analyzer.core.file_type_analyzer import FileTypeAnalyzer
 from file_analyzer.core.file_reader import FileReader
@@ -13,18 +12,36 @@ from file_analyzer.ai_providers.mock_provider import MockAIProvider
 from file_analyzer.utils.exceptions import FileReadError
 
 
+@pytest.fixture(scope="module")
+def mock_provider():
+    """Create a mock AI provider shared by the module's tests."""
+    return MockAIProvider()
+
+
+@pytest.fixture(scope="module")
+def analyzer(mock_provider):
+    """Create a cached file type analyzer shared by the module's tests."""
+    return FileTypeAnalyzer(
+        ai_provider=mock_provider,
+        cache_provider=InMemoryCache()
+    )
+
+
+@pytest.fixture(autouse=True)
+def reset_analyzer_cache(request):
+    """Clear the shared analyzer's cache after each test."""
+    if "analyzer" in request.fixturenames:
+        request.addfinalizer(request.getfixturevalue("analyzer").cache_provider.clear)
+
+
 class TestFileTypeAnalyzer:
     """Unit tests for the FileTypeAnalyzer class."""
     
-    def test_analyze_file_success(self):
+    def test_analyze_file_success(self, analyzer, tmp_path):
         """Test successful file analysis."""
         # Arrange
-        mock_provider = MockAIProvider()
-        analyzer = FileTypeAnalyzer(ai_provider=mock_provider)
-        
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("def test(): pass")
-            filepath = f.name
+        filepath = tmp_path / "test.py"
+        filepath.write_text("def test(): pass")
         
         # Act
         result = analyzer.analyze_file(filepath)
@@ -33,47 +50,31 @@ class TestFileTypeAnalyzer:
         assert result["file_type"] == "code"
         assert result["language"] == "python"
         
-        # Cleanup
-        Path(filepath).unlink()
-        
-    def test_analyze_file_with_cache(self):
+    def test_analyze_file_with_cache(self, analyzer, mock_provider, tmp_path):
         """Test that results are cached and reused."""
         # Arrange
-        mock_provider = MockAIProvider()
-        analyze_spy = MagicMock(wraps=mock_provider.analyze_content)
-        mock_provider.analyze_content = analyze_spy
-        
-        cache = InMemoryCache()
-        analyzer = FileTypeAnalyzer(
-            ai_provider=mock_provider,
-            cache_provider=cache
-        )
-        
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("def test(): pass")
-            filepath = f.name
-        
-        # Act - First call
-        result1 = analyzer.analyze_file(filepath)
-        
-        # Should have called the AI provider
-        assert analyze_spy.call_count == 1
-        
-        # Act - Second call
-        result2 = analyzer.analyze_file(filepath)
+        filepath = tmp_path / "test.py"
+        filepath.write_text("def test(): pass")
+        
+        with patch.object(
+            mock_provider, "analyze_content", wraps=mock_provider.analyze_content
+        ) as analyze_spy:
+            # Act - First call
+            result1 = analyzer.analyze_file(filepath)
+            
+            # Should have called the AI provider
+            assert analyze_spy.call_count == 1
+            
+            # Act - Second call
+            result2 = analyzer.analyze_file(filepath)
         
         # Assert - Should have used the cache
         assert analyze_spy.call_count == 1  # Still just one call
         assert result1 == result2
         
-        # Cleanup
-        Path(filepath).unlink()
-        
-    def test_analyze_file_read_error(self):
+    def test_analyze_file_read_error(self, mock_provider):
         """Test handling of file read errors."""
         # Arrange
-        mock_provider = MockAIProvider()
-        
         # Mock reader that raises an error
         mock_reader = MagicMock(spec=FileReader)
         mock_reader.read_file.side_effect = FileReadError("Failed to read file")
@@ -96,37 +97,34 @@ class TestFileTypeAnalyzer:
         mock_provider = MagicMock()
         mock_provider.analyze_content.side_effect = Exception("Unexpected error")
         
-        analyzer = FileTypeAnalyzer(ai_provider=mock_provider)
+        # The provider fails before the content matters, so no file is needed
+        mock_reader = MagicMock(spec=FileReader)
+        mock_reader.read_file.return_value = ""
         
-        with tempfile.NamedTemporaryFile(mode='w', delete=False) as f:
-            filepath = f.name
+        analyzer = FileTypeAnalyzer(
+            ai_provider=mock_provider,
+            file_reader=mock_reader
+        )
         
         # Act
-        result = analyzer.analyze_file(filepath)
+        result = analyzer.analyze_file("/path/to/empty")
         
         # Assert
         assert "error" in result
         assert "Unexpected error" in result["error"]
         assert result["file_type"] == "unknown"
         
-        # Cleanup
-        Path(filepath).unlink()
-        
-    def test_file_path_types(self):
+    def test_file_path_types(self, analyzer, tmp_path):
         """Test that both string and Path objects are accepted for file_path."""
         # Arrange
-        mock_provider = MockAIProvider()
-        analyzer = FileTypeAnalyzer(ai_provider=mock_provider)
-        
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("def test(): pass")
-            filepath = f.name
+        filepath = tmp_path / "test.py"
+        filepath.write_text("def test(): pass")
         
         # Act - Test with string path
-        result1 = analyzer.analyze_file(filepath)
+        result1 = analyzer.analyze_file(str(filepath))
         
         # Act - Test with Path object
-        result2 = analyzer.analyze_file(Path(filepath))
+        result2 = analyzer.analyze_file(filepath)
         
         # Assert
         assert result1["file_type"] == "code"
@@ -134,5 +132,28 @@ class TestFileTypeAnalyzer:
         assert result2["file_type"] == "code"
         assert result2["language"] == "python"
         
-        # Cleanup
-        Path(filepath).unlink()
\ No newline at end of file
+    def test_analyze_files_matches_analyze_file(self, analyzer, mock_provider, tmp_path):
+        """Test that batch analysis returns the same results as single-file analysis."""
+        # Arrange
+        py_path = tmp_path / "main.py"
+        py_path.write_text("def main(): pass")
+        md_path = tmp_path / "README.md"
+        md_path.write_text("# Project")
+        missing_path = tmp_path / "missing.txt"
+        
+        with patch.object(
+            mock_provider, "analyze_content", wraps=mock_provider.analyze_content
+        ) as analyze_spy:
+            # Warm the cache for one of the files
+            py_result = analyzer.analyze_file(py_path)
+            
+            # Act
+            results = analyzer.analyze_files([py_path, str(md_path), missing_path])
+            
+            # Assert - Results keep the input order and reuse the cache
+            assert list(results) == [str(py_path), str(md_path), str(missing_path)]
+            assert results[str(py_path)] == py_result
+            assert results[str(md_path)] == analyzer.analyze_file(md_path)
+        assert "error" in results[str(missing_path)]
+        assert results[str(missing_path)]["file_type"] == "unknown"
+        assert analyze_spy.call_count == 2
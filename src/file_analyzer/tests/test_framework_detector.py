@@ -2,29 +2,70 @@
 Unit tests for the framework detector component.
 """
 import os
+from functools import lru_cache
 from pathlib import Path
 import pytest
-from unittest.mock import MagicMock, patch, mock_open
+from unittest.mock import patch, mock_open
 
 from file_analyzer.core.framework_detector import FrameworkDetector, FRAMEWORK_SIGNATURES
-from file_analyzer.core.file_type_analyzer import FileTypeAnalyzer
-from file_analyzer.core.code_analyzer import CodeAnalyzer
 from file_analyzer.ai_providers.mock_provider import MockAIProvider
 from file_analyzer.ai_providers.provider_interface import AIModelProvider
 from file_analyzer.core.cache_provider import InMemoryCache
-from file_analyzer.core.file_reader import FileReader
 
 
-class TestFrameworkDetector:
-    """Unit tests for the FrameworkDetector class."""
+# (file, language, imports, content, framework name, evidence, features)
+_FRAMEWORK_CASES = [
+    (
+        "django_app.py", "python",
+        ["from django.db import models", "from django.http import HttpResponse"],
+        "from django.db import models\nclass MyModel(models.Model): pass",
+        "django", ["Import: django.db"], ["models.Model"]
+    ),
+    (
+        "flask_app.py", "python",
+        ["from flask import Flask"],
+        "from flask import Flask\n"
+        "app = Flask(__name__)\n"
+        "@app.route('/')\n"
+        "def index(): return 'Hello'",
+        "flask", ["Import: flask"], ["Flask", "@app.route"]
+    ),
+    (
+        "react_app.js", "javascript",
+        ["import React from 'react'"],
+        "import React from 'react';\n"
+        "function App() {\n"
+        "  return <div>Hello</div>;\n"
+        "}",
+        "react", ["Import: react"], ["JSX"]
+    ),
+    (
+        "SpringController.java", "java",
+        ["import org.springframework.boot.SpringApplication"],
+        "import org.springframework.boot.SpringApplication;\n"
+        "import org.springframework.boot.autoconfigure.SpringBootApplication;\n"
+        "@SpringBootApplication\n"
+        "public class DemoApplication {}",
+        "spring", ["Import: org.springframework"], ["@SpringBootApplication"]
+    ),
+]
+_FRAMEWORK_CASE_IDS = ["django", "flask", "react", "spring"]
+
+
+@lru_cache(maxsize=32)
+def _file_name(file_path):
+    """Return the file name of a path, memoized across the stubs' repeated lookups."""
+    return Path(file_path).name
+
+
+class _FakeAIProvider(AIModelProvider):
+    """AI provider stub returning fixed framework and code analysis results."""
     
-    @pytest.fixture
-    def mock_ai_provider(self):
-        """Create a fully mocked AI provider."""
-        provider = MagicMock(spec=AIModelProvider)
-        
-        # Mock AI framework detection results
-        provider.detect_frameworks.return_value = {
+    def analyze_content(self, file_path, content):
+        return {"file_type": "code", "language": "python", "confidence": 0.9}
+    
+    def detect_frameworks(self, file_path, content, language):
+        return {
             "frameworks": [
                 {
                     "name": "django",
@@ -35,9 +76,9 @@ class TestFrameworkDetector:
             ],
             "confidence": 0.9
         }
-        
-        # Mock code analysis results for different languages
-        provider.analyze_code.return_value = {
+    
+    def analyze_code(self, file_path, content, language):
+        return {
             "structure": {
                 "imports": ["from django.db import models"],
                 "classes": [{"name": "MyModel", "methods": [], "properties": []}],
@@ -46,81 +87,92 @@ class TestFrameworkDetector:
                 "confidence": 0.9
             }
         }
-        
-        return provider
+
+
+class _FakeFileReader:
+    """File reader stub serving contents by file name."""
+    
+    def __init__(self, contents):
+        self.contents = contents
+    
+    def read_file(self, file_path, max_size=4000):
+        return self.contents.get(_file_name(file_path), "")
+
+
+class _FakeCodeAnalyzer:
+    """Code analyzer stub returning analysis results by file name."""
+    
+    def __init__(self, results):
+        self.results = results
+    
+    def analyze_code(self, file_path):
+        return self.results.get(_file_name(file_path), {"language": "unknown", "structure": {}})
+
+
+class _FakeFileTypeAnalyzer:
+    """File type analyzer stub detecting languages by file name."""
+    
+    def __init__(self, languages):
+        self.languages = languages
+    
+    def analyze_file(self, file_path):
+        language = self.languages.get(_file_name(file_path), "unknown")
+        return {
+            "file_type": "code" if language in ["python", "javascript", "java"] else "data",
+            "language": language,
+            "confidence": 0.9
+        }
+
+
+@pytest.fixture(scope="module")
+def mock_ai_provider():
+    """Create a stateless stub AI provider shared by the module's tests."""
+    return _FakeAIProvider()
+
+
+class TestFrameworkDetector:
+    """Unit tests for the FrameworkDetector class."""
     
     @pytest.fixture
     def mock_file_reader(self):
-        """Create a mocked file reader."""
-        file_reader = MagicMock(spec=FileReader)
-        
+        """Create a stub file reader."""
         # Create mock content for different file types
-        file_contents = {
+        return _FakeFileReader({
             "django_app.py": "from django.db import models\nfrom django.http import HttpResponse",
             "flask_app.py": "from flask import Flask\napp = Flask(__name__)",
             "react_app.js": "import React from 'react'\nfunction App() { return <div>Hello</div> }",
             "SpringController.java": "import org.springframework.boot.SpringApplication\n@SpringBootApplication",
             "requirements.txt": "django==3.2.4\nflask==2.0.1",
             "package.json": '{"dependencies": {"react": "^17.0.2"}}'
-        }
-        
-        def mock_read_file(file_path):
-            filename = Path(file_path).name
-            return file_contents.get(filename, "")
-        
-        file_reader.read_file.side_effect = mock_read_file
-        return file_reader
+        })
     
     @pytest.fixture
-    def mock_code_analyzer(self, mock_ai_provider):
-        """Create a mocked code analyzer."""
-        code_analyzer = MagicMock(spec=CodeAnalyzer)
-        
+    def mock_code_analyzer(self):
+        """Create a stub code analyzer."""
         # Mock analysis results for different file types
-        analysis_results = {
+        return _FakeCodeAnalyzer({
             "django_app.py": {"language": "python", "structure": {"imports": ["from django.db import models"]}},
             "flask_app.py": {"language": "python", "structure": {"imports": ["from flask import Flask"]}},
             "react_app.js": {"language": "javascript", "structure": {"imports": ["import React from 'react'"]}},
             "SpringController.java": {"language": "java", "structure": {"imports": ["import org.springframework.boot.SpringApplication"]}}
-        }
-        
-        def mock_analyze_code(file_path):
-            filename = Path(file_path).name
-            return analysis_results.get(filename, {"language": "unknown", "structure": {}})
-        
-        code_analyzer.analyze_code.side_effect = mock_analyze_code
-        return code_analyzer
+        })
     
     @pytest.fixture
     def mock_file_type_analyzer(self):
-        """Create a mocked file type analyzer."""
-        file_type_analyzer = MagicMock(spec=FileTypeAnalyzer)
-        
+        """Create a stub file type analyzer."""
         # Mock language detection for different file types
-        language_results = {
+        return _FakeFileTypeAnalyzer({
             "django_app.py": "python",
             "flask_app.py": "python",
             "react_app.js": "javascript",
             "SpringController.java": "java",
             "requirements.txt": "python",
             "package.json": "javascript"
-        }
-        
-        def mock_analyze_file(file_path):
-            filename = Path(file_path).name
-            language = language_results.get(filename, "unknown")
-            return {
-                "file_type": "code" if language in ["python", "javascript", "java"] else "data",
-                "language": language,
-                "confidence": 0.9
-            }
-        
-        file_type_analyzer.analyze_file.side_effect = mock_analyze_file
-        return file_type_analyzer
+        })
     
     @pytest.fixture
     def detector(self, mock_ai_provider, mock_code_analyzer, mock_file_type_analyzer, mock_file_reader):
-        """Create a fully mocked framework detector."""
+        """Create a framework detector wired to stub components."""
         return FrameworkDetector(
             ai_provider=mock_ai_provider,
             code_analyzer=mock_code_analyzer,
@@ -129,193 +181,129 @@ class TestFrameworkDetector:
             cache_provider=InMemoryCache()
         )
     
+    @pytest.mark.parametrize(
+        "file,language,imports,content,fw_name,evidence,features",
+        _FRAMEWORK_CASES,
+        ids=_FRAMEWORK_CASE_IDS
+    )
     @patch("file_analyzer.core.framework_detector.FrameworkDetector._identify_frameworks_in_file")
-    def test_detect_frameworks_django(self, mock_identify, detector):
-        """Test framework detection for Django."""
-        # Setup mock file path
-        django_file = Path("/mocked/django_app.py")
-        
-        # Mock specific framework detection for this test
-        detector.code_analyzer.analyze_code.return_value = {
-            "language": "python",
-            "structure": {
-                "imports": ["from django.db import models", "from django.http import HttpResponse"],
-                "classes": [{"name": "MyModel", "methods": [], "properties": []}]
-            }
+    def test_detect_frameworks(self, mock_identify, detector, file, language, imports, content,
+                               fw_name, evidence, features):
+        """Test framework detection for Django, Flask, React and Spring Boot."""
+        # Stub the file analysis for this case
+        detector.code_analyzer.results[file] = {
+            "language": language,
+            "structure": {"imports": imports}
         }
-        
-        # Set up the file reader to return Django-specific content
-        detector.file_reader.read_file.return_value = "from django.db import models\nclass MyModel(models.Model): pass"
+        detector.file_reader.contents[file] = content
         
         # Mock the internal _identify_frameworks_in_file method to return our desired results
         mock_identify.return_value = [
             {
-                "name": "django",
+                "name": fw_name,
                 "confidence": 0.9,
-                "evidence": ["Import: django.db"],
-                "features": ["models.Model"]
+                "evidence": evidence,
+                "features": features
             }
         ]
         
         # Call the method being tested
-        result = detector.detect_frameworks(django_file)
+        result = detector.detect_frameworks(Path("/mocked") / file)
         
         # Check result structure
         assert "file_path" in result
         assert "language" in result
-        assert "frameworks" in result
         assert isinstance(result["frameworks"], list)
         
         # Check that the framework was detected
-        assert len(result["frameworks"]) > 0
-        assert result["frameworks"][0]["name"] == "django"
-        assert result["frameworks"][0]["confidence"] > 0.5
+        detected = {framework["name"].lower(): framework for framework in result["frameworks"]}
+        assert fw_name in detected, f"{fw_name} framework not detected"
+        assert detected[fw_name]["confidence"] > 0.5
+        assert len(detected[fw_name]["evidence"]) > 0
     
-    @patch("file_analyzer.core.framework_detector.FrameworkDetector._identify_frameworks_in_file")
-    def test_detect_frameworks_flask(self, mock_identify, detector):
-        """Test framework detection for Flask."""
-        # Setup mock file path
-        flask_file = Path("/mocked/flask_app.py")
-        
-        # Mock specific framework detection for this test
-        detector.code_analyzer.analyze_code.return_value = {
-            "language": "python",
-            "structure": {
-                "imports": ["from flask import Flask"],
-                "classes": []
-            }
-        }
-        
-        # Set up the file reader to return Flask-specific content
-        detector.file_reader.read_file.return_value = (
-            "from flask import Flask\n"
-            "app = Flask(__name__)\n"
-            "@app.route('/')\n"
-            "def index(): return 'Hello'"
-        )
-        
-        # Mock the internal _identify_frameworks_in_file method to return our desired results
-        mock_identify.return_value = [
-            {
-                "name": "flask",
-                "confidence": 0.9,
-                "evidence": ["Import: flask"],
-                "features": ["Flask", "@app.route"]
-            }
-        ]
-        
-        # Call the method being tested
-        result = detector.detect_frameworks(flask_file)
-        
-        # Check for Flask detection
-        flask_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "flask":
-                flask_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
-        
-        assert flask_found, "Flask framework not detected"
+    def test_detect_frameworks_uses_cache(self, detector):
+        """Test that repeated detection on the same file is served from the cache."""
+        # Arrange
+        django_file = Path("/mocked/django_app.py")
+        analyze_code = detector.code_analyzer.analyze_code
+        
+        # Act
+        with patch.object(detector.code_analyzer, "analyze_code", wraps=analyze_code) as spy:
+            first = detector.detect_frameworks(django_file)
+            second = detector.detect_frameworks(django_file)
+        
+        # Assert
+        spy.assert_called_once()
+        assert second == first
+        assert detector.detection_stats["total_files_analyzed"] == 2
+        assert detector.detection_stats["languages"]["python"] == 2
     
-    @patch("file_analyzer.core.framework_detector.FrameworkDetector._identify_frameworks_in_file")
-    def test_detect_frameworks_react(self, mock_identify, detector):
-        """Test framework detection for React."""
-        # Setup mock file path
-        react_file = Path("/mocked/react_app.js")
-        
-        # Mock specific framework detection for this test
-        detector.code_analyzer.analyze_code.return_value = {
-            "language": "javascript",
-            "structure": {
-                "imports": ["import React from 'react'"],
-                "functions": [{"name": "App", "parameters": []}]
-            }
-        }
-        
-        # Set up the file reader to return React-specific content
-        detector.file_reader.read_file.return_value = (
-            "import React from 'react';\n"
-            "function App() {\n"
-            "  return <div>Hello</div>;\n"
-            "}"
-        )
-        
-        # Mock the internal _identify_frameworks_in_file method to return our desired results
-        mock_identify.return_value = [
-            {
-                "name": "react",
-                "confidence": 0.9,
-                "evidence": ["Import: react"],
-                "features": ["JSX"]
+    def test_detect_frameworks_cache_is_per_path(self, detector, tmp_path):
+        """Test that identical files at different paths are not served each other's results."""
+        # Arrange
+        settings_file = tmp_path / "migrations" / "settings.py"
+        conf_file = tmp_path / "a" / "conf.py"
+        for file_path in (settings_file, conf_file):
+            file_path.parent.mkdir()
+            file_path.write_text("DEBUG = True\n")
+            detector.file_reader.contents[file_path.name] = "DEBUG = True\n"
+            detector.code_analyzer.results[file_path.name] = {
+                "language": "python",
+                "structure": {"imports": []}
             }
-        ]
-        
-        # Call the method being tested
-        result = detector.detect_frameworks(react_file)
         
-        # Check for React detection
-        react_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "react":
-                react_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
+        # Act
+        settings_result = detector.detect_frameworks(settings_file)
+        conf_result = detector.detect_frameworks(conf_file)
         
-        assert react_found, "React framework not detected"
+        # Assert
+        assert [fw["name"] for fw in settings_result["frameworks"]] == ["django"]
+        assert conf_result["file_path"] == str(conf_file)
+        assert conf_result["frameworks"] == []
     
-    @patch("file_analyzer.core.framework_detector.FrameworkDetector._identify_frameworks_in_file")
-    def test_detect_frameworks_spring(self, mock_identify, detector):
-        """Test framework detection for Spring Boot."""
-        # Setup mock file path
-        spring_file = Path("/mocked/SpringController.java")
-        
-        # Mock specific framework detection for this test
-        detector.code_analyzer.analyze_code.return_value = {
-            "language": "java",
-            "structure": {
-                "imports": ["import org.springframework.boot.SpringApplication"],
-                "classes": [{"name": "DemoApplication", "methods": [], "properties": []}]
-            }
-        }
-        
-        # Set up the file reader to return Spring-specific content
-        detector.file_reader.read_file.return_value = (
-            "import org.springframework.boot.SpringApplication;\n"
-            "import org.springframework.boot.autoconfigure.SpringBootApplication;\n"
-            "@SpringBootApplication\n"
-            "public class DemoApplication {}"
-        )
-        
-        # Mock the internal _identify_frameworks_in_file method to return our desired results
-        mock_identify.return_value = [
-            {
-                "name": "spring",
-                "confidence": 0.9,
-                "evidence": ["Import: org.springframework"],
-                "features": ["@SpringBootApplication"]
-            }
-        ]
-        
-        # Call the method being tested
-        result = detector.detect_frameworks(spring_file)
-        
-        # Check for Spring detection
-        spring_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "spring":
-                spring_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
-        
-        assert spring_found, "Spring framework not detected"
+    @pytest.mark.parametrize(
+        "file,language,imports,content,fw_name,evidence,features",
+        _FRAMEWORK_CASES,
+        ids=_FRAMEWORK_CASE_IDS
+    )
+    def test_identify_frameworks_in_file(self, detector, file, language, imports, content,
+                                         fw_name, evidence, features):
+        """Test rule-based signature matching on each framework's sample file."""
+        # Arrange
+        detector.file_reader.contents[file] = content
+        code_analysis = {"language": language, "structure": {"imports": imports}}
+        
+        # Act
+        frameworks = detector._identify_frameworks_in_file(Path("/mocked") / file, language, code_analysis)
+        
+        # Assert
+        detected = {framework["name"]: framework for framework in frameworks}
+        assert fw_name in detected
+        assert detected[fw_name]["confidence"] > 0.2
+        assert any(item.startswith("Import: ") for item in detected[fw_name]["evidence"])
+    
+    def test_identify_frameworks_without_content_markers(self, detector):
+        """Test that file and directory signatures detect a framework the content never names."""
+        # Arrange
+        settings_file = Path("/mocked/shop/migrations/settings.py")
+        detector.file_reader.contents["settings.py"] = "DEBUG = True\n"
+        code_analysis = {"language": "python", "structure": {"imports": []}}
+        
+        # Act
+        frameworks = detector._identify_frameworks_in_file(settings_file, "python", code_analysis)
+        
+        # Assert
+        detected = {framework["name"]: framework for framework in frameworks}
+        assert "django" in detected
+        assert detected["django"]["evidence"] == ["File name: settings.py", "Directory: migrations"]
     
     def test_extract_version_info(self, detector):
         """Test version extraction from requirements.txt."""
         # Setup mock file path
         requirements_file = Path("/mocked/requirements.txt")
         
-        # Mock file reader to return requirements content
-        detector.file_reader.read_file.return_value = (
+        # Stub the requirements content
+        detector.file_reader.contents["requirements.txt"] = (
             "django==3.2.4\n"
             "flask==2.0.1\n"
             "pandas==1.3.0\n"
@@ -331,17 +319,34 @@ class TestFrameworkDetector:
         assert "flask" in versions
         assert versions["flask"] == "2.0.1"
     
-    @patch('pathlib.Path.exists', return_value=True)
-    @patch('os.walk')
+    def test_extract_version_info_line_anchored(self, detector):
+        """Test that requirement pins are only read from the start of a line."""
+        # Arrange
+        requirements_file = Path("/mocked/requirements.txt")
+        detector.file_reader.contents["requirements.txt"] = (
+            "  zope.interface == 5.4.0\n"
+            "# pinned upstream: celery==5.1.2\n"
+            "requests>=2.25\n"
+            + "x" * 5000 + "\n"
+            "numpy==1.20.3"
+        )
+        
+        # Act
+        versions = detector._extract_version_info(requirements_file, "python")
+        
+        # Assert
+        assert versions == {"zope.interface": "5.4.0", "numpy": "1.20.3"}
+    
     @patch('file_analyzer.core.framework_detector.FrameworkDetector.detect_frameworks')
-    def test_repository_analysis(self, mock_detect, mock_walk, mock_exists, detector):
+    def test_repository_analysis(self, mock_detect, detector):
         """Test full repository analysis with mocks."""
         # Mock directory to analyze
         repo_path = Path("/mocked/repo")
         
-        # Mock os.walk to return a list of files
-        mock_walk.return_value = [
-            (str(repo_path), [], ["django_app.py", "flask_app.py", "react_app.js", "requirements.txt"])
+        # Stub file discovery to return a list of files
+        detector._find_code_files = lambda path: [
+            path / name
+            for name in ["django_app.py", "flask_app.py", "react_app.js", "requirements.txt"]
         ]
         
         # Set framework detection results for different files
@@ -409,6 +414,23 @@ class TestFrameworkDetector:
         for framework in ["django", "flask", "react"]:
             assert framework in framework_names
     
+    def test_find_code_files(self, detector, tmp_path):
+        """Test that the repository walk keeps code and version files outside excluded directories."""
+        # Arrange
+        for relative in ["app.py", "pkg/view.jsx", "package.json", "README.md",
+                         "node_modules/lib/index.js", "pkg/__pycache__/view.py"]:
+            file_path = tmp_path / relative
+            file_path.parent.mkdir(parents=True, exist_ok=True)
+            file_path.write_text("")
+        
+        # Act
+        code_files = detector._find_code_files(tmp_path)
+        
+        # Assert
+        assert sorted(p.relative_to(tmp_path).as_posix() for p in code_files) == [
+            "app.py", "package.json", "pkg/view.jsx"
+        ]
+    
     def test_ai_provider_integration(self, detector):
         """Test integration with AI provider's detect_frameworks method."""
         # Setup mock file path
@@ -418,8 +440,8 @@ class TestFrameworkDetector:
         content = "import unknown_framework\nfrom unknown_framework import Component"
         language = "python"
         
-        # Setup the detector's AI provider to return framework info
-        detector.ai_provider.detect_frameworks = MagicMock(return_value={
+        # Setup the shared AI provider to return framework info for this test only
+        with patch.object(detector.ai_provider, "detect_frameworks", return_value={
             "frameworks": [
                 {
                     "name": "unknown-framework",
@@ -429,13 +451,12 @@ class TestFrameworkDetector:
                 }
             ],
             "confidence": 0.7
-        })
-        
-        # Directly call the method that uses the AI provider
-        result = detector._detect_frameworks_with_ai(file_path, language, content)
+        }) as mock_detect:
+            # Directly call the method that uses the AI provider
+            result = detector._detect_frameworks_with_ai(file_path, language, content)
         
         # Verify the AI provider was used and results returned
-        detector.ai_provider.detect_frameworks.assert_called_once_with(str(file_path), content, language)
+        mock_detect.assert_called_once_with(str(file_path), content, language)
         assert len(result) > 0
         assert result[0]["name"] == "unknown-framework"
         assert result[0]["confidence"] == 0.7
@@ -445,13 +466,13 @@ class TestFrameworkDetector:
         # Setup mock file path for Ruby file
         ruby_file = Path("/mocked/test.rb")
         
-        # Set up mocks for unsupported language
-        detector.code_analyzer.analyze_code.return_value = {
+        # Set up stubs for unsupported language
+        detector.code_analyzer.results["test.rb"] = {
             "language": "ruby",  # Unsupported language
             "structure": {}
         }
         
-        detector.file_reader.read_file.return_value = "puts 'Hello, Ruby!'"
+        detector.file_reader.contents["test.rb"] = "puts 'Hello, Ruby!'"
         
         # Call the method being tested
         result = detector.detect_frameworks(ruby_file)
@@ -4,7 +4,6 @@ Integration tests for the framework detector component.
 These tests use real files and real dependencies (no mocks).
 """
 import os
-import tempfile
 from pathlib import Path
 import pytest
 
@@ -15,137 +14,154 @@ from file_analyzer.ai_providers.mock_provider import MockAIProvider
 from file_analyzer.core.cache_provider import InMemoryCache
 
 
-class TestFrameworkDetectorIntegration:
-    """Integration tests for the FrameworkDetector class with real files."""
+# Python file with Django
+_DJANGO_SRC = b"""\
+from django.db import models
+from django.http import HttpResponse
+
+class MyModel(models.Model):
+    name = models.CharField(max_length=100)
+
+def my_view(request):
+    return HttpResponse("Hello, Django!")
+"""
+
+# Python file with Flask
+_FLASK_SRC = b"""\
+from flask import Flask, render_template
+
+app = Flask(__name__)
+
+@app.route('/')
+def index():
+    return render_template('index.html')
+"""
+
+# JavaScript file with React
+_REACT_SRC = b"""\
+import React, { useState } from 'react';
+
+function App() {
+    const [count, setCount] = useState(0);
+
+    return (
+        <div>
+            <h1>Hello, React!</h1>
+            <button onClick={() => setCount(count + 1)}>
+                Count: {count}
+            </button>
+        </div>
+    );
+}
+
+export default App;
+"""
+
+# Java file with Spring Boot
+_SPRING_SRC = b"""\
+package com.example.demo;
+
+import org.springframework.boot.SpringApplication;
+import org.springframework.boot.autoconfigure.SpringBootApplication;
+import org.springframework.web.bind.annotation.GetMapping;
+import org.springframework.web.bind.annotation.RestController;
+
+@SpringBootApplication
+public class DemoApplication {
+    public static void main(String[] args) {
+        SpringApplication.run(DemoApplication.class, args);
+    }
+}
+
+@RestController
+class HelloController {
+    @GetMapping("/")
+    public String hello() {
+        return "Hello, Spring Boot!";
+    }
+}
+"""
+
+# Requirements file with versions
+_REQUIREMENTS_SRC = b"""\
+django==3.2.4
+flask==2.0.1
+pandas==1.3.0
+numpy==1.20.3
+"""
+
+# Package.json file with versions
+_PACKAGE_JSON_SRC = b"""\
+{
+    "name": "my-app",
+    "version": "1.0.0",
+    "dependencies": {
+        "react": "^17.0.2",
+        "react-dom": "^17.0.2",
+        "axios": "^0.21.1"
+    }
+}
+"""
+
+_FILES = (
+    ("django_app.py", _DJANGO_SRC),
+    ("flask_app.py", _FLASK_SRC),
+    ("react_app.js", _REACT_SRC),
+    ("SpringController.java", _SPRING_SRC),
+    ("requirements.txt", _REQUIREMENTS_SRC),
+    ("package.json", _PACKAGE_JSON_SRC),
+)
+
+
+@pytest.fixture(scope="session")
+def detector():
+    """
+    Create a framework detector with real dependencies.
     
-    @pytest.fixture
-    def detector(self):
-        """Create a framework detector with real dependencies."""
-        ai_provider = MockAIProvider()  # Real MockAIProvider, not a mock of a mock
-        
-        # Use real implementations, not mocks
-        file_type_analyzer = FileTypeAnalyzer(ai_provider=ai_provider)
-        code_analyzer = CodeAnalyzer(ai_provider=ai_provider, file_type_analyzer=file_type_analyzer)
-        
-        return FrameworkDetector(
-            ai_provider=ai_provider,
-            code_analyzer=code_analyzer,
-            file_type_analyzer=file_type_analyzer,
-            cache_provider=InMemoryCache()
-        )
+    The detector is shared by all tests, so its cache stays warm across
+    the suite; the tests only call its read-only detection methods.
+    """
+    ai_provider = MockAIProvider()  # Real MockAIProvider, not a mock of a mock
     
-    @pytest.fixture
-    def test_files(self):
-        """Create real test files for different languages with framework usage."""
-        with tempfile.TemporaryDirectory() as tempdir:
-            # Python file with Django
-            django_file = Path(tempdir) / "django_app.py"
-            with open(django_file, "w") as f:
-                f.write("""
-                from django.db import models
-                from django.http import HttpResponse
-                
-                class MyModel(models.Model):
-                    name = models.CharField(max_length=100)
-                    
-                def my_view(request):
-                    return HttpResponse("Hello, Django!")
-                """)
-            
-            # Python file with Flask
-            flask_file = Path(tempdir) / "flask_app.py"
-            with open(flask_file, "w") as f:
-                f.write("""
-                from flask import Flask, render_template
-                
-                app = Flask(__name__)
-                
-                @app.route('/')
-                def index():
-                    return render_template('index.html')
-                """)
-            
-            # JavaScript file with React
-            react_file = Path(tempdir) / "react_app.js"
-            with open(react_file, "w") as f:
-                f.write("""
-                import React, { useState } from 'react';
-                
-                function App() {
-                    const [count, setCount] = useState(0);
-                    
-                    return (
-                        <div>
-                            <h1>Hello, React!</h1>
-                            <button onClick={() => setCount(count + 1)}>
-                                Count: {count}
-                            </button>
-                        </div>
-                    );
-                }
-                
-                export default App;
-                """)
-            
-            # Java file with Spring Boot
-            spring_file = Path(tempdir) / "SpringController.java"
-            with open(spring_file, "w") as f:
-                f.write("""
-                package com.example.demo;
-                
-                import org.springframework.boot.SpringApplication;
-                import org.springframework.boot.autoconfigure.SpringBootApplication;
-                import org.springframework.web.bind.annotation.GetMapping;
-                import org.springframework.web.bind.annotation.RestController;
-                
-                @SpringBootApplication
-                public class DemoApplication {
-                    public static void main(String[] args) {
-                        SpringApplication.run(DemoApplication.class, args);
-                    }
-                }
-                
-                @RestController
-                class HelloController {
-                    @GetMapping("/")
-                    public String hello() {
-                        return "Hello, Spring Boot!";
-                    }
-                }
-                """)
-            
-            # Requirements file with versions
-            requirements_file = Path(tempdir) / "requirements.txt"
-            with open(requirements_file, "w") as f:
-                f.write("""
-                django==3.2.4
-                flask==2.0.1
-                pandas==1.3.0
-                numpy==1.20.3
-                """)
-            
-            # Package.json file with versions
-            package_file = Path(tempdir) / "package.json"
-            with open(package_file, "w") as f:
-                f.write("""
-                {
-                    "name": "my-app",
-                    "version": "1.0.0",
-                    "dependencies": {
-                        "react": "^17.0.2",
-                        "react-dom": "^17.0.2",
-                        "axios": "^0.21.1"
-                    }
-                }
-                """)
-            
-            yield tempdir
+    # Use real implementations, not mocks
+    file_type_analyzer = FileTypeAnalyzer(ai_provider=ai_provider)
+    code_analyzer = CodeAnalyzer(ai_provider=ai_provider, file_type_analyzer=file_type_analyzer)
     
-    def test_detect_frameworks_django(self, detector, test_files):
-        """Integration test for Django framework detection with real files."""
-        django_file = Path(test_files) / "django_app.py"
-        
-        result = detector.detect_frameworks(django_file)
+    return FrameworkDetector(
+        ai_provider=ai_provider,
+        code_analyzer=code_analyzer,
+        file_type_analyzer=file_type_analyzer,
+        cache_provider=InMemoryCache()
+    )
+
+
+@pytest.fixture(scope="session")
+def test_files(tmp_path_factory):
+    """Create real test files for different languages with framework usage."""
+    tempdir = tmp_path_factory.mktemp("fw_integration")
+    for name, body in _FILES:
+        (tempdir / name).write_bytes(body)
+    return tempdir
+
+
+class TestFrameworkDetectorIntegration:
+    """Integration tests for the FrameworkDetector class with real files."""
+    
+    @pytest.mark.parametrize(
+        "filename,framework",
+        [
+            ("django_app.py", "django"),
+            ("flask_app.py", "flask"),
+            ("react_app.js", "react"),
+            ("SpringController.java", "spring"),
+        ],
+        ids=["django", "flask", "react", "spring"]
+    )
+    def test_detect_frameworks(self, detector, test_files, filename, framework):
+        """Integration test for Django, Flask, React and Spring detection with real files."""
+        source_file = Path(test_files) / filename
+        
+        result = detector.detect_frameworks(source_file)
         
         # Check result structure
         assert "file_path" in result
@@ -153,63 +169,11 @@ class TestFrameworkDetectorIntegration:
         assert "frameworks" in result
         assert isinstance(result["frameworks"], list)
         
-        # Check for Django detection
-        django_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "django":
-                django_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
-        
-        assert django_found, "Django framework not detected"
-    
-    def test_detect_frameworks_flask(self, detector, test_files):
-        """Integration test for Flask framework detection with real files."""
-        flask_file = Path(test_files) / "flask_app.py"
-        
-        result = detector.detect_frameworks(flask_file)
-        
-        # Check for Flask detection
-        flask_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "flask":
-                flask_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
-        
-        assert flask_found, "Flask framework not detected"
-    
-    def test_detect_frameworks_react(self, detector, test_files):
-        """Integration test for React framework detection with real files."""
-        react_file = Path(test_files) / "react_app.js"
-        
-        result = detector.detect_frameworks(react_file)
-        
-        # Check for React detection
-        react_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "react":
-                react_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
-        
-        assert react_found, "React framework not detected"
-    
-    def test_detect_frameworks_spring(self, detector, test_files):
-        """Integration test for Spring Boot framework detection with real files."""
-        spring_file = Path(test_files) / "SpringController.java"
-        
-        result = detector.detect_frameworks(spring_file)
-        
-        # Check for Spring detection
-        spring_found = False
-        for framework in result["frameworks"]:
-            if framework["name"].lower() == "spring":
-                spring_found = True
-                assert framework["confidence"] > 0.5
-                assert len(framework["evidence"]) > 0
-        
-        assert spring_found, "Spring framework not detected"
+        # Check that the framework was detected
+        detected = {fw["name"].lower(): fw for fw in result["frameworks"]}
+        assert framework in detected, f"{framework} framework not detected"
+        assert detected[framework]["confidence"] > 0.5
+        assert len(detected[framework]["evidence"]) > 0
     
     def test_extract_version_info(self, detector, test_files):
         """Integration test for version extraction from real requirements.txt."""
@@ -5,15 +5,89 @@ These tests verify that the components work together correctly.
 """
 import tempfile
 import json
-import subprocess
-import sys
+from collections import Counter
+from concurrent.futures import ThreadPoolExecutor
 from pathlib import Path
 import pytest
 
+try:
+    import orjson
+except ImportError:  # pragma: no cover - orjson is optional
+    orjson = None
+
 from file_analyzer.core.file_type_analyzer import FileTypeAnalyzer
 from file_analyzer.core.code_analyzer import CodeAnalyzer
 from file_analyzer.core.cache_provider import InMemoryCache
 from file_analyzer.ai_providers.mock_provider import MockAIProvider
+from file_analyzer.main import main
+
+# File contents for the repository structure tests, encoded once at import
+_COMPLEX_REPO_FILES = {
+    path: content.encode("utf-8") for path, content in {
+        "README.md": "# Project\n\nProject documentation",
+        "LICENSE": "MIT License\n\nCopyright 2023",
+        "setup.py": "from setuptools import setup\n\nsetup(name='project')",
+        "src/core/__init__.py": "",
+        "src/core/main.py": "def main():\n    pass",
+        "src/utils/helpers.py": "def helper():\n    return True",
+        "tests/test_core.py": "def test_main():\n    assert True",
+        "docs/index.md": "# Documentation\n\nUser guide",
+        "config/settings.json": '{"debug": true}',
+        ".gitignore": "*.pyc\n__pycache__/",
+        "requirements.txt": "pytest>=7.0.0\nrequests>=2.28.0"
+    }.items()
+}
+
+_REPORT_REPO_FILES = {
+    path: content.encode("utf-8") for path, content in {
+        "src/app/main.py": "def main():\n    print('Hello')",
+        "src/app/api.py": "def api_call(): return {'status': 'ok'}",
+        "src/utils/helpers.py": "def format_string(s): return s.strip()",
+        "tests/test_main.py": "def test_main(): assert True",
+        "docs/index.md": "# Documentation",
+        "config/settings.json": '{"debug": true}',
+        "config/dev.yaml": "environment: development",
+        ".gitignore": "*.pyc\n__pycache__/",
+        "README.md": "# Project",
+        "requirements.txt": "pytest==7.0.0\nrequests==2.28.0"
+    }.items()
+}
+
+
+@pytest.fixture(scope="class")
+def warm_analyzer():
+    """Create an analyzer whose in-memory cache stays warm for the whole class."""
+    return FileTypeAnalyzer(
+        ai_provider=MockAIProvider(),
+        cache_provider=InMemoryCache()
+    )
+
+
+@pytest.fixture(scope="class")
+def complex_repo():
+    """Create a temporary directory with a realistic project structure."""
+    with tempfile.TemporaryDirectory() as tempdir:
+        root_path = Path(tempdir)
+        
+        # Create various file types across a nested directory structure
+        files = _COMPLEX_REPO_FILES
+        
+        # Create each directory once, then write the files
+        for directory in {(root_path / file_path).parent for file_path in files}:
+            directory.mkdir(parents=True, exist_ok=True)
+        for file_path, content in files.items():
+            (root_path / file_path).write_bytes(content)
+        
+        yield root_path
+
+
+@pytest.fixture(scope="class")
+def complex_repo_results(warm_analyzer, complex_repo):
+    """Analyze the complex repository once, keyed by path relative to the root."""
+    return {
+        file_path: warm_analyzer.analyze_file(complex_repo / file_path)
+        for file_path in _COMPLEX_REPO_FILES
+    }
 
 
 class TestFileAnalyzerIntegration:
@@ -89,7 +163,7 @@ class TestFileAnalyzerIntegration:
             assert md_result["language"] == "markdown"
             assert "text" in md_result["characteristics"]
             
-    def test_caching_between_runs(self):
+    def test_caching_between_runs(self, tmp_path):
         """Test that caching works correctly across multiple runs."""
         # Arrange
         mock_provider = MockAIProvider()
@@ -101,9 +175,8 @@ class TestFileAnalyzerIntegration:
             cache_provider=cache
         )
         
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("def test(): pass")
-            filepath = f.name
+        filepath = tmp_path / "test.py"
+        filepath.write_text("def test(): pass")
         
         # Act - First run
         result1 = analyzer.analyze_file(filepath)
@@ -128,32 +201,23 @@ class TestFileAnalyzerIntegration:
         assert "modified" not in result2
         assert result1 == result2
         
-        # Cleanup
-        Path(filepath).unlink()
-        
-    def test_error_handling_chain(self):
+    def test_error_handling_chain(self, tmp_path):
         """Test that errors propagate correctly through the component chain."""
         # Arrange - Create a file that will be inaccessible
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("def test(): pass")
-            filepath = f.name
+        path = tmp_path / "test.py"
+        path.write_text("def test(): pass")
         
         # Immediately make the file inaccessible
-        path = Path(filepath)
         path.chmod(0)  # Remove all permissions
         
         # Act
         analyzer = FileTypeAnalyzer(ai_provider=MockAIProvider())
-        result = analyzer.analyze_file(filepath)
+        result = analyzer.analyze_file(path)
         
         # Assert
         assert "error" in result
         assert result["file_type"] == "unknown"
         
-        # Cleanup - Restore permissions so we can delete it
-        path.chmod(0o666)
-        path.unlink()
-        
     def test_cli_integration(self):
         """Test the entire system through the CLI interface."""
         # Skip if running in CI without proper permissions
@@ -176,27 +240,22 @@ class TestFileAnalyzerIntegration:
                 # Generate output file path
                 output_file = tempdir_path / "results.json"
                 
-                # Run the CLI with mock provider
-                cmd = [
-                    sys.executable, 
-                    "-m", 
-                    "file_analyzer.main",
+                # Run the CLI in-process with mock provider
+                exit_code = main([
                     str(tempdir_path),
                     "--provider", "mock",
                     "--output", str(output_file)
-                ]
-                
-                result = subprocess.run(cmd, capture_output=True, text=True)
+                ])
                 
                 # Assert command executed successfully
-                assert result.returncode == 0, f"CLI failed with: {result.stderr}"
+                assert exit_code == 0, "CLI reported a failure"
                 
                 # Verify output file exists and contains valid results
                 assert output_file.exists(), "Output file was not created"
                 
                 # Parse the JSON output
-                with open(output_file) as f:
-                    results = json.load(f)
+                output = output_file.read_bytes()
+                results = orjson.loads(output) if orjson else json.loads(output)
                 
                 # Verify all files were analyzed
                 for filename in test_files:
@@ -219,77 +278,56 @@ class TestFileAnalyzerIntegration:
         except PermissionError:
             pytest.skip("Skipping CLI test due to permission issues")
             
-    def test_complex_repository_structure(self):
-        """Test analyzing a complex repository structure with nested directories."""
-        # Arrange
-        analyzer = FileTypeAnalyzer(
-            ai_provider=MockAIProvider(),
-            cache_provider=InMemoryCache()
-        )
+    def test_complex_repository_structure(self, complex_repo_results):
+        """Test that key files in a nested repository structure are identified."""
+        results = complex_repo_results
         
-        # Create a temporary directory with a realistic project structure
-        with tempfile.TemporaryDirectory() as tempdir:
-            root_path = Path(tempdir)
-            
-            # Create a nested directory structure
-            (root_path / "src").mkdir()
-            (root_path / "src" / "core").mkdir()
-            (root_path / "src" / "utils").mkdir()
-            (root_path / "docs").mkdir()
-            (root_path / "tests").mkdir()
-            (root_path / "config").mkdir()
-            
-            # Create various file types across the structure
-            files = {
-                "README.md": "# Project\n\nProject documentation",
-                "LICENSE": "MIT License\n\nCopyright 2023",
-                "setup.py": "from setuptools import setup\n\nsetup(name='project')",
-                "src/core/__init__.py": "",
-                "src/core/main.py": "def main():\n    pass",
-                "src/utils/helpers.py": "def helper():\n    return True",
-                "tests/test_core.py": "def test_main():\n    assert True",
-                "docs/index.md": "# Documentation\n\nUser guide",
-                "config/settings.json": '{"debug": true}',
-                ".gitignore": "*.pyc\n__pycache__/",
-                "requirements.txt": "pytest>=7.0.0\nrequests>=2.28.0"
-            }
-            
-            # Write the files
-            for file_path, content in files.items():
-                full_path = root_path / file_path
-                full_path.parent.mkdir(exist_ok=True)
-                full_path.write_text(content)
-            
-            # Act - Analyze the repository
-            results = {}
-            for file_path_str, _ in files.items():
-                file_path = root_path / file_path_str
-                results[file_path_str] = analyzer.analyze_file(file_path)
-            
-            # Assert - Check key file types are correctly identified
-            assert results["README.md"]["file_type"] == "documentation"
-            assert results["README.md"]["language"] == "markdown"
-            
-            assert results["src/core/main.py"]["file_type"] == "code"
-            assert results["src/core/main.py"]["language"] == "python"
-            
-            assert results["config/settings.json"]["file_type"] == "code"
-            assert results["config/settings.json"]["language"] == "json"
-            
-            assert results["tests/test_core.py"]["file_type"] == "code"
-            assert results["tests/test_core.py"]["language"] == "python"
-            
-            # Count file types to ensure distribution makes sense
-            file_types = [r["file_type"] for r in results.values()]
-            languages = [r["language"] for r in results.values()]
-            
-            # The repository should have a mix of code, documentation and configuration
-            assert file_types.count("code") >= 5
-            assert file_types.count("documentation") >= 2
-            
-            # Python should be the primary language
-            assert languages.count("python") >= 3
+        # Assert - Check key file types are correctly identified
+        assert results["README.md"]["file_type"] == "documentation"
+        assert results["README.md"]["language"] == "markdown"
+        
+        assert results["src/core/main.py"]["file_type"] == "code"
+        assert results["src/core/main.py"]["language"] == "python"
+        
+        assert results["config/settings.json"]["file_type"] == "code"
+        assert results["config/settings.json"]["language"] == "json"
+        
+        assert results["tests/test_core.py"]["file_type"] == "code"
+        assert results["tests/test_core.py"]["language"] == "python"
+    
+    def test_complex_repository_distribution(self, complex_repo_results):
+        """Test the file type and language distribution of a nested repository."""
+        # Count file types and languages in a single pass over the results
+        file_types = Counter()
+        languages = Counter()
+        for result in complex_repo_results.values():
+            file_types[result["file_type"]] += 1
+            languages[result["language"]] += 1
+        
+        # The repository should have a mix of code, documentation and configuration
+        assert file_types["code"] >= 5
+        assert file_types["documentation"] >= 2
+        
+        # Python should be the primary language
+        assert languages["python"] >= 3
             
+    def test_complex_repository_second_pass(self, warm_analyzer, complex_repo, complex_repo_results):
+        """Test that re-analyzing a repository is served from the warm cache."""
+        # Arrange
+        stats_before = warm_analyzer.get_cache_stats()
+        
+        # Act - Analyze every file a second time
+        second_pass = {
+            file_path: warm_analyzer.analyze_file(complex_repo / file_path)
+            for file_path in _COMPLEX_REPO_FILES
+        }
+        
+        # Assert - Same results, all from the cache
+        stats_after = warm_analyzer.get_cache_stats()
+        assert second_pass == complex_repo_results
+        assert stats_after["hit"] - stats_before.get("hit", 0) == len(second_pass)
+        assert stats_after["miss"] == stats_before["miss"]
+        
     def test_analyze_real_project(self):
         """Test analyzing this actual project as a real-world test case."""
         # Arrange
@@ -574,30 +612,18 @@ export { TestClass, testFunc };
                 (root_path / dir_path).mkdir(parents=True, exist_ok=True)
             
             # Create files with different types
-            files = {
-                "src/app/main.py": "def main():\n    print('Hello')",
-                "src/app/api.py": "def api_call(): return {'status': 'ok'}",
-                "src/utils/helpers.py": "def format_string(s): return s.strip()",
-                "tests/test_main.py": "def test_main(): assert True",
-                "docs/index.md": "# Documentation",
-                "config/settings.json": '{"debug": true}',
-                "config/dev.yaml": "environment: development",
-                ".gitignore": "*.pyc\n__pycache__/",
-                "README.md": "# Project",
-                "requirements.txt": "pytest==7.0.0\nrequests==2.28.0"
-            }
+            files = _REPORT_REPO_FILES
+            
+            # Write files concurrently; the directories already exist
+            def write_file(item):
+                file_path, content = item
+                (root_path / file_path).write_bytes(content)
+            
+            with ThreadPoolExecutor(max_workers=8) as executor:
+                list(executor.map(write_file, files.items()))
             
-            # Write files
-            for file_path, content in files.items():
-                full_path = root_path / file_path
-                full_path.parent.mkdir(exist_ok=True, parents=True)
-                full_path.write_text(content)
-            
-            # Act - Analyze all files and generate a report
-            all_results = {}
-            for file_path, _ in files.items():
-                full_path = root_path / file_path
-                all_results[file_path] = analyzer.analyze_file(full_path)
+            # Act - Analyze all files in one batch and generate a report
+            all_results = analyzer.analyze_files(root_path / file_path for file_path in files)
             
             # Create a repository statistics report
             report = {
@@ -4,11 +4,11 @@ Unit tests for the main CLI module.
 import json
 import tempfile
 from pathlib import Path
-from unittest.mock import patch, mock_open, MagicMock
+from unittest.mock import patch, MagicMock
 
 import pytest
 
-from file_analyzer.main import create_analyzer, analyze_path, main
+from file_analyzer.main import create_analyzer, analyze_path, main, write_results
 from file_analyzer.ai_providers.mock_provider import MockAIProvider
 from file_analyzer.utils.exceptions import FileAnalyzerError
 
@@ -68,18 +68,17 @@ class TestCreateAnalyzer:
 class TestAnalyzePath:
     """Tests for the analyze_path function."""
     
-    def test_analyze_single_file(self):
+    def test_analyze_single_file(self, tmp_path):
         """Test analyzing a single file."""
         # Arrange
         mock_provider = MockAIProvider()
         analyzer = create_analyzer("mock")
         
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("def test(): pass")
-            filepath = f.name
+        filepath = tmp_path / "main.py"
+        filepath.write_text("def test(): pass")
         
         # Act
-        results = analyze_path(analyzer, Path(filepath))
+        results = analyze_path(analyzer, filepath)
         
         # Assert
         assert len(results) == 1
@@ -87,9 +86,6 @@ class TestAnalyzePath:
         assert results[str(filepath)]["file_type"] == "code"
         assert results[str(filepath)]["language"] == "python"
         
-        # Cleanup
-        Path(filepath).unlink()
-        
     def test_analyze_directory(self):
         """Test analyzing a directory."""
         # Arrange
@@ -254,11 +250,31 @@ class TestMain:
                 mock_analyze_path.return_value = mock_results
                 
                 with patch("pathlib.Path.mkdir"):
-                    with patch("builtins.open", mock_open()):
-                        with patch("json.dump") as mock_json_dump:
-                            # Act
-                            exit_code = main()
-                            
-                            # Assert
-                            assert exit_code == 0
-                            mock_json_dump.assert_called_once()
\ No newline at end of file
+                    with patch("file_analyzer.main.write_results") as mock_write_results:
+                        # Act
+                        exit_code = main()
+                        
+                        # Assert
+                        assert exit_code == 0
+                        mock_write_results.assert_called_once_with(mock_results, Path("output.json"))
+    
+    @pytest.mark.parametrize("use_orjson", [True, False])
+    def test_write_results(self, tmp_path, use_orjson):
+        """Test that results are written as indented JSON with and without orjson."""
+        # Arrange
+        if use_orjson:
+            pytest.importorskip("orjson")
+        results = {"/repo/main.py": {"file_type": "code", "confidence": 0.9}}
+        output_path = tmp_path / "results.json"
+        
+        # Act
+        if use_orjson:
+            write_results(results, output_path)
+        else:
+            with patch("file_analyzer.main.orjson", None):
+                write_results(results, output_path)
+        
+        # Assert
+        output = output_path.read_text()
+        assert json.loads(output) == results
+        assert output.startswith('{\n  "/repo/main.py": {\n    "file_type"')
\ No newline at end of file
@@ -59,4 +59,17 @@ class TestMockAIProvider:
         # Assert
         assert result["file_type"] == "unknown"
         assert result["language"] == "unknown"
-        assert "text" in result["characteristics"]
\ No newline at end of file
+        assert "text" in result["characteristics"]        
+    def test_analyze_repeated_file(self):
+        """Test that repeated calls for a path return equal but independent results."""
+        # Arrange
+        provider = MockAIProvider()
+        
+        # Act
+        result1 = provider.analyze_content("app.py", "def main(): pass")
+        result1["characteristics"].append("modified")
+        result2 = provider.analyze_content("app.py", "def main(): pass")
+        
+        # Assert - Changing one result does not leak into the memoized lookup
+        assert result2["language"] == "python"
+        assert "modified" not in result2["characteristics"]
@@ -21,7 +21,7 @@ from file_analyzer.core.cache_provider import InMemoryCache
 class TestMistralAPIIntegration:
     """Integration tests for Mistral API."""
     
-    def test_analyze_python_file(self):
+    def test_analyze_python_file(self, tmp_path):
         """Test real API call with a Python file."""
         # Get the API key from environment variable
         api_key = os.environ.get('MISTRAL_API_KEY')
@@ -33,8 +33,8 @@ class TestMistralAPIIntegration:
         )
         
         # Create a Python test file
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("""
+        filepath = tmp_path / "hello.py"
+        filepath.write_text("""
             def hello_world():
                 \"\"\"Say hello to the world.\"\"\"
                 return "Hello, World!"
@@ -46,30 +46,24 @@ class TestMistralAPIIntegration:
                 def greet(self):
                     return f"Hello, {self.name}!"
             """)
-            filepath = f.name
         
-        try:
-            # Act
-            result = analyzer.analyze_file(filepath)
-            
-            # Assert
-            assert result["file_type"].lower() in ["code", "source", "source code"]
-            assert result["language"].lower() == "python"
-            assert "confidence" in result
-            # Important characteristics that should be detected
-            characteristics = [c.lower() for c in result.get("characteristics", [])]
-            assert any("class" in c for c in characteristics) or any("function" in c for c in characteristics)
-            
-            # Print the result for inspection 
-            print("\nMistral API Result for Python file:")
-            for key, value in result.items():
-                print(f"{key}: {value}")
-                
-        finally:
-            # Clean up
-            Path(filepath).unlink(missing_ok=True)
+        # Act
+        result = analyzer.analyze_file(filepath)
+        
+        # Assert
+        assert result["file_type"].lower() in ["code", "source", "source code"]
+        assert result["language"].lower() == "python"
+        assert "confidence" in result
+        # Important characteristics that should be detected
+        characteristics = [c.lower() for c in result.get("characteristics", [])]
+        assert any("class" in c for c in characteristics) or any("function" in c for c in characteristics)
+        
+        # Print the result for inspection 
+        print("\nMistral API Result for Python file:")
+        for key, value in result.items():
+            print(f"{key}: {value}")
     
-    def test_analyze_json_file(self):
+    def test_analyze_json_file(self, tmp_path):
         """Test real API call with a JSON file."""
         # Get the API key from environment variable
         api_key = os.environ.get('MISTRAL_API_KEY')
@@ -81,8 +75,8 @@ class TestMistralAPIIntegration:
         )
         
         # Create a JSON test file
-        with tempfile.NamedTemporaryFile(suffix='.json', mode='w', delete=False) as f:
-            f.write("""
+        filepath = tmp_path / "package.json"
+        filepath.write_text("""
             {
                 "name": "test-project",
                 "version": "1.0.0",
@@ -97,26 +91,20 @@ class TestMistralAPIIntegration:
                 }
             }
             """)
-            filepath = f.name
         
-        try:
-            # Act
-            result = analyzer.analyze_file(filepath)
-            
-            # Assert
-            assert result["language"].lower() == "json"
-            assert "confidence" in result
-            
-            # Print the result for inspection
-            print("\nMistral API Result for JSON file:")
-            for key, value in result.items():
-                print(f"{key}: {value}")
-                
-        finally:
-            # Clean up
-            Path(filepath).unlink(missing_ok=True)
+        # Act
+        result = analyzer.analyze_file(filepath)
+        
+        # Assert
+        assert result["language"].lower() == "json"
+        assert "confidence" in result
+        
+        # Print the result for inspection
+        print("\nMistral API Result for JSON file:")
+        for key, value in result.items():
+            print(f"{key}: {value}")
             
-    def test_analyze_markdown_file(self):
+    def test_analyze_markdown_file(self, tmp_path):
         """Test real API call with a Markdown file."""
         # Get the API key from environment variable
         api_key = os.environ.get('MISTRAL_API_KEY')
@@ -128,8 +116,8 @@ class TestMistralAPIIntegration:
         )
         
         # Create a Markdown test file
-        with tempfile.NamedTemporaryFile(suffix='.md', mode='w', delete=False) as f:
-            f.write("""
+        filepath = tmp_path / "README.md"
+        filepath.write_text("""
             # Project Documentation
             
             ## Overview
@@ -153,25 +141,19 @@ class TestMistralAPIIntegration:
             - [Link 1](https://example.com)
             - [Link 2](https://test.com)
             """)
-            filepath = f.name
         
-        try:
-            # Act
-            result = analyzer.analyze_file(filepath)
-            
-            # Assert
-            assert result["language"].lower() in ["markdown", "md"]
-            assert "file_type" in result
-            assert "confidence" in result
-            
-            # Print the result for inspection
-            print("\nMistral API Result for Markdown file:")
-            for key, value in result.items():
-                print(f"{key}: {value}")
-                
-        finally:
-            # Clean up
-            Path(filepath).unlink(missing_ok=True)
+        # Act
+        result = analyzer.analyze_file(filepath)
+        
+        # Assert
+        assert result["language"].lower() in ["markdown", "md"]
+        assert "file_type" in result
+        assert "confidence" in result
+        
+        # Print the result for inspection
+        print("\nMistral API Result for Markdown file:")
+        for key, value in result.items():
+            print(f"{key}: {value}")
             
     def test_cli_with_real_api(self):
         """Test the CLI interface with real API."""
@@ -239,7 +221,7 @@ class TestMistralAPIIntegration:
             except subprocess.SubprocessError as e:
                 pytest.fail(f"CLI execution failed: {str(e)}")
                 
-    def test_code_analyzer_with_mistral(self):
+    def test_code_analyzer_with_mistral(self, tmp_path):
         """Test CodeAnalyzer with Mistral API."""
         # Get the API key from environment variable
         api_key = os.environ.get('MISTRAL_API_KEY')
@@ -252,8 +234,8 @@ class TestMistralAPIIntegration:
         )
         
         # Create a Python test file
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("""
+        filepath = tmp_path / "processor.py"
+        filepath.write_text("""
             import os
             import sys
             from pathlib import Path
@@ -281,95 +263,89 @@ class TestMistralAPIIntegration:
                         'extension': file_path.suffix
                     }
             """)
-            filepath = f.name
         
-        try:
-            # Act
-            result = analyzer.analyze_code(filepath)
-            
-            # Assert
-            assert result["language"] == "python"
-            assert result["supported"] is True
-            assert "file_type_analysis" in result
-            assert "code_structure" in result
-            
-            # Check that we got reasonable code structure and print the entire result
-            import json
-            print("\n======== FULL MISTRAL API RESPONSE ========")
-            print(json.dumps(result, indent=2, default=str))
-            
-            structure = result["code_structure"]["structure"]
-            print("\n======== STRUCTURE ========")
-            print(json.dumps(structure, indent=2, default=str))
-            
-            assert "imports" in structure
-            assert "classes" in structure
-            assert "functions" in structure
-            
-            # Verify imports - adjust based on actual format from Mistral
-            imports = structure["imports"] 
-            print("\n======== IMPORTS ========")
-            print(f"Type: {type(imports)}")
-            print(f"Value: {imports}")
-            
-            # More flexible assertions that work with different response formats
-            if isinstance(imports, list):
-                if len(imports) > 0 and isinstance(imports[0], dict):
-                    assert any("os" in str(imp.get("name", "")) or "os" in str(imp.get("module", "")) for imp in imports)
-                    assert any("sys" in str(imp.get("name", "")) or "sys" in str(imp.get("module", "")) for imp in imports)
-                    assert any("pathlib" in str(imp.get("name", "")) or "pathlib" in str(imp.get("path", "")) for imp in imports)
-                else:
-                    assert any("os" in str(imp) for imp in imports)
-                    assert any("sys" in str(imp) for imp in imports)
-                    assert any("pathlib" in str(imp) for imp in imports)
-            elif isinstance(imports, str):
-                assert "os" in imports
-                assert "sys" in imports 
-                assert "pathlib" in imports
-            
-            # Check function was detected
-            functions = structure["functions"]
-            assert any(func["name"] == "get_files" for func in functions)
-            
-            # Check class was detected
-            classes = structure["classes"]
-            assert any(cls["name"] == "FileProcessor" for cls in classes)
-            
-            # Print detailed results for inspection
-            import json
-            print("\n======== REAL MISTRAL API CODE ANALYSIS RESULT ========")
-            print(f"Language: {result['language']}")
-            print(f"File path: {result['file_path']}")
-            print(f"Supported: {result['supported']}")
-            print(f"Confidence: {result.get('confidence')}")
-            
-            print("\nImports detected:")
-            for imp in structure.get('imports', []):
-                print(f"  - {imp}")
-            
-            print("\nFunctions detected:")
-            for func in structure.get('functions', []):
-                params = ", ".join(func.get('parameters', []))
-                doc = func.get('documentation', '')[:50] + "..." if func.get('documentation', '') else "None"
-                print(f"  - {func.get('name')}({params}) - Doc: {doc}")
-            
-            print("\nClasses detected:")
-            for cls in structure.get('classes', []):
-                methods = ", ".join(cls.get('methods', []))
-                props = ", ".join(cls.get('properties', []))
-                doc = cls.get('documentation', '')[:50] + "..." if cls.get('documentation', '') else "None"
-                print(f"  - {cls.get('name')} - Methods: [{methods}], Props: [{props}]")
-                print(f"    Doc: {doc}")
-                
-            print("\nRaw API Response Sample (truncated):")
-            raw_json = json.dumps(result["code_structure"], indent=2)
-            print(raw_json[:1000] + "..." if len(raw_json) > 1000 else raw_json)
-            
-        finally:
-            # Clean up
-            Path(filepath).unlink(missing_ok=True)
-            
-    def test_framework_detector_with_mistral(self):
+        # Act
+        result = analyzer.analyze_code(filepath)
+        
+        # Assert
+        assert result["language"] == "python"
+        assert result["supported"] is True
+        assert "file_type_analysis" in result
+        assert "code_structure" in result
+        
+        # Check that we got reasonable code structure and print the entire result
+        import json
+        print("\n======== FULL MISTRAL API RESPONSE ========")
+        print(json.dumps(result, indent=2, default=str))
+        
+        structure = result["code_structure"]["structure"]
+        print("\n======== STRUCTURE ========")
+        print(json.dumps(structure, indent=2, default=str))
+        
+        assert "imports" in structure
+        assert "classes" in structure
+        assert "functions" in structure
+        
+        # Verify imports - adjust based on actual format from Mistral
+        imports = structure["imports"] 
+        print("\n======== IMPORTS ========")
+        print(f"Type: {type(imports)}")
+        print(f"Value: {imports}")
+        
+        # More flexible assertions that work with different response formats
+        if isinstance(imports, list):
+            if len(imports) > 0 and isinstance(imports[0], dict):
+                assert any("os" in str(imp.get("name", "")) or "os" in str(imp.get("module", "")) for imp in imports)
+                assert any("sys" in str(imp.get("name", "")) or "sys" in str(imp.get("module", "")) for imp in imports)
+                assert any("pathlib" in str(imp.get("name", "")) or "pathlib" in str(imp.get("path", "")) for imp in imports)
+            else:
+                assert any("os" in str(imp) for imp in imports)
+                assert any("sys" in str(imp) for imp in imports)
+                assert any("pathlib" in str(imp) for imp in imports)
+        elif isinstance(imports, str):
+            assert "os" in imports
+            assert "sys" in imports 
+            assert "pathlib" in imports
+        
+        # Check function was detected
+        functions = structure["functions"]
+        assert any(func["name"] == "get_files" for func in functions)
+        
+        # Check class was detected
+        classes = structure["classes"]
+        assert any(cls["name"] == "FileProcessor" for cls in classes)
+        
+        # Print detailed results for inspection
+        import json
+        print("\n======== REAL MISTRAL API CODE ANALYSIS RESULT ========")
+        print(f"Language: {result['language']}")
+        print(f"File path: {result['file_path']}")
+        print(f"Supported: {result['supported']}")
+        print(f"Confidence: {result.get('confidence')}")
+        
+        print("\nImports detected:")
+        for imp in structure.get('imports', []):
+            print(f"  - {imp}")
+        
+        print("\nFunctions detected:")
+        for func in structure.get('functions', []):
+            params = ", ".join(func.get('parameters', []))
+            doc = func.get('documentation', '')[:50] + "..." if func.get('documentation', '') else "None"
+            print(f"  - {func.get('name')}({params}) - Doc: {doc}")
+        
+        print("\nClasses detected:")
+        for cls in structure.get('classes', []):
+            methods = ", ".join(cls.get('methods', []))
+            props = ", ".join(cls.get('properties', []))
+            doc = cls.get('documentation', '')[:50] + "..." if cls.get('documentation', '') else "None"
+            print(f"  - {cls.get('name')} - Methods: [{methods}], Props: [{props}]")
+            print(f"    Doc: {doc}")
+            
+        print("\nRaw API Response Sample (truncated):")
+        raw_json = json.dumps(result["code_structure"], indent=2)
+        print(raw_json[:1000] + "..." if len(raw_json) > 1000 else raw_json)
+            
+    def test_framework_detector_with_mistral(self, tmp_path):
         """Test framework detection with real Mistral API."""
         # Get the API key from environment variable
         api_key = os.environ.get('MISTRAL_API_KEY')
@@ -383,8 +359,8 @@ class TestMistralAPIIntegration:
         framework_detector = FrameworkDetector(ai_provider=ai_provider, code_analyzer=code_analyzer, cache_provider=InMemoryCache())
         
         # Create a Python test file with Django imports
-        with tempfile.NamedTemporaryFile(suffix='.py', mode='w', delete=False) as f:
-            f.write("""
+        django_file = tmp_path / "models.py"
+        django_file.write_text("""
             from django.db import models
             from django.http import HttpResponse
             
@@ -400,11 +376,10 @@ class TestMistralAPIIntegration:
                 models = TestModel.objects.all()
                 return HttpResponse("Hello, Django!")
             """)
-            django_file = f.name
         
         # Create a JavaScript file with React imports
-        with tempfile.NamedTemporaryFile(suffix='.jsx', mode='w', delete=False) as f:
-            f.write("""
+        react_file = tmp_path / "UserProfile.jsx"
+        react_file.write_text("""
             import React, { useState, useEffect } from 'react';
             import { useHistory } from 'react-router-dom';
             
@@ -442,53 +417,46 @@ class TestMistralAPIIntegration:
             
             export default UserProfile;
             """)
-            react_file = f.name
         
-        try:
-            # Analyze Django file
-            django_result = framework_detector.detect_frameworks(django_file)
-            
-            print("\nFramework detection result for Django file:", django_result)
-            
-            # Basic validation
-            assert "file_path" in django_result
-            assert "language" in django_result
-            assert "frameworks" in django_result
-            assert isinstance(django_result["frameworks"], list)
-            
-            # Should detect Django
-            django_found = False
-            for framework in django_result["frameworks"]:
-                if framework["name"].lower() == "django":
-                    django_found = True
-                    break
-            
-            # We may not strict assert here as AI could be uncertain in some cases,
-            # but we can print diagnostic information
-            if not django_found:
-                print("\nWARNING: Django not detected in file that should contain Django references")
-                print("Frameworks detected:", [f["name"] for f in django_result["frameworks"]])
-            
-            # Test React detection
-            react_result = framework_detector.detect_frameworks(react_file)
-            
-            print("\nReact detection result:", react_result)
-            
-            # Basic validation
-            assert "file_path" in react_result
-            assert "frameworks" in react_result
-            
-            react_found = False
-            for framework in react_result["frameworks"]:
-                if framework["name"].lower() == "react":
-                    react_found = True
-                    break
-            
-            if not react_found:
-                print("\nWARNING: React not detected in file that should contain React references")
-                print("Frameworks detected:", [f["name"] for f in react_result["frameworks"]])
-                
-        finally:
-            # Clean up
-            Path(django_file).unlink(missing_ok=True)
-            Path(react_file).unlink(missing_ok=True)
\ No newline at end of file
+        # Analyze Django file
+        django_result = framework_detector.detect_frameworks(django_file)
+        
+        print("\nFramework detection result for Django file:", django_result)
+        
+        # Basic validation
+        assert "file_path" in django_result
+        assert "language" in django_result
+        assert "frameworks" in django_result
+        assert isinstance(django_result["frameworks"], list)
+        
+        # Should detect Django
+        django_found = False
+        for framework in django_result["frameworks"]:
+            if framework["name"].lower() == "django":
+                django_found = True
+                break
+        
+        # We may not strict assert here as AI could be uncertain in some cases,
+        # but we can print diagnostic information
+        if not django_found:
+            print("\nWARNING: Django not detected in file that should contain Django references")
+            print("Frameworks detected:", [f["name"] for f in django_result["frameworks"]])
+        
+        # Test React detection
+        react_result = framework_detector.detect_frameworks(react_file)
+        
+        print("\nReact detection result:", react_result)
+        
+        # Basic validation
+        assert "file_path" in react_result
+        assert "frameworks" in react_result
+        
+        react_found = False
+        for framework in react_result["frameworks"]:
+            if framework["name"].lower() == "react":
+                react_found = True
+                break
+        
+        if not react_found:
+            print("\nWARNING: React not detected in file that should contain React references")
+            print("Frameworks detected:", [f["name"] for f in react_result["frameworks"]])
\ No newline at end of file
@@ -1,7 +1,9 @@
 """
 Unit tests for the RepositoryScanner class.
 """
+import fnmatch
 import os
+import re
 import tempfile
 from pathlib import Path
 import pytest
@@ -14,16 +16,90 @@ from file_analyzer.repo_scanner import RepositoryScanner
 from file_analyzer.utils.exceptions import FileAnalyzerError
 
 
+@pytest.fixture(scope="class")
+def analyzer():
+    """Create a file type analyzer with a mock provider, shared by the class."""
+    return FileTypeAnalyzer(
+        ai_provider=MockAIProvider(),
+        cache_provider=InMemoryCache()
+    )
+
+
+# Repository sizes for the large repository scan; the bigger ones only run
+# when RUN_PERF_TESTS is set
+_LARGE_REPO_SIZES = [
+    50,
+    *(
+        pytest.param(
+            size,
+            marks=pytest.mark.skipif(
+                not os.environ.get("RUN_PERF_TESTS"),
+                reason="RUN_PERF_TESTS environment variable not set"
+            )
+        )
+        for size in (500, 5000)
+    )
+]
+
+
+def _write_if_changed(file_path: str, content: bytes) -> None:
+    """Write a file unless it already holds exactly this content."""
+    try:
+        if os.stat(file_path).st_size == len(content):
+            with open(file_path, "rb") as f:
+                if f.read() == content:
+                    return
+    except FileNotFoundError:
+        pass
+    with open(file_path, "wb") as f:
+        f.write(content)
+
+
+@pytest.fixture(scope="session")
+def large_repo_factory(tmp_path_factory):
+    """
+    Return a factory that creates (once per size) a repository with N files.
+    
+    When PERSIST_TMP is set, repositories are kept under that directory and
+    reused by later runs, rewriting only files whose content differs.
+    """
+    persist_root = os.environ.get("PERSIST_TMP")
+    repos = {}
+    
+    def make_repo(file_count: int) -> Path:
+        if file_count not in repos:
+            if persist_root:
+                repo_path = Path(persist_root) / f"large_repo_{file_count}"
+            else:
+                repo_path = tmp_path_factory.mktemp(f"large_repo_{file_count}")
+            # Plain string paths keep the per-file bookkeeping cheap
+            package_dirs = [os.path.join(repo_path, f"pkg{package}") for package in range(10)]
+            for package_dir in package_dirs:
+                os.makedirs(package_dir, exist_ok=True)
+            for i in range(file_count):
+                if i % 5 == 0:
+                    file_name = f"notes{i}.md"
+                    content = f"# Notes {i}"
+                else:
+                    file_name = f"module{i}.py"
+                    content = f"def function_{i}():\n    return {i}"
+                _write_if_changed(
+                    os.path.join(package_dirs[i % 10], file_name), content.encode("utf-8")
+                )
+            repos[file_count] = repo_path
+        return repos[file_count]
+    
+    return make_repo
+
+
 class TestRepositoryScanner:
     """Unit tests for the RepositoryScanner class."""
     
-    @pytest.fixture
-    def analyzer(self):
-        """Create a file type analyzer with a mock provider."""
-        return FileTypeAnalyzer(
-            ai_provider=MockAIProvider(),
-            cache_provider=InMemoryCache()
-        )
+    @pytest.fixture(autouse=True)
+    def reset_analyzer_cache(self, analyzer):
+        """Start every test with an empty analyzer cache."""
+        analyzer.cache_provider.clear()
+        analyzer.cache_stats = {"enabled": True}
     
     @pytest.fixture
     def scanner(self, analyzer):
@@ -126,6 +202,25 @@ class TestRepositoryScanner:
             assert not any(".git/" in p or "/.git/" in p for p in paths)
             assert not any("node_modules/" in p or "/node_modules/" in p for p in paths)
     
+    def test_precompiled_exclusions(self, analyzer):
+        """Test that exclusions can be given as precompiled regexes."""
+        # Arrange
+        patterns = ["*.log", "tests"]
+        scanner = RepositoryScanner(
+            analyzer=analyzer,
+            exclusions=[re.compile(fnmatch.translate(p)) for p in patterns]
+        )
+        
+        # Act & Assert - Regexes apply to file and directory names
+        assert scanner._is_excluded_file(Path("app/debug.log"))
+        assert not scanner._is_excluded_file(Path("app/main.py"))
+        assert scanner._is_excluded_dir("tests")
+        assert not scanner._is_excluded_dir("src")
+        
+        # Default string exclusions still apply
+        assert scanner._is_excluded_file(Path("app/logo.png"))
+        assert scanner._is_excluded_dir(".git")
+    
     def test_filter_files(self, scanner):
         """Test file filtering and prioritization."""
         # Arrange
@@ -273,6 +368,23 @@ class TestRepositoryScanner:
             assert "python" in stats["languages"] or "Python" in stats["languages"]
             assert "markdown" in stats["languages"] or "Markdown" in stats["languages"]
             
+    @pytest.mark.perf
+    @pytest.mark.parametrize("file_count", _LARGE_REPO_SIZES)
+    def test_large_repository_scan(self, scanner, large_repo_factory, file_count):
+        """Test scanning a repository with many files."""
+        # Arrange
+        repo_path = large_repo_factory(file_count)
+        
+        # Act
+        result = scanner.scan_repository(repo_path)
+        
+        # Assert
+        stats = result["statistics"]
+        assert stats["total_files"] == file_count
+        assert stats["analyzed_files"] == file_count
+        assert stats["error_files"] == 0
+        assert len(result["analysis_results"]) == file_count
+        
     def test_scan_repository_nonexistent_path(self, scanner):
         """Test scanning a nonexistent repository path."""
         # Arrange
@@ -182,8 +182,8 @@ class TestRepoScannerCLI:
     @patch("file_analyzer.repo_scanner_cli.create_analyzer")
     @patch("file_analyzer.repo_scanner_cli.RepositoryScanner")
     @patch("argparse.ArgumentParser.parse_args")
-    @patch("asyncio.get_event_loop")
-    def test_main_with_async(self, mock_get_loop, mock_parse_args, mock_scanner_class, mock_create_analyzer):
+    @patch("asyncio.run")
+    def test_main_with_async(self, mock_asyncio_run, mock_parse_args, mock_scanner_class, mock_create_analyzer):
         """Test using asynchronous processing."""
         # Arrange
         mock_args = mock_parse_args.return_value
@@ -205,10 +205,6 @@ class TestRepoScannerCLI:
         mock_create_analyzer.return_value = mock_analyzer
         mock_scanner_class.return_value = mock_scanner
         
-        # Mock event loop
-        mock_loop = MagicMock()
-        mock_get_loop.return_value = mock_loop
-        
         # Mock scanner result
         mock_result = {
             "repository": "/path/to/repo",
@@ -223,7 +219,7 @@ class TestRepoScannerCLI:
                 "file_types": {"code": 5, "documentation": 3}
             }
         }
-        mock_loop.run_until_complete.return_value = mock_result
+        mock_asyncio_run.return_value = mock_result
         
         # Act
         with patch("pathlib.Path.exists", return_value=True):
@@ -233,4 +229,4 @@ class TestRepoScannerCLI:
         # Assert
         assert exit_code == 0
         mock_scanner.scan_repository_async.assert_called_once()
-        mock_loop.run_until_complete.assert_called_once()
\ No newline at end of file
+        mock_asyncio_run.assert_called_once_with(mock_scanner.scan_repository_async.return_value)
\ No newline at end of file